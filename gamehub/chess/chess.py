@@ -4,7 +4,13 @@ from curses import wrapper
 from curses.textpad import rectangle
 
 from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_bitboard import ChessBitboard
 from gamehub.chess.chess_engine import ChessEngine
+from gamehub.chess.chess_engine_pool import ChessEnginePool
+from gamehub.chess.chess_move_cache import ChessMoveCache
+from gamehub.chess.chess_opening_book import ChessOpeningBook
+from gamehub.chess.chess_search import ChessSearch
+from gamehub.chess.chess_search_limits import ChessSearchLimits
 from gamehub.chess.chess_piece import ChessPiece
 
 class Chess:
@@ -13,16 +19,36 @@ class Chess:
 
     Attributes:
     - mode: The mode of the game (Singleplayer or Multiplayer)
+    - engine: The chess engine used in Singleplayer mode (Stockfish or Builtin)
+    - hash_size: The size in MB of the hash table (transposition table) of the engine
+    - limits: The limits of the searches of the engine (ChessSearchLimits), with the clocks of the players if they are set
+    - workers: The number of processes of the Builtin engine (the root moves are split between them)
+    - pool_size: The number of Stockfish engines of the pool shared by the games of the process
+    - move_cache: The cache of the moves of the engine (ChessMoveCache), consulted before every search
+    - opening_book: The opening book (ChessOpeningBook) consulted before the engine, None if it is not used
     - board: The ChessBoard object
     - players: The list of players (White and Black)
     - current_player: The player that has to move
-    - turn: The current turn number
+    - turn: The current turn number (the fullMoveCounter of the board)
     - check: True if the current player is in check
     - checkmate: True if the current player is in checkmate
     - stalemate: True if a stalemate occurred
+    - draw: The reason of the draw ("threefold repetition" or "fifty-move rule"), None if the game is not drawn
+    - engine_info: The last info (depth, score, nodes, nps, pv) sent by the engine while thinking
+    - engine_stats: The nodes and the time in seconds used by the engine for its last move, None before its first move
+    - move_start_time: The time when the current player started to think (to update its clock)
+    - legal_move_table: The legal moves of the current player keyed by the position of the piece, computed once per position
+    - legal_move_table_key: The Zobrist key of the position of legal_move_table
     """
-    def __init__(self, mode : str = "Multiplayer", fen : str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"): # Castling disabled by default (when implemented, change to "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    def __init__(self, mode : str = "Multiplayer", fen : str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", engine : str = "Stockfish", hash_size : int = 128, limits : ChessSearchLimits = None, workers : int = 1, pool_size : int = 2, move_cache : ChessMoveCache = None, use_opening_book : bool = True):
         self.mode = mode
+        self.engine = engine
+        self.hash_size = hash_size
+        self.limits = limits if limits is not None else ChessSearchLimits()
+        self.workers = workers
+        self.pool_size = pool_size
+        self.move_cache = move_cache if move_cache is not None else ChessMoveCache.shared()
+        self.opening_book = ChessOpeningBook.shared() if use_opening_book else None
         self.board = ChessBoard(fen = fen) 
         self.players = ["w", "b"]
         if self.board.playerToMove == "w":
@@ -30,70 +56,223 @@ class Chess:
         else:
             self.current_player = self.players[1]
         self.turn = self.board.fullMoveCounter
+        self.legal_move_table = None
+        self.legal_move_table_key = None
+        self.draw = None
         self.check, self.checkmate, self.stalemate = self.detect_check_checkmate_stalemate()
+        self.engine_info = None
+        self.engine_stats = None
+        self.move_start_time = time.perf_counter()
 
-    def move_piece(self, start : tuple[int, int], end :tuple[int, int]) -> None:
+    def move_piece(self, start : tuple[int, int], end :tuple[int, int], promotion : str = None) -> None:
         """
         Move a piece from the start position to the end position.
-        Update the board, the current player, the turn number and the fullMoveCounter.
+        Update the board, the current player, the turn number and the clock of the player (if any).
+        The castlings, the en passant captures the promotions and the move counters are applied by ChessBoard.make_move,
+        so the board does not need to be scanned after the move.
         IMPORTANT: The move is not checked for legality.
 
         Parameters:
         - start: The starting position of the piece (x, y)
         - end: The ending position of the piece (x, y)
+        - promotion: The character of the piece a pawn is promoted to (a queen if None)
         """
-        piece_to_move = self.board.matrix[start[1]][start[0]]
-        piece_to_move.position = end
-        self.board.matrix[end[1]][end[0]] = self.board.matrix[start[1]][start[0]]
-        self.board.matrix[start[1]][start[0]] = None
-        self.current_player = self.players[(self.turn) % 2]
-        self.turn += 1
-        self.board.playerToMove = self.current_player
-        self.board.fullMoveCounter = self.turn
+        if self.limits.has_clock():
+            now = time.perf_counter()
+            self.limits.update_clock(self.current_player, now - self.move_start_time)
+            self.move_start_time = now
+        self.board.make_move(start, end, promotion)
+        self.current_player = self.board.playerToMove
+        self.turn = self.board.fullMoveCounter
             
+    def get_legal_move_table(self) -> dict[tuple[int, int], list[tuple[int, int]]]:
+        """
+        Return the legal moves of the current player keyed by the position of the piece.
+        The table is computed once per position and shared by the move selection, the highlighting and the end of game detection.
+
+        Return:
+        - dict[tuple[int, int], list[tuple[int, int]]] -> The legal moves (x, y) of every piece of the current player
+        """
+        if self.legal_move_table is None or self.legal_move_table_key != self.board.zobristKey:
+            self.legal_move_table = ChessBitboard(self.board).legal_move_table(self.current_player)
+            self.legal_move_table_key = self.board.zobristKey
+        return self.legal_move_table
+
+    def get_legal_moves(self, position : tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Return the legal moves of the piece of the current player in the given position.
+
+        Return:
+        - list[tuple[int, int]] -> The legal moves (empty if there is no piece of the current player in the position)
+        """
+        return self.get_legal_move_table().get(position, [])
+
+    def has_any_legal_move(self) -> bool:
+        """
+        Check if the current player has at least one legal move.
+        The legal move table is used if it has already been computed for the position,
+        otherwise the search stops at the first legal move found.
+        """
+        if self.legal_move_table is not None and self.legal_move_table_key == self.board.zobristKey:
+            return any(self.legal_move_table.values())
+        return ChessBitboard(self.board).has_any_legal_move(self.current_player)
+
     def get_all_possible_moves_count(self) -> int: 
         """
-        Count all the possible moves of the current player.
+        Count all the possible moves of the current player (useful for statistics, has_any_legal_move is faster to detect the end of the game).
+        A pawn move to the last rank counts as four moves (one per promotion), as in ChessBoard.get_legal_moves.
 
         Return:
         - int -> The number of all possible moves
         """
-        all_possible_moves_count = 0
-        for i in range(8):
-            for j in range(8):
-                if self.board.matrix[i][j] is not None and self.board.matrix[i][j].color == self.current_player:
-                    all_possible_moves_count = all_possible_moves_count + len(self.board.matrix[i][j].legal_moves(self.board.matrix))
-        return all_possible_moves_count
+        last_row = 0 if self.current_player == "w" else 7
+        count = 0
+        for (x, y), moves in self.get_legal_move_table().items():
+            if self.board.matrix[y][x].piece == "Pawn":
+                count += sum(4 if end[1] == last_row else 1 for end in moves)
+            else:
+                count += len(moves)
+        return count
     
     def detect_check_checkmate_stalemate(self) -> tuple[bool, bool, bool]:
         """
         Detect if the current player is in check, checkmate or a stalemate occurred.
+        The draws by threefold repetition and by the fifty-move rule are stored in draw
+        (the board keeps the position counts and the half move counter, so they are detected in constant time).
 
         Return:
         - tuple[bool, bool, bool] -> (check, checkmate, stalemate)
         """
         check, checkmate, stalemate = False, False, False
-        matrix = self.board.matrix
-        king_position = self.board.detect_king_coordinates(self.current_player)
-        if matrix[king_position[1]][king_position[0]].king_under_attack(matrix):
+        if self.board.king_under_attack(self.current_player):
             check = True
-            if self.get_all_possible_moves_count() == 0:
+            if not self.has_any_legal_move():
                 checkmate = True
         else:
-            if self.get_all_possible_moves_count() == 0:
+            if not self.has_any_legal_move():
                 stalemate = True
 
+        self.draw = None
+        if not checkmate and not stalemate:
+            if self.board.is_threefold_repetition():
+                self.draw = "threefold repetition"
+            elif self.board.is_fifty_move_rule():
+                self.draw = "fifty-move rule"
         return check, checkmate, stalemate
     
     def detect_promotion_and_promote(self) -> None:
         """
-        Detect if a pawn reached the last rank and promote it to a queen.
+        Detect if a pawn is in the last rank and promote it to a queen.
+        The moves are promoted by move_piece, this is only needed for boards loaded with a pawn in the last rank.
         """
         for i in range(8):
             if self.board.matrix[0][i] is not None and self.board.matrix[0][i].color == "w" and self.board.matrix[0][i].piece_char == "P":
-                self.board.matrix[0][i] = ChessPiece("Q", (i, 0))
+                self.board.set_piece((i, 0), ChessPiece("Q", (i, 0)))
             if self.board.matrix[7][i] is not None and self.board.matrix[7][i].color == "b" and self.board.matrix[7][i].piece_char == "p":
-                self.board.matrix[7][i] = ChessPiece("q", (i, 7))
+                self.board.set_piece((i, 7), ChessPiece("q", (i, 7)))
+
+    def create_engine(self) -> object:
+        """
+        Create the chess engine used in Singleplayer mode.
+
+        Return:
+        - ChessSearch if the engine is Builtin (in-process), ChessEngine (Stockfish) otherwise
+        """
+        if self.engine == "Builtin":
+            return ChessSearch(hash_size=self.hash_size, workers=self.workers)
+        return ChessEngine(self.hash_size)
+
+    def checkout_engine(self) -> object:
+        """
+        Get the chess engine for a Singleplayer game.
+        Stockfish engines are taken from the pool shared by the process, so they are already running.
+
+        Return:
+        - The engine, that must be given back with release_engine
+        """
+        if self.engine == "Stockfish":
+            return ChessEnginePool.shared(self.pool_size, self.hash_size).checkout()
+        return self.create_engine()
+
+    def release_engine(self, engine : object) -> None:
+        """
+        Give back the engine taken with checkout_engine at the end of the game.
+        """
+        if self.engine == "Stockfish":
+            ChessEnginePool.shared(self.pool_size, self.hash_size).release(engine)
+        else:
+            engine.close()
+
+    def set_engine_info(self, info : dict) -> None:
+        """
+        Store the info sent by the engine while thinking (called from the thread of the search).
+        """
+        self.engine_info = info
+
+    def draw_engine_info(self, window) -> None:
+        """
+        Draw the last info of the engine (depth, score, nodes per second and principal variation) under the debug messages.
+        """
+        info = self.engine_info
+        if info is None:
+            text = "Engine: thinking..."
+        else:
+            if "score_mate" in info:
+                score = "mate " + str(info["score_mate"])
+            else:
+                score = str(info.get("score_cp", 0) / 100)
+            text = ("Engine: depth " + str(info.get("depth", 0)) + " score " + score +
+                    " nps " + str(info.get("nps", 0)) + " pv " + " ".join(info.get("pv", [])[:5]))
+        window.move(31, 0)
+        window.clrtoeol()
+        window.addstr(31, 0, text[:curses.COLS - 1])
+        window.refresh()
+
+    def poll_while_thinking(self, window) -> bool:
+        """
+        Draw the engine info and wait a short time for a key press, while the engine is thinking.
+
+        Return:
+        - bool -> True if the ESC key has been pressed
+        """
+        self.draw_engine_info(window)
+        window.timeout(50)
+        key = window.getch()
+        window.timeout(-1)
+        return key == 27
+
+    def wait_for_engine_move(self, window, engine : object) -> tuple:
+        """
+        Start the search of the engine in the background and keep the interface responsive until it ends.
+        If the ESC key is pressed, the search is stopped.
+        The move is taken from the opening book if the position is in the book,
+        or from the move cache if the same search has already been done.
+
+        Return:
+        - tuple -> The move of the engine as (start, end, promotion), None if the search was interrupted
+        """
+        self.engine_info = None
+        if self.opening_book is not None:
+            move = self.opening_book.choose_move(self.board)
+            if move is not None:
+                self.engine_stats = (0, 0.0)
+                return move
+        fen = self.board.convert_board_to_fen()
+        move = self.move_cache.get(self.engine, fen, self.limits)
+        if move is not None:
+            self.engine_stats = (0, 0.0)
+            return move
+        future = engine.get_move_async(fen, self.set_engine_info, self.limits)
+        while not future.done():
+            if self.poll_while_thinking(window):
+                engine.stop()
+                # Wait for the end of the search, so the engine is ready for the next game
+                future.exception()
+                return None
+        move = future.result()
+        self.engine_stats = (engine.nodes, engine.time_used)
+        self.move_cache.put(self.engine, fen, self.limits, move)
+        return move
 
     def init_curses(self) -> tuple[int, int, int]:
         """
@@ -122,6 +301,19 @@ class Chess:
         window.addstr(28, 0, "Check: " + str(self.check))
         window.addstr(29, 0, "Checkmate: " + str(self.checkmate))
         window.addstr(30, 0, "Stalemate: " + str(self.stalemate))
+        if self.engine_stats is not None:
+            window.addstr(31, 0, "Engine: " + str(self.engine_stats[0]) + " nodes in " + f"{self.engine_stats[1]:.2f}" + "s")
+        if self.limits.has_clock():
+            window.addstr(32, 0, "Clock: White " + self.format_clock(self.limits.wtime) + " - Black " + self.format_clock(self.limits.btime))
+
+    def format_clock(self, milliseconds : int) -> str:
+        """
+        Format the time left on a clock as minutes:seconds ("-" if the player has no clock).
+        """
+        if milliseconds is None:
+            return "-"
+        seconds = milliseconds // 1000
+        return str(seconds // 60) + ":" + str(seconds % 60).zfill(2)
 
     def draw_board(self, window, color, moves=None, moves_color=None, check_visualization=False, check_color=None, king_coordinates=None) -> None:
         """
@@ -194,7 +386,7 @@ class Chess:
             window.clear()
             if self.checkmate:
                 self.draw_board(window, color, None, None, True, check_color, king_coordinates)
-            elif self.stalemate:
+            elif self.stalemate or self.draw is not None:
                 self.draw_board(window, color)
             if self.checkmate:
                 if self.current_player == "w":
@@ -203,6 +395,8 @@ class Chess:
                     window.addstr(26, 0, "Checkmate. White wins.")
             elif self.stalemate:
                 window.addstr(26, 0, "Stalemate.")
+            elif self.draw is not None:
+                window.addstr(26, 0, "Draw by " + self.draw + ".")
             window.refresh()
             time.sleep(3)
 
@@ -272,7 +466,7 @@ class Chess:
 
         self.update_screen(stdscr, COLOR_WHITE_BLACK)
 
-        while not self.checkmate and not self.stalemate:
+        while not self.checkmate and not self.stalemate and self.draw is None:
             # Selecting the piece to move
             x1, y1, exit = self.get_input(stdscr)
             if exit:
@@ -281,7 +475,7 @@ class Chess:
      
             # Check if the cursor is on a piece, and if it's the current player's piece
             if x_start is not None and y_start is not None and self.board.matrix[y_start][x_start] != None and self.board.matrix[y_start][x_start].color == self.current_player:
-                possible = self.board.matrix[y_start][x_start].legal_moves(self.board.matrix)
+                possible = self.get_legal_moves((x_start, y_start))
                 if not self.check:
                     self.update_screen(stdscr, COLOR_WHITE_BLACK, possible, COLOR_GREEN_BLACK)
                 else:
@@ -294,7 +488,6 @@ class Chess:
                 x_end, y_end = self.from_input_to_board(x2, y2)
                 if (x_end, y_end) in possible:
                     self.move_piece((x_start, y_start), (x_end, y_end))
-                    self.detect_promotion_and_promote()
                     self.check, self.checkmate, self.stalemate = self.detect_check_checkmate_stalemate()
                     if not self.check:
                         self.update_screen(stdscr, COLOR_WHITE_BLACK)
@@ -306,7 +499,7 @@ class Chess:
                     else:
                         self.update_screen(stdscr, COLOR_WHITE_BLACK, None, None, True, COLOR_RED_BLACK, self.board.detect_king_coordinates(self.current_player))
 
-        if self.checkmate or self.stalemate:
+        if self.checkmate or self.stalemate or self.draw is not None:
             self.update_screen(stdscr, COLOR_WHITE_BLACK, None, None, True, COLOR_RED_BLACK, self.board.detect_king_coordinates(self.current_player), True)
 
     def single_player_gameloop(self, stdscr) -> None:
@@ -321,21 +514,25 @@ class Chess:
             return
 
         self.update_screen(stdscr, COLOR_WHITE_BLACK)
-        engine = ChessEngine()
+        engine = self.checkout_engine()
 
-        while not self.checkmate and not self.stalemate:
+        while not self.checkmate and not self.stalemate and self.draw is None:
             # Selecting the piece to move
             if self.current_player == "w":
                 x1, y1, exit = self.get_input(stdscr)
                 if exit:
                     break
                 x_start, y_start = self.from_input_to_board(x1, y1)
+                promotion = None # The pawns moved with the mouse are promoted to a queen
             else:
-                x_start, y_start, x_end, y_end = engine.get_move(self.board.convert_board_to_fen())
+                move = self.wait_for_engine_move(stdscr, engine)
+                if move is None:
+                    break
+                (x_start, y_start), (x_end, y_end), promotion = move
 
             # Check if the cursor is on a piece, and if it's the current player's piece
             if x_start is not None and y_start is not None and self.board.matrix[y_start][x_start] != None and self.board.matrix[y_start][x_start].color == self.current_player:
-                possible = self.board.matrix[y_start][x_start].legal_moves(self.board.matrix)
+                possible = self.get_legal_moves((x_start, y_start))
                 if not self.check and self.current_player == "w":
                     self.update_screen(stdscr, COLOR_WHITE_BLACK, possible, COLOR_GREEN_BLACK)
                 elif self.current_player == "w":
@@ -348,8 +545,7 @@ class Chess:
                         break
                     x_end, y_end = self.from_input_to_board(x2, y2)
                 if (x_end, y_end) in possible:
-                    self.move_piece((x_start, y_start), (x_end, y_end))
-                    self.detect_promotion_and_promote()
+                    self.move_piece((x_start, y_start), (x_end, y_end), promotion)
                     self.check, self.checkmate, self.stalemate = self.detect_check_checkmate_stalemate()
 
                     if not self.check:
@@ -362,10 +558,14 @@ class Chess:
                     else:
                         self.update_screen(stdscr, COLOR_WHITE_BLACK, None, None, True, COLOR_RED_BLACK, self.board.detect_king_coordinates(self.current_player))
 
-        if self.checkmate or self.stalemate:
+        if self.checkmate or self.stalemate or self.draw is not None:
             self.update_screen(stdscr, COLOR_WHITE_BLACK, None, None, True, COLOR_RED_BLACK, self.board.detect_king_coordinates(self.current_player), True)
 
-        engine.close()
+        self.release_engine(engine)
+        try:
+            self.move_cache.save()
+        except OSError:
+            pass # The cache is an optimization, the game is not affected if it cannot be saved
 
     def init_game(self) -> None:
         """
@@ -0,0 +1,205 @@
+import json
+import multiprocessing.util
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from gamehub.chess.chess_bitboard import ChessBitboard
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_engine import ChessEngine
+from gamehub.chess.chess_search import ChessSearch
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+class ChessAnalysis:
+    """
+    Class used to analyse the positions of a FEN/EPD file without the curses interface.
+    The file is read line by line and the lines are analysed in chunks by a pool of processes.
+    For every position a JSON line is written with the number of legal moves, check, checkmate, stalemate
+    and, if an engine is selected, its best move. The results are written in the order of the input.
+
+    Attributes:
+    - input_path: The file of the positions (one FEN or EPD per line, "-" for the standard input)
+    - output_path: The file of the results ("-" for the standard output)
+    - workers: The number of processes (1 to analyse in the current process)
+    - chunk_size: The number of lines sent to a process at a time
+    - engine: The engine used to find the best move (Stockfish or Builtin), None to skip it
+    - hash_size: The size in MB of the hash table of the engine
+    - limits: The limits of the searches of the engine
+    """
+    # The engine of the current process, created once by init_worker
+    worker_engine = None
+
+    def __init__(self, input_path : str, output_path : str = "-", workers : int = None, chunk_size : int = 256,
+                 engine : str = None, hash_size : int = 16, limits : ChessSearchLimits = None) -> None:
+        self.input_path = input_path
+        self.output_path = output_path
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.engine = engine
+        self.hash_size = hash_size
+        self.limits = limits if limits is not None else ChessSearchLimits()
+
+    @classmethod
+    def init_worker(cls, engine : str, hash_size : int, close_at_exit : bool = False) -> None:
+        """
+        Create the engine of the current process (called once in every process of the pool).
+
+        Parameters:
+        - engine: The engine (Stockfish or Builtin), None for no engine
+        - hash_size: The size in MB of the hash table of the engine
+        - close_at_exit: True to close the engine when the process exits (in the processes of the pool)
+        """
+        if engine == "Builtin":
+            cls.worker_engine = ChessSearch(hash_size=hash_size)
+        elif engine == "Stockfish":
+            cls.worker_engine = ChessEngine(hash_size)
+        else:
+            cls.worker_engine = None
+        if close_at_exit and cls.worker_engine is not None:
+            # The processes of the pool do not run the atexit handlers, but they run the multiprocessing finalizers
+            multiprocessing.util.Finalize(None, cls.close_worker, exitpriority=10)
+
+    @staticmethod
+    def normalize_fen(line : str) -> tuple[str, dict]:
+        """
+        Convert a FEN or EPD line to a FEN string.
+        The EPD lines have no move counters (0 1 is used) and can end with operations (e.g. bm e4; id "test 1";).
+
+        Return:
+        - tuple[str, dict] -> The FEN string and the operations of the EPD line
+        """
+        fields = line.split()
+        counters = fields[4:6]
+        if len(counters) == 2 and counters[0].isdigit() and counters[1].isdigit():
+            return " ".join(fields[:6]), {}
+        operations = {}
+        for operation in " ".join(fields[4:]).split(";"):
+            operation = operation.strip()
+            if operation:
+                opcode, _, operand = operation.partition(" ")
+                operations[opcode] = operand.strip().strip('"')
+        return " ".join(fields[:4]) + " 0 1", operations
+
+    @classmethod
+    def analyse_position(cls, line : str, limits : ChessSearchLimits) -> dict:
+        """
+        Analyse a position, with the engine of the current process (if any).
+
+        Parameters:
+        - line: The FEN or EPD line of the position
+        - limits: The limits of the search of the engine
+
+        Return:
+        - dict -> The result (fen, id if given, legal_moves, check, checkmate, stalemate and best_move), or the error
+        """
+        fen, operations = cls.normalize_fen(line)
+        try:
+            board = ChessBoard(fen)
+        except (ValueError, IndexError):
+            return {"input": line, "error": "Invalid FEN string"}
+        player = board.playerToMove
+        bitboard = ChessBitboard(board)
+        legal_moves = bitboard.legal_moves_count(player)
+        check = bitboard.king_under_attack(player)
+        result = {"fen": fen}
+        if "id" in operations:
+            result["id"] = operations["id"]
+        result.update({"legal_moves": legal_moves,
+                       "check": check,
+                       "checkmate": check and legal_moves == 0,
+                       "stalemate": not check and legal_moves == 0})
+        if cls.worker_engine is not None:
+            move = cls.worker_engine.get_move(fen, limits=limits) if legal_moves > 0 else None
+            result["best_move"] = board.convert_move_to_algebraic(*move) if move is not None else None
+        return result
+
+    @classmethod
+    def analyse_chunk(cls, lines : list[tuple[int, str]], limits : ChessSearchLimits) -> list[str]:
+        """
+        Analyse a chunk of lines (the function run by the processes of the pool).
+
+        Parameters:
+        - lines: The lines as (line number, text)
+        - limits: The limits of the search of the engine
+
+        Return:
+        - list[str] -> The JSON results of the lines
+        """
+        results = []
+        for number, line in lines:
+            result = {"line": number}
+            result.update(cls.analyse_position(line, limits))
+            results.append(json.dumps(result))
+        return results
+
+    def read_chunks(self, file) -> list[tuple[int, str]]:
+        """
+        Read the file in chunks of chunk_size positions, skipping the empty lines and the comments (#).
+        """
+        chunk = []
+        for number, line in enumerate(file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            chunk.append((number, line))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def analyse(self, input_file, output_file) -> int:
+        """
+        Analyse all the positions of the input file and write the results to the output file.
+        At most two chunks per process are in progress at a time, so the memory does not depend on the size of the file.
+
+        Return:
+        - int -> The number of positions analysed
+        """
+        count = 0
+        if self.workers <= 1:
+            type(self).init_worker(self.engine, self.hash_size)
+            try:
+                for chunk in self.read_chunks(input_file):
+                    for result in self.analyse_chunk(chunk, self.limits):
+                        output_file.write(result + "\n")
+                    count += len(chunk)
+            finally:
+                self.close_worker()
+            return count
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=type(self).init_worker,
+                                 initargs=(self.engine, self.hash_size, True)) as executor:
+            pending = deque()
+            for chunk in self.read_chunks(input_file):
+                pending.append(executor.submit(type(self).analyse_chunk, chunk, self.limits))
+                count += len(chunk)
+                while len(pending) >= 2 * self.workers:
+                    output_file.write("".join(result + "\n" for result in pending.popleft().result()))
+            while pending:
+                output_file.write("".join(result + "\n" for result in pending.popleft().result()))
+        return count
+
+    @classmethod
+    def close_worker(cls) -> None:
+        """
+        Close the engine of the current process.
+        """
+        if cls.worker_engine is not None:
+            cls.worker_engine.close()
+            cls.worker_engine = None
+
+    def init_game(self) -> None:
+        """
+        Run the analysis (called by GameHub as for the games).
+        """
+        input_file = sys.stdin if self.input_path == "-" else open(self.input_path, "r", encoding="utf-8")
+        output_file = sys.stdout if self.output_path == "-" else open(self.output_path, "w", encoding="utf-8")
+        try:
+            self.analyse(input_file, output_file)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+            if output_file is not sys.stdout:
+                output_file.close()
@@ -0,0 +1,485 @@
+from gamehub.chess.chess_board import ChessBoard
+
+def _build_leaper_table(offsets : list[tuple[int, int]]) -> list[int]:
+    """
+    Build the attack table of a piece that jumps by fixed offsets (knight, king).
+
+    Parameters:
+    - offsets: The list of (dx, dy) offsets reachable by the piece
+
+    Return:
+    - list[int] -> For every square, the bitboard of the attacked squares
+    """
+    table = []
+    for square in range(64):
+        x, y = square % 8, square // 8
+        attacks = 0
+        for dx, dy in offsets:
+            if 0 <= x + dx < 8 and 0 <= y + dy < 8:
+                attacks |= 1 << ((y + dy) * 8 + x + dx)
+        table.append(attacks)
+    return table
+
+def _build_ray_table(dx : int, dy : int) -> list[int]:
+    """
+    Build the table of the rays starting from every square (excluded) in the direction (dx, dy).
+
+    Parameters:
+    - dx: The horizontal step of the direction
+    - dy: The vertical step of the direction
+
+    Return:
+    - list[int] -> For every square, the bitboard of the ray
+    """
+    table = []
+    for square in range(64):
+        x, y = square % 8 + dx, square // 8 + dy
+        ray = 0
+        while 0 <= x < 8 and 0 <= y < 8:
+            ray |= 1 << (y * 8 + x)
+            x += dx
+            y += dy
+        table.append(ray)
+    return table
+
+class ChessBitboard:
+    """
+    A position represented with 64-bit bitboards, used to generate legal moves quickly.
+    The squares are indexed as y * 8 + x, with the same (x, y) coordinates of the ChessBoard matrix.
+    The move rules are the same of ChessBoard.get_legal_moves: the moves of ChessPiece.legal_moves,
+    the en passant captures and the castlings (as moves of the king by two squares).
+
+    Attributes:
+    - pieces: A dictionary that maps every piece character (P, R, N, B, Q, K, p, r, n, b, q, k) to its bitboard
+    - occupancy: A dictionary that maps every color (w, b) to the bitboard of its pieces
+    - occupied: The bitboard of all the pieces
+    - castling_rights: The castling rights of the players ("KQkq" for all rights, "-" for none)
+    - en_passant: A dictionary that maps every color to the bitboard of the square where it can capture en passant (0 if none)
+    """
+    KNIGHT_ATTACKS = _build_leaper_table([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+    KING_ATTACKS = _build_leaper_table([(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)])
+    # The squares attacked by a pawn of the given color (white pawns move towards y = 0)
+    PAWN_ATTACKS = {"w": _build_leaper_table([(1, -1), (-1, -1)]),
+                    "b": _build_leaper_table([(1, 1), (-1, 1)])}
+    # Rays whose squares have increasing (positive) or decreasing (negative) indexes
+    ROOK_POSITIVE_RAYS = [_build_ray_table(1, 0), _build_ray_table(0, 1)]
+    ROOK_NEGATIVE_RAYS = [_build_ray_table(-1, 0), _build_ray_table(0, -1)]
+    BISHOP_POSITIVE_RAYS = [_build_ray_table(1, 1), _build_ray_table(-1, 1)]
+    BISHOP_NEGATIVE_RAYS = [_build_ray_table(-1, -1), _build_ray_table(1, -1)]
+    # The castlings as (right, king square, king target, rook square, squares that must be empty, squares the king crosses)
+    CASTLINGS = {"w": [("K", 60, 62, 63, (1 << 61) | (1 << 62), [61, 62]),
+                       ("Q", 60, 58, 56, (1 << 57) | (1 << 58) | (1 << 59), [59, 58])],
+                 "b": [("k", 4, 6, 7, (1 << 5) | (1 << 6), [5, 6]),
+                       ("q", 4, 2, 0, (1 << 1) | (1 << 2) | (1 << 3), [3, 2])]}
+
+    def __init__(self, board : ChessBoard) -> None:
+        self.pieces = {char: 0 for char in "PRNBQKprnbqk"}
+        self.occupancy = {"w": 0, "b": 0}
+        for y in range(8):
+            for x in range(8):
+                piece = board.matrix[y][x]
+                if piece is not None:
+                    bit = 1 << (y * 8 + x)
+                    self.pieces[piece.piece_char] |= bit
+                    self.occupancy[piece.color] |= bit
+        self.occupied = self.occupancy["w"] | self.occupancy["b"]
+        self.castling_rights = board.castlingRights
+        self.en_passant = {"w": 0, "b": 0}
+        if board.enPassant != "-":
+            x, y = ord(board.enPassant[0]) - 97, 8 - int(board.enPassant[1])
+            # White captures on the sixth rank (y = 2), black on the third one (y = 5)
+            if y == 2:
+                self.en_passant["w"] = 1 << (y * 8 + x)
+            elif y == 5:
+                self.en_passant["b"] = 1 << (y * 8 + x)
+
+    def sliding_attacks(self, square : int, occupied : int, positive_rays : list[list[int]], negative_rays : list[list[int]]) -> int:
+        """
+        Return the squares attacked by a sliding piece along the given rays.
+        Every ray is cut after its first blocker (that is included in the attacks).
+
+        Parameters:
+        - square: The square of the sliding piece
+        - occupied: The bitboard of the squares occupied by any piece
+        - positive_rays: The ray tables in which the first blocker is the lowest bit
+        - negative_rays: The ray tables in which the first blocker is the highest bit
+
+        Return:
+        - int -> The bitboard of the attacked squares
+        """
+        attacks = 0
+        for rays in positive_rays:
+            ray = rays[square]
+            blockers = ray & occupied
+            if blockers:
+                ray ^= rays[(blockers & -blockers).bit_length() - 1]
+            attacks |= ray
+        for rays in negative_rays:
+            ray = rays[square]
+            blockers = ray & occupied
+            if blockers:
+                ray ^= rays[blockers.bit_length() - 1]
+            attacks |= ray
+        return attacks
+
+    def rook_attacks(self, square : int, occupied : int) -> int:
+        """
+        Return the squares attacked by a rook on the given square.
+        """
+        return self.sliding_attacks(square, occupied, self.ROOK_POSITIVE_RAYS, self.ROOK_NEGATIVE_RAYS)
+
+    def bishop_attacks(self, square : int, occupied : int) -> int:
+        """
+        Return the squares attacked by a bishop on the given square.
+        """
+        return self.sliding_attacks(square, occupied, self.BISHOP_POSITIVE_RAYS, self.BISHOP_NEGATIVE_RAYS)
+
+    def pseudo_legal_targets(self, square : int, piece_char : str) -> int:
+        """
+        Return the squares where the piece on the given square can move,
+        without checking if the move leaves the king under attack.
+
+        Parameters:
+        - square: The square of the piece
+        - piece_char: The character of the piece
+
+        Return:
+        - int -> The bitboard of the target squares
+        """
+        color = "w" if piece_char.isupper() else "b"
+        enemy = self.occupancy["b" if color == "w" else "w"]
+        own = self.occupancy[color]
+        kind = piece_char.upper()
+        if kind == "P":
+            targets = self.PAWN_ATTACKS[color][square] & (enemy | self.en_passant[color])
+            y = square // 8
+            step = -8 if color == "w" else 8
+            # A pawn on its own back rank (only possible from a FEN) cannot be pushed, as in ChessPiece.pawn_moves
+            if 0 < y < 7:
+                one_step = 1 << (square + step)
+                if not one_step & self.occupied:
+                    targets |= one_step
+                    if y == (6 if color == "w" else 1):
+                        two_steps = 1 << (square + 2 * step)
+                        if not two_steps & self.occupied:
+                            targets |= two_steps
+            return targets
+        if kind == "N":
+            return self.KNIGHT_ATTACKS[square] & ~own
+        if kind == "K":
+            return self.KING_ATTACKS[square] & ~own
+        if kind == "B":
+            return self.bishop_attacks(square, self.occupied) & ~own
+        if kind == "R":
+            return self.rook_attacks(square, self.occupied) & ~own
+        if kind == "Q":
+            return (self.rook_attacks(square, self.occupied) | self.bishop_attacks(square, self.occupied)) & ~own
+        raise ValueError("Invalid piece type")
+
+    def square_attacked(self, square : int, by_color : str, occupied : int = None, removed : int = 0) -> bool:
+        """
+        Check if the given square is attacked by a piece of the given color.
+        The attacks are looked up from the square itself, so the cost does not depend on the number of enemy pieces.
+
+        Parameters:
+        - square: The square to check
+        - by_color: The color of the attacking pieces
+        - occupied: The occupancy to use for the sliding pieces (the current one if None)
+        - removed: The bitboard of the attacking pieces to ignore (e.g. because they have been captured)
+
+        Return:
+        - bool -> True if the square is attacked
+        """
+        if occupied is None:
+            occupied = self.occupied
+        keep = ~removed
+        if by_color == "w":
+            pawns, knights, bishops, rooks, queens, king = "P", "N", "B", "R", "Q", "K"
+            defender = "b"
+        else:
+            pawns, knights, bishops, rooks, queens, king = "p", "n", "b", "r", "q", "k"
+            defender = "w"
+        # A pawn attacks the square if the square "attacks" the pawn as a pawn of the opposite color
+        if self.PAWN_ATTACKS[defender][square] & self.pieces[pawns] & keep:
+            return True
+        if self.KNIGHT_ATTACKS[square] & self.pieces[knights] & keep:
+            return True
+        if self.KING_ATTACKS[square] & self.pieces[king] & keep:
+            return True
+        diagonal = (self.pieces[bishops] | self.pieces[queens]) & keep
+        if diagonal and self.bishop_attacks(square, occupied) & diagonal:
+            return True
+        straight = (self.pieces[rooks] | self.pieces[queens]) & keep
+        if straight and self.rook_attacks(square, occupied) & straight:
+            return True
+        return False
+
+    def attackers(self, square : int, by_color : str) -> int:
+        """
+        Return the pieces of the given color that attack the given square.
+
+        Parameters:
+        - square: The attacked square
+        - by_color: The color of the attacking pieces
+
+        Return:
+        - int -> The bitboard of the attacking pieces
+        """
+        if by_color == "w":
+            pawns, knights, bishops, rooks, queens, king, defender = "P", "N", "B", "R", "Q", "K", "b"
+        else:
+            pawns, knights, bishops, rooks, queens, king, defender = "p", "n", "b", "r", "q", "k", "w"
+        return ((self.PAWN_ATTACKS[defender][square] & self.pieces[pawns]) |
+                (self.KNIGHT_ATTACKS[square] & self.pieces[knights]) |
+                (self.KING_ATTACKS[square] & self.pieces[king]) |
+                (self.bishop_attacks(square, self.occupied) & (self.pieces[bishops] | self.pieces[queens])) |
+                (self.rook_attacks(square, self.occupied) & (self.pieces[rooks] | self.pieces[queens])))
+
+    def between(self, start : int, end : int) -> int:
+        """
+        Return the squares strictly between two squares on the same rank, file or diagonal (0 if they are not aligned).
+        """
+        for rays in self.ROOK_POSITIVE_RAYS + self.ROOK_NEGATIVE_RAYS + self.BISHOP_POSITIVE_RAYS + self.BISHOP_NEGATIVE_RAYS:
+            if rays[start] & (1 << end):
+                return rays[start] & ~rays[end] & ~(1 << end)
+        return 0
+
+    def king_square(self, color : str) -> int:
+        """
+        Return the square of the king of the given color (None if there is no king).
+        """
+        king = self.pieces["K" if color == "w" else "k"]
+        if not king:
+            return None
+        return (king & -king).bit_length() - 1
+
+    def king_under_attack(self, color : str) -> bool:
+        """
+        Check if the king of the given color is under attack.
+        """
+        king_square = self.king_square(color)
+        if king_square is None:
+            return False
+        return self.square_attacked(king_square, "b" if color == "w" else "w")
+
+    def piece_at(self, square : int) -> str:
+        """
+        Return the character of the piece on the given square (None if the square is empty).
+        """
+        bit = 1 << square
+        if not self.occupied & bit:
+            return None
+        for char, bitboard in self.pieces.items():
+            if bitboard & bit:
+                return char
+        return None
+
+    def legal_targets(self, square : int, mask : int = -1) -> int:
+        """
+        Return the squares where the piece on the given square can legally move.
+        Every pseudo-legal move is applied to the occupancy only, then the king safety is checked.
+
+        Parameters:
+        - square: The square of the piece
+        - mask: The bitboard of the target squares to consider (all the squares by default),
+          the other ones are not checked for king safety
+
+        Return:
+        - int -> The bitboard of the target squares (0 if the square is empty)
+        """
+        piece_char = self.piece_at(square)
+        if piece_char is None:
+            return 0
+        color = "w" if piece_char.isupper() else "b"
+        enemy_color = "b" if color == "w" else "w"
+        targets = self.pseudo_legal_targets(square, piece_char) & mask
+        king_square = self.king_square(color)
+        if king_square is None:
+            return targets
+        is_king = piece_char.upper() == "K"
+        en_passant = self.en_passant[color] if piece_char.upper() == "P" else 0
+        from_bit = 1 << square
+        legal = 0
+        remaining = targets
+        while remaining:
+            to_bit = remaining & -remaining
+            remaining ^= to_bit
+            captured_bit = to_bit
+            if to_bit == en_passant:
+                # The captured pawn is behind the en passant square, its removal can uncover the king
+                captured_bit = to_bit << 8 if color == "w" else to_bit >> 8
+            occupied = (self.occupied & ~from_bit & ~captured_bit) | to_bit
+            to_square = to_bit.bit_length() - 1
+            if not self.square_attacked(to_square if is_king else king_square, enemy_color, occupied, captured_bit):
+                legal |= to_bit
+        if is_king and mask == -1:
+            legal |= self.castling_targets(square, color)
+        return legal
+
+    def castling_targets(self, square : int, color : str) -> int:
+        """
+        Return the squares where the king on the given square can move by castling.
+        The king must not be in check and the squares it crosses must be empty and not attacked.
+
+        Parameters:
+        - square: The square of the king
+        - color: The color of the king
+
+        Return:
+        - int -> The bitboard of the target squares of the castlings
+        """
+        if self.castling_rights == "-":
+            return 0
+        enemy_color = "b" if color == "w" else "w"
+        rook = self.pieces["R" if color == "w" else "r"]
+        targets = 0
+        for right, king_square, target, rook_square, empty, crossed in self.CASTLINGS[color]:
+            if (right in self.castling_rights and square == king_square and rook & (1 << rook_square)
+                    and not self.occupied & empty):
+                if self.square_attacked(square, enemy_color):
+                    return 0
+                if not any(self.square_attacked(crossed_square, enemy_color) for crossed_square in crossed):
+                    targets |= 1 << target
+        return targets
+
+    def legal_moves(self, position : tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Return the legal moves of the piece in the given position, as ChessPiece.legal_moves does.
+
+        Parameters:
+        - position: The position of the piece (x, y)
+
+        Return:
+        - list[tuple[int, int]] -> The legal moves of the piece
+        """
+        moves = []
+        targets = self.legal_targets(position[1] * 8 + position[0])
+        while targets:
+            to_bit = targets & -targets
+            targets ^= to_bit
+            to_square = to_bit.bit_length() - 1
+            moves.append((to_square % 8, to_square // 8))
+        return moves
+
+    def legal_moves_count(self, color : str) -> int:
+        """
+        Count all the legal moves of the pieces of the given color,
+        as ChessBoard.get_legal_moves does (a move for every piece a pawn can be promoted to).
+        """
+        count = 0
+        pawns = self.pieces["P" if color == "w" else "p"]
+        last_rank = 0xFF if color == "w" else 0xFF << 56
+        remaining = self.occupancy[color]
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            targets = self.legal_targets(bit.bit_length() - 1)
+            count += bin(targets).count("1")
+            if bit & pawns:
+                count += 3 * bin(targets & last_rank).count("1")
+        return count
+
+    def capture_moves(self, color : str) -> list[tuple[tuple[int, int], tuple[int, int], str]]:
+        """
+        Return the legal captures of the pieces of the given color, with the en passant captures,
+        and the promotions to a queen (with or without a capture), as searched by the quiescence search.
+        Only the targets on enemy pieces, on the en passant square and on the last rank for the pawns are checked.
+
+        Parameters:
+        - color: The color of the pieces
+
+        Return:
+        - list[tuple[tuple[int, int], tuple[int, int], str]] -> The moves as (start, end, promotion),
+          where promotion is the character of the queen or None
+        """
+        enemy = self.occupancy["b" if color == "w" else "w"]
+        pawns = self.pieces["P" if color == "w" else "p"]
+        pawn_mask = enemy | self.en_passant[color] | (0xFF if color == "w" else 0xFF << 56)
+        queen = "Q" if color == "w" else "q"
+        moves = []
+        for square in self.squares(self.occupancy[color]):
+            start = (square % 8, square // 8)
+            is_pawn = pawns >> square & 1
+            for to_square in self.squares(self.legal_targets(square, pawn_mask if is_pawn else enemy)):
+                end = (to_square % 8, to_square // 8)
+                moves.append((start, end, queen if is_pawn and end[1] in (0, 7) else None))
+        return moves
+
+    def legal_move_table(self, color : str) -> dict[tuple[int, int], list[tuple[int, int]]]:
+        """
+        Return the legal moves of all the pieces of the given color, keyed by the position of the piece.
+
+        Parameters:
+        - color: The color of the pieces
+
+        Return:
+        - dict[tuple[int, int], list[tuple[int, int]]] -> The legal moves (x, y) of every piece, by position (x, y) of the piece
+        """
+        table = {}
+        remaining = self.occupancy[color]
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            square = bit.bit_length() - 1
+            moves = []
+            targets = self.legal_targets(square)
+            while targets:
+                to_bit = targets & -targets
+                targets ^= to_bit
+                to_square = to_bit.bit_length() - 1
+                moves.append((to_square % 8, to_square // 8))
+            table[(square % 8, square // 8)] = moves
+        return table
+
+    def has_any_legal_move(self, color : str) -> bool:
+        """
+        Check if the player of the given color has at least one legal move, stopping at the first one found.
+        In check the king is tried first, then only the pieces that can capture the checking piece or block the check
+        (none in double check). Otherwise the pieces are tried from the most mobile ones, and the king last.
+
+        Parameters:
+        - color: The color of the player
+
+        Return:
+        - bool -> True if there is a legal move
+        """
+        own = self.occupancy[color]
+        king_square = self.king_square(color)
+        if king_square is None:
+            return any(self.legal_targets(square) for square in self.squares(own))
+
+        checkers = self.attackers(king_square, "b" if color == "w" else "w")
+        if checkers:
+            if self.legal_targets(king_square):
+                return True
+            if checkers & (checkers - 1):
+                # Double check: only the king can move
+                return False
+            checker_square = checkers.bit_length() - 1
+            evasions = checkers | self.between(king_square, checker_square)
+            en_passant = self.en_passant[color]
+            if en_passant and checkers == (en_passant << 8 if color == "w" else en_passant >> 8):
+                # The checking pawn has just moved two squares and can be captured en passant
+                evasions |= en_passant
+            for square in self.squares(own & ~(1 << king_square)):
+                if self.pseudo_legal_targets(square, self.piece_at(square)) & evasions and self.legal_targets(square):
+                    return True
+            return False
+
+        for kind in "QRBNP":
+            piece_char = kind if color == "w" else kind.lower()
+            for square in self.squares(self.pieces[piece_char]):
+                if self.legal_targets(square):
+                    return True
+        return self.legal_targets(king_square) != 0
+
+    def squares(self, bitboard : int) -> list[int]:
+        """
+        Return the indexes of the squares of a bitboard.
+        """
+        squares = []
+        while bitboard:
+            bit = bitboard & -bitboard
+            bitboard ^= bit
+            squares.append(bit.bit_length() - 1)
+        return squares
@@ -1,4 +1,6 @@
+from gamehub.chess.chess_fen import ChessFenCodec
 from gamehub.chess.chess_piece import ChessPiece
+from gamehub.chess.chess_zobrist import ChessZobrist
 
 class ChessBoard:
     """
@@ -8,22 +10,35 @@ class ChessBoard:
     - matrix: The 2D matrix representing the board, each cell contains a ChessPiece object
     - playerToMove: The color of the player to move ("w" for white, "b" for black)
     - castlingRights: The castling rights of the players ("KQkq" for all rights, "-" for none)
-    - enPassant: The en passant square (e.g. "e3" or "-") [not implemented yet]
-    - halfMoveCounter: The number of half moves since the last capture or pawn move [not implemented yet]
+    - enPassant: The en passant square (e.g. "e3" or "-"), set by make_move only when an enemy pawn can capture there
+    - halfMoveCounter: The number of half moves since the last capture or pawn move (for the fifty-move rule)
     - fullMoveCounter: The number of full moves since the start of the game
+    - kingPositions: The positions of the kings ({"w": (x, y), "b": (x, y)}), kept up to date by make_move and unmake_move
+    - zobristKey: The 64-bit Zobrist hash of the position (pieces, player to move, castling rights and en passant square),
+      kept up to date by make_move, unmake_move and set_piece
+    - positionCounts: The number of times every position (by Zobrist key) occurred since the last capture or pawn move,
+      kept up to date by make_move and unmake_move (the positions before a capture or a pawn move cannot occur again)
+    - positionCountsStack: The positionCounts saved by make_move at every capture or pawn move, restored by unmake_move
     """
+    ZOBRIST = ChessZobrist()
+    FEN_CODEC = ChessFenCodec()
+    # The castling rights lost when a piece moves from or to a square (the kings and the rooks in their initial squares)
+    CASTLING_RIGHTS_LOST = {(4, 7): "KQ", (7, 7): "K", (0, 7): "Q", (4, 0): "kq", (7, 0): "k", (0, 0): "q"}
+    # The rook move of every castling, keyed by the end square of the king: (rook start, rook end)
+    CASTLING_ROOK_MOVES = {(6, 7): ((7, 7), (5, 7)), (2, 7): ((0, 7), (3, 7)), (6, 0): ((7, 0), (5, 0)), (2, 0): ((0, 0), (3, 0))}
+    # The castlings of every color as (right, end square of the king, squares that must be empty, squares the king crosses)
+    CASTLINGS = {"w": [("K", (6, 7), [(5, 7), (6, 7)], [(5, 7), (6, 7)]),
+                       ("Q", (2, 7), [(1, 7), (2, 7), (3, 7)], [(3, 7), (2, 7)])],
+                 "b": [("k", (6, 0), [(5, 0), (6, 0)], [(5, 0), (6, 0)]),
+                       ("q", (2, 0), [(1, 0), (2, 0), (3, 0)], [(3, 0), (2, 0)])]}
+    PROMOTIONS = {"w": ["Q", "R", "B", "N"], "b": ["q", "r", "b", "n"]}
+
     # Generates a chess board from a FEN string or from a matrix and other parameters
     def __init__(self, fen=None, matrix=None, playerToMove=None, castlingRights=None, enPassant=None, halfMoveCounter=None, fullMoveCounter=None) -> None:
         if fen is not None:
-            if not self.check_fen_validity(fen):
-                raise ValueError("Invalid FEN string")
-            fen_split = fen.split(" ")
-            self.matrix = self.convert_fen_to_matrix(fen_split[0])
-            self.playerToMove = fen_split[1]
-            self.castlingRights = fen_split[2]
-            self.enPassant = fen_split[3]
-            self.halfMoveCounter = int(fen_split[4])
-            self.fullMoveCounter = int(fen_split[5])
+            self.matrix = None
+            self.load_fen(fen)
+            return
         elif matrix is not None and playerToMove is not None and castlingRights is not None and enPassant is not None and halfMoveCounter is not None and fullMoveCounter is not None:
             self.matrix = matrix
             self.playerToMove = playerToMove
@@ -33,6 +48,32 @@ class ChessBoard:
             self.fullMoveCounter = fullMoveCounter
         else:
             raise ValueError("Invalid arguments")
+        self.kingPositions = self.locate_kings()
+        self.zobristKey = self.compute_zobrist_key()
+        self.positionCounts = {self.zobristKey: 1}
+        self.positionCountsStack = []
+
+    def load_fen(self, fen : str) -> None:
+        """
+        Function that sets the position of the board from a FEN string.
+        The pieces of the current matrix that are in the same square in the new position are reused.
+
+        Parameters:
+        - fen: The FEN string of the position
+        """
+        if not self.check_fen_validity(fen):
+            raise ValueError("Invalid FEN string")
+        fen_split = fen.split(" ")
+        self.matrix = self.convert_fen_to_matrix(fen_split[0], self.matrix)
+        self.playerToMove = fen_split[1]
+        self.castlingRights = fen_split[2]
+        self.enPassant = fen_split[3]
+        self.halfMoveCounter = int(fen_split[4])
+        self.fullMoveCounter = int(fen_split[5])
+        self.kingPositions = self.locate_kings()
+        self.zobristKey = self.compute_zobrist_key()
+        self.positionCounts = {self.zobristKey: 1}
+        self.positionCountsStack = []
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, ChessBoard):
@@ -70,40 +111,18 @@ class ChessBoard:
         return True
 
     # Converts a FEN string to a 2D matrix
-    def convert_fen_to_matrix(self, fen: str) -> list[list[ChessPiece]]:
+    def convert_fen_to_matrix(self, fen: str, matrix: list[list[ChessPiece]] = None) -> list[list[ChessPiece]]:
         """
         Function that converts a FEN string (the matrix part) to a 2D matrix of ChessPiece objects.
 
         Parameters:
         - fen: The FEN string to convert (only the matrix part)
+        - matrix: A matrix whose pieces are reused when the same piece is in the same square (None to create new pieces)
 
         Return:
         - list[list[ChessPiece]] -> The 2D matrix of ChessPiece objects
         """
-        matrix = []
-        fen = fen.split(" ")[0]
-        rows = fen.split("/")
-        row_index = 0
-        element_index = 0
-        for row in rows:
-            matrix_row = []
-            for elem in row:
-                if elem.isdigit():
-                    for _ in range(int(elem)):
-                        matrix_row.append(None)
-                        element_index += 1
-                else:
-                    if elem.isupper():
-                        piece = ChessPiece(elem, (element_index, row_index))
-                    else:
-                        piece = ChessPiece(elem, (element_index, row_index))
-                    matrix_row.append(piece)
-                    element_index += 1
-            matrix.append(matrix_row)
-            row_index += 1
-            element_index = 0
-
-        return matrix
+        return self.FEN_CODEC.parse_placement(fen.split(" ")[0], matrix)
 
     # Converts a 2D matrix to a FEN string
     def convert_matrix_to_fen(self, matrix: list[list[ChessPiece]]) -> str:
@@ -116,21 +135,7 @@ class ChessBoard:
         Return:
         - str -> The FEN string (only the matrix part)
         """
-        fen = ""
-        for row in matrix:
-            empty = 0
-            for elem in row:
-                if elem is None:
-                    empty += 1
-                else:
-                    if empty > 0:
-                        fen += str(empty)
-                        empty = 0
-                    fen += elem.get_piece_char()
-            if empty > 0:
-                fen += str(empty)
-            fen += "/"
-        return fen[:-1]
+        return self.FEN_CODEC.serialize_placement(matrix)
 
     # Converts the board to a FEN string
     def convert_board_to_fen(self) -> str:
@@ -140,7 +145,88 @@ class ChessBoard:
         Return:
         - str -> The FEN string
         """
-        return self.convert_matrix_to_fen(self.matrix) + " " + self.playerToMove + " " + self.castlingRights + " " + self.enPassant + " " + str(self.halfMoveCounter) + " " + str(self.fullMoveCounter)
+        return f"{self.FEN_CODEC.serialize_placement(self.matrix)} {self.playerToMove} {self.castlingRights} {self.enPassant} {self.halfMoveCounter} {self.fullMoveCounter}"
+
+    def convert_move_to_algebraic(self, start : tuple[int, int], end : tuple[int, int], promotion : str = None) -> str:
+        """
+        Function that converts a move to coordinate notation (e.g. "e2e4" or "e7e8q").
+
+        Parameters:
+        - start: The starting position of the piece (x, y)
+        - end: The ending position of the piece (x, y)
+        - promotion: The character of the promoted piece or None
+
+        Return:
+        - str -> The move in coordinate notation
+        """
+        move = chr(start[0] + 97) + str(8 - start[1]) + chr(end[0] + 97) + str(8 - end[1])
+        if promotion is not None:
+            move += promotion.lower()
+        return move
+
+    def convert_square_to_position(self, square : str) -> tuple[int, int]:
+        """
+        Function that converts a square in algebraic notation (e.g. "e3") to a position (x, y).
+
+        Parameters:
+        - square: The square in algebraic notation
+
+        Return:
+        - tuple[int, int] -> The position (x, y), None if the square is "-"
+        """
+        if square == "-":
+            return None
+        return ord(square[0]) - 97, 8 - int(square[1])
+
+    def convert_position_to_square(self, position : tuple[int, int]) -> str:
+        """
+        Function that converts a position (x, y) to a square in algebraic notation (e.g. "e3").
+        """
+        return chr(position[0] + 97) + str(8 - position[1])
+
+    def compute_zobrist_key(self) -> int:
+        """
+        Function that computes from scratch the Zobrist hash of the position.
+
+        Return:
+        - int -> The 64-bit key of the position
+        """
+        return self.ZOBRIST.compute_key(self.matrix, self.playerToMove, self.castlingRights, self.enPassant)
+
+    def set_piece(self, position : tuple[int, int], piece : ChessPiece) -> None:
+        """
+        Function that puts a piece (or None) in the given position, replacing the previous one.
+        The Zobrist hash and the king positions are updated.
+
+        Parameters:
+        - position: The position (x, y)
+        - piece: The piece to put in the position, or None to empty it
+        """
+        previous = self.matrix[position[1]][position[0]]
+        if previous is not None:
+            self.zobristKey ^= self.ZOBRIST.piece_key(previous.piece_char, position)
+            if previous.piece == "King" and self.kingPositions.get(previous.color) == position:
+                del self.kingPositions[previous.color]
+        if piece is not None:
+            piece.position = position
+            self.zobristKey ^= self.ZOBRIST.piece_key(piece.piece_char, position)
+            if piece.piece == "King":
+                self.kingPositions[piece.color] = position
+        self.matrix[position[1]][position[0]] = piece
+
+    def locate_kings(self) -> dict[str, tuple[int, int]]:
+        """
+        Function that scans the matrix to find the coordinates of the kings.
+
+        Return:
+        - dict -> The coordinates of the kings by color ({"w": (x, y), "b": (x, y)}), a missing king is not included
+        """
+        king_positions = {}
+        for i in range(8):
+            for j in range(8):
+                if self.matrix[i][j] is not None and (self.matrix[i][j].get_piece_char() == "K" or self.matrix[i][j].get_piece_char() == "k") and self.matrix[i][j].color not in king_positions:
+                    king_positions[self.matrix[i][j].color] = (j, i)
+        return king_positions
 
     def detect_king_coordinates (self, color):
         """
@@ -152,8 +238,257 @@ class ChessBoard:
         Return:
         - tuple -> The coordinates of the king
         """
-        for i in range(8):
-            for j in range(8):
-                if self.matrix[i][j] is not None and (self.matrix[i][j].get_piece_char() == "K" or self.matrix[i][j].get_piece_char() == "k") and self.matrix[i][j].color == color:
-                    return (j, i)
-        return None
+        return self.kingPositions.get(color)
+
+    def make_move(self, start : tuple[int, int], end : tuple[int, int], promotion : str = None) -> tuple:
+        """
+        Function that applies a move in place and returns what is needed to undo it with unmake_move.
+        A pawn that reaches the last rank is promoted (to a queen if promotion is None),
+        a king that moves two squares castles (the rook is moved too) and a pawn that moves to the en passant square
+        captures the pawn that has just moved two squares.
+        Update the castling rights, the en passant square, the player to move, the counters and the position counts.
+        IMPORTANT: The move is not checked for legality.
+
+        Parameters:
+        - start: The starting position of the piece (x, y)
+        - end: The ending position of the piece (x, y)
+        - promotion: The character of the piece to promote to (e.g. "Q" or "n")
+
+        Return:
+        - tuple -> The undo information of the move (with a flag that is True if the move is irreversible,
+          a pawn move or a capture, and the position counts were pushed on positionCountsStack)
+        """
+        piece = self.matrix[start[1]][start[0]]
+        captured = self.matrix[end[1]][end[0]]
+        is_pawn = piece.piece == "Pawn"
+        if is_pawn and captured is None and start[0] != end[0]:
+            # En passant: the captured pawn is beside the start square
+            captured = self.matrix[start[1]][end[0]]
+        irreversible = is_pawn or captured is not None
+        undo = (start, end, piece, captured, self.playerToMove, self.castlingRights,
+                self.enPassant, self.halfMoveCounter, self.fullMoveCounter, self.zobristKey, irreversible)
+
+        self.zobristKey ^= self.ZOBRIST.piece_key(piece.piece_char, start) ^ self.ZOBRIST.black_to_move_key
+        if captured is not None:
+            captured_position = captured.position
+            self.zobristKey ^= self.ZOBRIST.piece_key(captured.piece_char, captured_position)
+            self.matrix[captured_position[1]][captured_position[0]] = None
+        self.matrix[start[1]][start[0]] = None
+        if is_pawn and ((piece.color == "w" and end[1] == 0) or (piece.color == "b" and end[1] == 7)):
+            promotion = "Q" if promotion is None else promotion
+            piece = ChessPiece(promotion.upper() if piece.color == "w" else promotion.lower(), end)
+        else:
+            piece.position = end
+            if piece.piece == "King":
+                self.kingPositions[piece.color] = end
+                if start[0] == 4 and abs(end[0] - start[0]) == 2:
+                    rook_start, rook_end = self.CASTLING_ROOK_MOVES[end]
+                    rook = self.matrix[rook_start[1]][rook_start[0]]
+                    self.matrix[rook_start[1]][rook_start[0]] = None
+                    self.matrix[rook_end[1]][rook_end[0]] = rook
+                    rook.position = rook_end
+                    self.zobristKey ^= self.ZOBRIST.piece_key(rook.piece_char, rook_start) ^ self.ZOBRIST.piece_key(rook.piece_char, rook_end)
+        self.zobristKey ^= self.ZOBRIST.piece_key(piece.piece_char, end)
+        self.matrix[end[1]][end[0]] = piece
+
+        if self.castlingRights != "-" and (start in self.CASTLING_RIGHTS_LOST or end in self.CASTLING_RIGHTS_LOST):
+            lost = self.CASTLING_RIGHTS_LOST.get(start, "") + self.CASTLING_RIGHTS_LOST.get(end, "")
+            castlingRights = "".join(right for right in self.castlingRights if right not in lost) or "-"
+            self.zobristKey ^= self.ZOBRIST.castling_key(self.castlingRights) ^ self.ZOBRIST.castling_key(castlingRights)
+            self.castlingRights = castlingRights
+        enPassant = "-"
+        if is_pawn and abs(end[1] - start[1]) == 2:
+            # The en passant square is set only if an enemy pawn can capture there, so equal positions have equal keys
+            for x in (end[0] - 1, end[0] + 1):
+                if 0 <= x < 8:
+                    neighbor = self.matrix[end[1]][x]
+                    if neighbor is not None and neighbor.piece == "Pawn" and neighbor.color != piece.color:
+                        enPassant = self.convert_position_to_square((end[0], (start[1] + end[1]) // 2))
+                        break
+        if enPassant != self.enPassant:
+            self.zobristKey ^= self.ZOBRIST.en_passant_key(self.enPassant) ^ self.ZOBRIST.en_passant_key(enPassant)
+            self.enPassant = enPassant
+
+        if self.playerToMove == "b":
+            self.fullMoveCounter += 1
+        self.playerToMove = "b" if self.playerToMove == "w" else "w"
+        if irreversible:
+            # The move cannot be undone, so the previous positions cannot occur again
+            self.halfMoveCounter = 0
+            self.positionCountsStack.append(self.positionCounts)
+            self.positionCounts = {self.zobristKey: 1}
+        else:
+            self.halfMoveCounter += 1
+            self.positionCounts[self.zobristKey] = self.positionCounts.get(self.zobristKey, 0) + 1
+        return undo
+
+    def unmake_move(self, undo : tuple) -> None:
+        """
+        Function that restores exactly the state of the board before the move returned by make_move.
+
+        Parameters:
+        - undo: The undo information returned by make_move
+        """
+        start, end, piece, captured, playerToMove, castlingRights, enPassant, halfMoveCounter, fullMoveCounter, zobristKey, irreversible = undo
+        if irreversible:
+            self.positionCounts = self.positionCountsStack.pop()
+        else:
+            count = self.positionCounts[self.zobristKey] - 1
+            if count:
+                self.positionCounts[self.zobristKey] = count
+            else:
+                del self.positionCounts[self.zobristKey]
+        piece.position = start
+        if piece.piece == "King":
+            self.kingPositions[piece.color] = start
+            if start[0] == 4 and abs(end[0] - start[0]) == 2:
+                rook_start, rook_end = self.CASTLING_ROOK_MOVES[end]
+                rook = self.matrix[rook_end[1]][rook_end[0]]
+                self.matrix[rook_end[1]][rook_end[0]] = None
+                self.matrix[rook_start[1]][rook_start[0]] = rook
+                rook.position = rook_start
+        self.matrix[start[1]][start[0]] = piece
+        self.matrix[end[1]][end[0]] = None
+        if captured is not None:
+            # The captured piece is not in the end square after an en passant capture
+            self.matrix[captured.position[1]][captured.position[0]] = captured
+        self.playerToMove = playerToMove
+        self.castlingRights = castlingRights
+        self.enPassant = enPassant
+        self.halfMoveCounter = halfMoveCounter
+        self.fullMoveCounter = fullMoveCounter
+        self.zobristKey = zobristKey
+
+    def repetition_count(self) -> int:
+        """
+        Function that returns the number of times the current position occurred (including now) since the board was loaded.
+
+        Return:
+        - int -> The number of occurrences of the position
+        """
+        return self.positionCounts.get(self.zobristKey, 0)
+
+    def is_threefold_repetition(self) -> bool:
+        """
+        Function that checks if the current position occurred at least three times (draw by threefold repetition).
+        """
+        return self.positionCounts.get(self.zobristKey, 0) >= 3
+
+    def is_fifty_move_rule(self) -> bool:
+        """
+        Function that checks if fifty moves of each player have been played without captures or pawn moves (draw by the fifty-move rule).
+        """
+        return self.halfMoveCounter >= 100
+
+    def king_under_attack(self, color : str) -> bool:
+        """
+        Function that checks if the king of the given color is under attack.
+
+        Parameters:
+        - color: The color of the king
+
+        Return:
+        - bool -> True if the king is under attack (False if there is no king)
+        """
+        king_position = self.kingPositions.get(color)
+        if king_position is None:
+            return False
+        return ChessPiece.square_under_attack(self.matrix, king_position, "b" if color == "w" else "w")
+
+    def is_move_safe(self, start : tuple[int, int], end : tuple[int, int]) -> bool:
+        """
+        Function that checks if a move leaves the king of the moving player safe.
+        The move is made in place and then unmade, so the board is left unchanged.
+
+        Parameters:
+        - start: The starting position of the piece (x, y)
+        - end: The ending position of the piece (x, y)
+
+        Return:
+        - bool -> True if the king of the moving player is not under attack after the move
+        """
+        color = self.matrix[start[1]][start[0]].color
+        undo = self.make_move(start, end)
+        try:
+            return not self.king_under_attack(color)
+        finally:
+            self.unmake_move(undo)
+
+    def get_legal_moves(self, color : str = None) -> list[tuple[tuple[int, int], tuple[int, int], str]]:
+        """
+        Function that returns all the legal moves of the given color, with the castlings, the en passant captures
+        and a move for every piece a pawn can be promoted to (queen first).
+
+        Parameters:
+        - color: The color of the player (the player to move if None)
+
+        Return:
+        - list[tuple[tuple[int, int], tuple[int, int], str]] -> The moves as (start, end, promotion),
+          where promotion is the character of the promoted piece or None
+        """
+        if color is None:
+            color = self.playerToMove
+        moves = []
+        for y in range(8):
+            for x in range(8):
+                piece = self.matrix[y][x]
+                if piece is not None and piece.color == color:
+                    for end in piece.legal_moves(self.matrix, False):
+                        if self.is_move_safe((x, y), end):
+                            if piece.piece == "Pawn" and end[1] in (0, 7):
+                                moves.extend(((x, y), end, promotion) for promotion in self.PROMOTIONS[color])
+                            else:
+                                moves.append(((x, y), end, None))
+        moves.extend(self.get_en_passant_moves(color))
+        moves.extend(self.get_castling_moves(color))
+        return moves
+
+    def get_en_passant_moves(self, color : str) -> list[tuple[tuple[int, int], tuple[int, int], str]]:
+        """
+        Function that returns the legal en passant captures of the given color.
+
+        Return:
+        - list[tuple[tuple[int, int], tuple[int, int], str]] -> The moves as (start, end, None)
+        """
+        end = self.convert_square_to_position(self.enPassant)
+        if end is None or end[1] != (2 if color == "w" else 5):
+            return []
+        y = end[1] + 1 if color == "w" else end[1] - 1
+        moves = []
+        for x in (end[0] - 1, end[0] + 1):
+            if 0 <= x < 8:
+                piece = self.matrix[y][x]
+                if piece is not None and piece.piece == "Pawn" and piece.color == color and self.is_move_safe((x, y), end):
+                    moves.append(((x, y), end, None))
+        return moves
+
+    def get_castling_moves(self, color : str) -> list[tuple[tuple[int, int], tuple[int, int], str]]:
+        """
+        Function that returns the legal castlings of the given color (as moves of the king by two squares).
+        The king must not be in check and the squares it crosses must not be attacked.
+
+        Return:
+        - list[tuple[tuple[int, int], tuple[int, int], str]] -> The moves as (start, end, None)
+        """
+        if self.castlingRights == "-":
+            return []
+        start = (4, 7) if color == "w" else (4, 0)
+        king = self.matrix[start[1]][start[0]]
+        if king is None or king.piece != "King" or king.color != color:
+            return []
+        enemy = "b" if color == "w" else "w"
+        moves = []
+        for right, end, empty_squares, crossed_squares in self.CASTLINGS[color]:
+            if right not in self.castlingRights:
+                continue
+            rook_start = self.CASTLING_ROOK_MOVES[end][0]
+            rook = self.matrix[rook_start[1]][rook_start[0]]
+            if rook is None or rook.piece != "Rook" or rook.color != color:
+                continue
+            if any(self.matrix[y][x] is not None for x, y in empty_squares):
+                continue
+            if ChessPiece.square_under_attack(self.matrix, start, enemy):
+                return []
+            if not any(ChessPiece.square_under_attack(self.matrix, square, enemy) for square in crossed_squares):
+                moves.append((start, end, None))
+        return moves
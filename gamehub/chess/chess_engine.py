@@ -1,10 +1,23 @@
 import subprocess
+import threading
+import time
+from concurrent.futures import Future
+
+from gamehub.chess.chess_search_limits import ChessSearchLimits
 
 class ChessEngine:
     """
     A class that can be used to interact with the Stockfish chess engine.
+
+    Attributes:
+    - hash_size: The size of the hash table of the engine in MB
+    - nodes: The number of nodes searched by the engine for the last move
+    - time_used: The time in seconds spent by the engine on the last move
     """
-    def __init__(self):
+    def __init__(self, hash_size : int = 128):
+        self.hash_size = hash_size
+        self.nodes = 0
+        self.time_used = 0.0
         self.process = subprocess.Popen(['stockfish'],
                                         stdin=subprocess.PIPE,
                                         stdout=subprocess.PIPE,
@@ -16,7 +29,7 @@ class ChessEngine:
         """
         Functions that you need to run to initialize the engine.
         """
-        init_commands = ['uci\n','setoption name Hash value 128\n','isready\n']
+        init_commands = ['uci\n',f'setoption name Hash value {self.hash_size}\n','isready\n']
         for command in init_commands:
             self.process.stdin.write(command)
             self.process.stdin.flush()
@@ -26,40 +39,139 @@ class ChessEngine:
             if 'readyok' in self.process.stdout.readline():
                 break
 
-    def get_move(self, fen : str) -> tuple[int, int, int, int]:
+    def new_game(self) -> None:
+        """
+        Function that tells the engine that the next positions belong to a new game,
+        and waits until the engine is ready.
+        """
+        for command in ['ucinewgame\n', 'isready\n']:
+            self.process.stdin.write(command)
+            self.process.stdin.flush()
+
+        while True:
+            output = self.process.stdout.readline()
+            if output == '':
+                raise OSError("The engine process terminated")
+            if 'readyok' in output:
+                break
+
+    def is_alive(self) -> bool:
+        """
+        Function that checks if the engine process is still running.
+        """
+        return self.process.poll() is None
+
+    def get_move(self, fen : str, on_info=None, limits : ChessSearchLimits = None) -> tuple:
         """
         Function that returns the best move calculated by the engine for a given FEN string.
+        The call blocks until the search ends (or is stopped with stop).
+        The nodes and the time used by the search are stored in nodes and time_used.
 
         Parameters:
         - fen: The FEN string of the current board state
+        - on_info: A function called with the parsed info of every "info" line sent during the search (see parse_info_line)
+        - limits: The limits of the search (depth 20 if None or empty)
 
         Return:
-        - tuple[int, int, int, int] -> The move in coordinates (from_x, from_y, to_x, to_y)
+        - tuple -> The move as (start, end, promotion), with promotion the lowercase character of the piece or None
         """
-        commands = [f'position fen {fen}\n','go depth 20\n']
+        if limits is None:
+            limits = ChessSearchLimits()
+        commands = [f'position fen {fen}\n', limits.to_go_command()]
+        start_time = time.perf_counter()
+        self.nodes = 0
         for command in commands:
             self.process.stdin.write(command)
             self.process.stdin.flush()
 
         best_move = None
         while True:
-            output = self.process.stdout.readline().strip()
+            output = self.process.stdout.readline()
+            if output == '':
+                raise OSError("The engine process terminated")
+            output = output.strip()
             if 'bestmove' in output:
                 best_move = output.split()[1]
                 break
+            if output.startswith('info') and ' depth ' in output:
+                info = self.parse_info_line(output)
+                self.nodes = info.get('nodes', self.nodes)
+                if on_info is not None:
+                    on_info(info)
+        self.time_used = time.perf_counter() - start_time
         return self.convert_algebraic_to_coordinates(best_move)
 
-    def convert_algebraic_to_coordinates(self, algebraic: str) -> tuple[int, int, int, int]:
+    def get_move_async(self, fen : str, on_info=None, limits : ChessSearchLimits = None) -> Future:
+        """
+        Function that starts the search of the best move in a background thread, without blocking.
+
+        Parameters:
+        - fen: The FEN string of the current board state
+        - on_info: A function called (from the background thread) with the parsed info of the search
+        - limits: The limits of the search (depth 20 if None or empty)
+
+        Return:
+        - Future -> The future result of get_move
+        """
+        future = Future()
+
+        def run_search() -> None:
+            try:
+                future.set_result(self.get_move(fen, on_info, limits))
+            except Exception as exception:
+                future.set_exception(exception)
+
+        threading.Thread(target=run_search, daemon=True).start()
+        return future
+
+    def stop(self) -> None:
+        """
+        Function that stops the current search: the engine answers at once with the best move found so far.
+        """
+        self.process.stdin.write('stop\n')
+        self.process.stdin.flush()
+
+    def parse_info_line(self, line : str) -> dict:
+        """
+        Function that parses an "info" line sent by the engine during the search.
+
+        Parameters:
+        - line: The info line (e.g. "info depth 10 score cp 35 nodes 12000 nps 600000 time 20 pv e2e4 e7e5")
+
+        Return:
+        - dict -> The values found among depth, seldepth, score_cp, score_mate, nodes, nps, time (int) and pv (list of moves)
+        """
+        info = {}
+        tokens = line.split()
+        i = 1
+        while i < len(tokens):
+            token = tokens[i]
+            if token in ('depth', 'seldepth', 'nodes', 'nps', 'time') and i + 1 < len(tokens):
+                info[token] = int(tokens[i + 1])
+                i += 2
+            elif token == 'score' and i + 2 < len(tokens):
+                info['score_' + tokens[i + 1]] = int(tokens[i + 2])
+                i += 3
+            elif token == 'pv':
+                info['pv'] = tokens[i + 1:]
+                break
+            else:
+                i += 1
+        return info
+
+    def convert_algebraic_to_coordinates(self, algebraic: str) -> tuple:
         """
-        Function that converts an algebraic move to a tuple of coordinates.
+        Function that converts an algebraic move (e.g. "e2e4" or "e7e8n") to coordinates.
 
         Parameters:
         - algebraic: The algebraic move
 
         Return:
-        - tuple[int, int, int, int] -> The move in coordinates (from_x, from_y, to_x, to_y)
+        - tuple -> The move as (start, end, promotion), with start and end as (x, y)
+          and promotion the lowercase character of the piece or None
         """
-        return ord(algebraic[0]) - 97, 8 - int(algebraic[1]), ord(algebraic[2]) - 97, 8 - int(algebraic[3])
+        promotion = algebraic[4].lower() if len(algebraic) > 4 else None
+        return (ord(algebraic[0]) - 97, 8 - int(algebraic[1])), (ord(algebraic[2]) - 97, 8 - int(algebraic[3])), promotion
 
     def close(self) -> None:
         """
@@ -0,0 +1,145 @@
+import threading
+
+from gamehub.chess.chess_engine import ChessEngine
+
+class ChessEnginePool:
+    """
+    A pool of running Stockfish engines, reused between games to avoid paying the process start,
+    the uci/isready handshake and the hash allocation at every game.
+    An engine is taken with checkout and given back with release, which sends ucinewgame.
+    Engines whose process has terminated are discarded and replaced by new ones when needed.
+    The engines are not closed at exit: when the application terminates their input is closed and they quit.
+
+    Attributes:
+    - size: The maximum number of engines of the pool
+    - hash_size: The size of the hash table of the engines in MB
+    - engine_factory: The function used to start an engine, called with the hash size
+    - idle: The engines ready to be checked out
+    - engine_count: The number of engines of the pool (idle and checked out)
+
+    The pools shared by the process are kept in shared_pools, keyed by (size, hash_size).
+    """
+    shared_pools = {}
+    shared_pool_lock = threading.Lock()
+
+    def __init__(self, size : int = 2, hash_size : int = 128, engine_factory=ChessEngine) -> None:
+        if size < 1:
+            raise ValueError("Invalid pool size")
+        self.size = size
+        self.hash_size = hash_size
+        self.engine_factory = engine_factory
+        self.idle = []
+        self.engine_count = 0
+        self.condition = threading.Condition()
+
+    @classmethod
+    def shared(cls, size : int = 2, hash_size : int = 128) -> 'ChessEnginePool':
+        """
+        Return the pool shared by the whole process with the given parameters, creating it the first time.
+        A game with a different size or hash size gets its own pool, so its engines have the hash size it asked for.
+        """
+        with cls.shared_pool_lock:
+            pool = cls.shared_pools.get((size, hash_size))
+            if pool is None:
+                pool = cls(size, hash_size)
+                cls.shared_pools[(size, hash_size)] = pool
+            return pool
+
+    def warm_up(self) -> None:
+        """
+        Start all the engines of the pool, so that the following checkouts do not wait for them.
+        """
+        with self.condition:
+            missing = self.size - self.engine_count
+            self.engine_count += missing
+        for _ in range(missing):
+            engine = self.start_engine()
+            with self.condition:
+                if engine is not None:
+                    self.idle.append(engine)
+                self.condition.notify()
+
+    def start_engine(self) -> ChessEngine:
+        """
+        Start a new engine for a slot already reserved in engine_count (the slot is freed if the start fails).
+
+        Return:
+        - ChessEngine -> The new engine, None if it could not be started
+        """
+        try:
+            return self.engine_factory(self.hash_size)
+        except OSError:
+            with self.condition:
+                self.engine_count -= 1
+                self.condition.notify()
+            return None
+
+    def checkout(self, timeout : float = None) -> ChessEngine:
+        """
+        Take a ready engine from the pool, starting a new one if none is idle and the pool is not full.
+        If all the engines are in use, wait until one is released.
+
+        Parameters:
+        - timeout: The maximum time to wait in seconds (None to wait forever)
+
+        Return:
+        - ChessEngine -> The engine, that must be given back with release
+        """
+        while True:
+            with self.condition:
+                while not self.idle and self.engine_count >= self.size:
+                    if not self.condition.wait(timeout):
+                        raise TimeoutError("No chess engine available")
+                if self.idle:
+                    engine = self.idle.pop()
+                    if engine.is_alive():
+                        return engine
+                    self.engine_count -= 1
+                    self.discard(engine)
+                    continue
+                self.engine_count += 1
+            engine = self.start_engine()
+            if engine is not None:
+                return engine
+            raise OSError("The chess engine could not be started")
+
+    def release(self, engine : ChessEngine) -> None:
+        """
+        Give back an engine to the pool, after telling it that a new game starts.
+        An engine that crashed is discarded, its slot will be filled by a new engine when needed.
+
+        Parameters:
+        - engine: The engine taken with checkout
+        """
+        try:
+            alive = engine.is_alive()
+            if alive:
+                engine.new_game()
+        except (OSError, ValueError):
+            alive = False
+        with self.condition:
+            if alive:
+                self.idle.append(engine)
+            else:
+                self.engine_count -= 1
+                self.discard(engine)
+            self.condition.notify()
+
+    def discard(self, engine : ChessEngine) -> None:
+        """
+        Terminate an engine removed from the pool.
+        """
+        try:
+            engine.close()
+        except (OSError, ValueError):
+            engine.process.kill()
+
+    def close(self) -> None:
+        """
+        Terminate all the idle engines of the pool.
+        """
+        with self.condition:
+            engines, self.idle = self.idle, []
+            self.engine_count -= len(engines)
+        for engine in engines:
+            self.discard(engine)
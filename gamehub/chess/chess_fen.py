@@ -0,0 +1,77 @@
+from gamehub.chess.chess_piece import ChessPiece
+
+class ChessFenCodec:
+    """
+    Class used to parse and serialize the piece placement of FEN strings (e.g. "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR").
+    The digits and the empty rows are looked up in tables, the strings are built with join,
+    and the parser can reuse the pieces of a previous matrix (useful to load many positions in a row).
+    """
+    # Number of empty squares of every digit of a row
+    EMPTY_RUNS = {str(n): n for n in range(1, 9)}
+    # Digit of every number of consecutive empty squares
+    DIGITS = "012345678"
+    EMPTY_ROW = [None] * 8
+
+    def parse_placement(self, placement : str, matrix : list[list[ChessPiece]] = None) -> list[list[ChessPiece]]:
+        """
+        Convert the piece placement of a FEN string to a matrix of ChessPiece objects.
+
+        Parameters:
+        - placement: The piece placement (the first part of the FEN string)
+        - matrix: A matrix whose pieces are reused when the same piece is in the same square (None to create all the pieces)
+
+        Return:
+        - list[list[ChessPiece]] -> The new matrix
+        """
+        rows = placement.split("/")
+        if len(rows) != 8:
+            raise ValueError("Invalid FEN string")
+        result = []
+        for y, row in enumerate(rows):
+            if row == "8":
+                result.append(self.EMPTY_ROW.copy())
+                continue
+            previous_row = matrix[y] if matrix is not None else None
+            cells = []
+            for char in row:
+                run = self.EMPTY_RUNS.get(char)
+                if run is not None:
+                    cells.extend(self.EMPTY_ROW[:run])
+                    continue
+                x = len(cells)
+                piece = previous_row[x] if previous_row is not None and x < 8 else None
+                if piece is None or piece.piece_char != char:
+                    piece = ChessPiece(char, (x, y))
+                cells.append(piece)
+            if len(cells) != 8:
+                raise ValueError("Invalid FEN string")
+            result.append(cells)
+        return result
+
+    def serialize_placement(self, matrix : list[list[ChessPiece]]) -> str:
+        """
+        Convert a matrix of ChessPiece objects to the piece placement of a FEN string.
+
+        Parameters:
+        - matrix: The matrix of the board
+
+        Return:
+        - str -> The piece placement (the first part of the FEN string)
+        """
+        digits = self.DIGITS
+        rows = []
+        for row in matrix:
+            parts = []
+            empty = 0
+            for piece in row:
+                if piece is None:
+                    empty += 1
+                else:
+                    if empty:
+                        parts.append(digits[empty])
+                        empty = 0
+                    parts.append(piece.piece_char)
+            if empty:
+                parts.append(digits[empty])
+            rows.append("".join(parts))
+        return "/".join(rows)
@@ -0,0 +1,110 @@
+"""
+This module contains the ChessFenBenchmark class, used to measure the speed
+of the FEN parser and serializer on a large corpus of positions.
+
+Usage example:
+    python -m gamehub.chess.chess_fen_benchmark --positions 20000
+    python -m gamehub.chess.chess_fen_benchmark --file positions.fen
+"""
+import argparse
+import random
+import time
+
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_fen import ChessFenCodec
+
+class ChessFenBenchmark:
+    """
+    Class used to parse and serialize a corpus of FEN strings with ChessFenCodec, checking the round trip.
+
+    Attributes:
+    - codec: The codec to measure
+    """
+    def __init__(self, codec : ChessFenCodec = None) -> None:
+        self.codec = codec if codec is not None else ChessFenCodec()
+
+    def generate_corpus(self, count : int, seed : int = 0) -> list[str]:
+        """
+        Generate FEN strings of the positions of random games, to benchmark the codec.
+
+        Parameters:
+        - count: The number of FEN strings
+        - seed: The seed of the random games
+
+        Return:
+        - list[str] -> The FEN strings
+        """
+        generator = random.Random(seed)
+        corpus = []
+        while len(corpus) < count:
+            board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+            for _ in range(80):
+                moves = board.get_legal_moves()
+                if not moves or len(corpus) >= count:
+                    break
+                board.make_move(*generator.choice(moves))
+                corpus.append(board.convert_board_to_fen())
+        return corpus
+
+    def benchmark(self, corpus : list[str], reuse : bool = True) -> tuple[float, float, bool]:
+        """
+        Parse and serialize all the FEN strings of the corpus and measure the speed.
+
+        Parameters:
+        - corpus: The FEN strings
+        - reuse: True to reuse the pieces of the previous position while parsing
+
+        Return:
+        - tuple[float, float, bool] -> (parsed positions per second, serialized positions per second,
+          True if every position is unchanged after the round trip)
+        """
+        placements = [fen.split(" ")[0] for fen in corpus]
+        matrices = []
+        matrix = None
+        start_time = time.perf_counter()
+        for placement in placements:
+            matrix = self.codec.parse_placement(placement, matrix if reuse else None)
+            matrices.append(matrix)
+        parse_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        serialized = [self.codec.serialize_placement(matrix) for matrix in matrices]
+        serialize_time = time.perf_counter() - start_time
+
+        return (len(placements) / parse_time if parse_time > 0 else float("inf"),
+                len(placements) / serialize_time if serialize_time > 0 else float("inf"),
+                serialized == placements)
+
+    def main(self, argv : list[str] = None) -> int:
+        """
+        Parse the command line arguments and run the benchmark.
+
+        Return:
+        - int -> The exit code (1 if a position changed in the round trip)
+        """
+        parser = argparse.ArgumentParser(prog="python -m gamehub.chess.chess_fen_benchmark",
+                                         description="Measure the speed of the FEN parser and serializer.")
+        parser.add_argument("--positions",
+                            type=int,
+                            default=20000,
+                            help="The number of positions of the corpus (taken from random games).")
+        parser.add_argument("--file",
+                            type=str,
+                            default=None,
+                            help="A file with a FEN string per line to use as corpus.")
+        args = parser.parse_args(argv)
+
+        if args.file is not None:
+            with open(args.file, "r", encoding="utf-8") as file:
+                corpus = [line.strip() for line in file if line.strip()]
+        else:
+            corpus = self.generate_corpus(args.positions)
+        parse_rate, serialize_rate, round_trip = self.benchmark(corpus)
+        print(f"Positions: {len(corpus)}")
+        print(f"Parse: {parse_rate:.0f} positions/s")
+        print(f"Serialize: {serialize_rate:.0f} positions/s")
+        print(f"Round trip: {'OK' if round_trip else 'FAIL'}")
+        return 0 if round_trip else 1
+
+if __name__ == "__main__":
+    raise SystemExit(ChessFenBenchmark().main())
@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+class ChessMoveCache:
+    """
+    A cache of the best moves found by the engines, put in front of the searches so that the positions
+    that recur in every game (e.g. after the common first moves) are answered without searching.
+    The moves are indexed by engine, normalised FEN (without the move counters) and search limits.
+    When the cache is full the least recently used move is evicted.
+    The cache can be saved to a JSON file and loaded in the next runs.
+
+    Attributes:
+    - capacity: The maximum number of moves of the cache
+    - path: The file where the cache is saved (None to keep it in memory only)
+    - entries: The moves by key, from the least to the most recently used
+    - hits: The number of lookups that found the move
+    - misses: The number of lookups that did not find the move
+    """
+    shared_cache = None
+    shared_cache_lock = threading.Lock()
+
+    def __init__(self, capacity : int = 4096, path : str = None) -> None:
+        if capacity < 1:
+            raise ValueError("Invalid cache capacity")
+        self.capacity = capacity
+        self.path = path
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path is not None:
+            self.load()
+
+    @classmethod
+    def shared(cls, capacity : int = 4096, path : str = None) -> 'ChessMoveCache':
+        """
+        Return the cache shared by the whole process, creating it the first time with the given parameters.
+        """
+        with cls.shared_cache_lock:
+            if cls.shared_cache is None:
+                cls.shared_cache = cls(capacity, path)
+            return cls.shared_cache
+
+    def make_key(self, engine : str, fen : str, limits : ChessSearchLimits) -> str:
+        """
+        Return the key of a search, None if its result cannot be cached.
+        The searches limited by the clocks are not cached, as their result depends on the time left.
+
+        Parameters:
+        - engine: The name of the engine (Stockfish or Builtin)
+        - fen: The FEN string of the position
+        - limits: The limits of the search
+        """
+        if limits.has_clock():
+            return None
+        fields = fen.split()
+        limits_key = ",".join(f"{name}={getattr(limits, name)}" for name in ("movetime", "nodes", "depth"))
+        return engine + "|" + " ".join(fields[:4]) + "|" + limits_key
+
+    def get(self, engine : str, fen : str, limits : ChessSearchLimits) -> tuple:
+        """
+        Look up the move of a search.
+
+        Return:
+        - tuple -> The move as (start, end, promotion), None if it is not in the cache
+        """
+        key = self.make_key(engine, fen, limits)
+        if key is None or key not in self.entries:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return self.entries[key]
+
+    def put(self, engine : str, fen : str, limits : ChessSearchLimits, move : tuple) -> None:
+        """
+        Store the move of a search (as (start, end, promotion)), evicting the least recently used move if the cache is full.
+        """
+        key = self.make_key(engine, fen, limits)
+        if key is None or move is None:
+            return
+        self.entries[key] = self.convert_move(move)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def convert_move(self, move : list) -> tuple:
+        """
+        Convert a move (also read from the file, with lists instead of tuples) to (start, end, promotion).
+        """
+        start, end, promotion = move
+        return tuple(start), tuple(end), promotion
+
+    def is_valid_entry(self, entry : object) -> bool:
+        """
+        Check if an entry read from the file of the cache is a [key, move] pair, with the key a string
+        and the move a [start, end, promotion] list (start and end as [x, y], promotion a character or null).
+        """
+        if not isinstance(entry, list) or len(entry) != 2 or not isinstance(entry[0], str):
+            return False
+        move = entry[1]
+        if not isinstance(move, list) or len(move) != 3:
+            return False
+        start, end, promotion = move
+        return (all(isinstance(square, list) and len(square) == 2 and
+                    all(isinstance(value, int) and not isinstance(value, bool) and 0 <= value < 8 for value in square)
+                    for square in (start, end)) and
+                (promotion is None or (isinstance(promotion, str) and len(promotion) == 1 and promotion.lower() in "qrbn")))
+
+    def load(self) -> None:
+        """
+        Load the moves saved in the file of the cache.
+        A missing or corrupted file (not JSON, or with an entry of the wrong shape) is ignored and the cache stays empty.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, list) or not all(self.is_valid_entry(entry) for entry in saved):
+            return
+        for key, move in saved[-self.capacity:]:
+            self.entries[key] = self.convert_move(move)
+
+    def save(self) -> None:
+        """
+        Save the moves to the file of the cache, if any.
+        The file is replaced atomically, so an interrupted save does not corrupt it.
+        """
+        if self.path is None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump([[key, [list(start), list(end), promotion]] for key, (start, end, promotion) in self.entries.items()], file)
+        os.replace(temporary_path, self.path)
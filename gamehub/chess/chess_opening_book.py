@@ -0,0 +1,165 @@
+"""
+This module contains the ChessOpeningBook class, used to play the first moves of the game
+without searching, and to build the book file from game records
+(the command line builder is ChessOpeningBookBuilder, in chess_opening_book_builder).
+"""
+import mmap
+import os
+import random
+import struct
+import threading
+
+from gamehub.chess.chess_board import ChessBoard
+
+class ChessOpeningBook:
+    """
+    An opening book stored in a binary file of fixed-size records (Zobrist key, move, weight), sorted by key.
+    The file is memory-mapped and the moves of a position are found by binary search, so the book is not loaded in memory.
+    A record is 12 bytes (big-endian): the 64-bit key of the position, the move (start square, end square
+    and promotion packed in 16 bits) and the weight of the move (how many times it was played in the game records).
+
+    Attributes:
+    - path: The path of the book file
+    - record_count: The number of records of the book
+    """
+    RECORD = struct.Struct(">QHH")
+    PROMOTIONS = " nbrq"
+    DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "data", "opening_book.bin")
+    INITIAL_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    shared_book = None
+    shared_book_lock = threading.Lock()
+
+    def __init__(self, path : str = DEFAULT_PATH) -> None:
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # An empty file cannot be mapped
+            self.data = b""
+        if len(self.data) % self.RECORD.size != 0:
+            self.close()
+            raise ValueError("Invalid opening book file")
+        self.record_count = len(self.data) // self.RECORD.size
+
+    @classmethod
+    def shared(cls) -> 'ChessOpeningBook':
+        """
+        Return the built-in book shared by the whole process, opening it the first time.
+
+        Return:
+        - ChessOpeningBook -> The book, None if the book file is missing or invalid
+        """
+        with cls.shared_book_lock:
+            if cls.shared_book is None:
+                try:
+                    cls.shared_book = cls()
+                except (OSError, ValueError):
+                    return None
+            return cls.shared_book
+
+    @classmethod
+    def encode_move(cls, start : tuple[int, int], end : tuple[int, int], promotion : str = None) -> int:
+        """
+        Pack a move in 16 bits: start square (6 bits), end square (6 bits), promotion (3 bits).
+        """
+        promotion_index = cls.PROMOTIONS.index(promotion.lower()) if promotion is not None else 0
+        return (promotion_index << 12) | ((start[1] * 8 + start[0]) << 6) | (end[1] * 8 + end[0])
+
+    @classmethod
+    def decode_move(cls, move : int) -> tuple:
+        """
+        Unpack a move encoded with encode_move.
+
+        Return:
+        - tuple -> (start, end, promotion) with the promotion in lowercase, or None
+        """
+        start, end, promotion_index = (move >> 6) & 63, move & 63, move >> 12
+        promotion = cls.PROMOTIONS[promotion_index] if promotion_index > 0 else None
+        return (start % 8, start // 8), (end % 8, end // 8), promotion
+
+    def get_moves(self, key : int) -> list[tuple[tuple, int]]:
+        """
+        Find the moves of a position with a binary search on the records.
+
+        Parameters:
+        - key: The Zobrist key of the position
+
+        Return:
+        - list[tuple[tuple, int]] -> The moves as ((start, end, promotion), weight)
+        """
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.RECORD.unpack_from(self.data, middle * self.RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        moves = []
+        while low < self.record_count:
+            record_key, move, weight = self.RECORD.unpack_from(self.data, low * self.RECORD.size)
+            if record_key != key:
+                break
+            moves.append((self.decode_move(move), weight))
+            low += 1
+        return moves
+
+    def choose_move(self, board : ChessBoard, generator : random.Random = random) -> tuple:
+        """
+        Choose a move of the book for the position, at random with probability proportional to its weight.
+        The moves that are not legal in the position (e.g. after a hash collision) are ignored.
+
+        Parameters:
+        - board: The position
+        - generator: The random number generator
+
+        Return:
+        - tuple -> The move as (start, end, promotion) with promotion in lowercase or None, None if the position is not in the book
+        """
+        legal_moves = {(start, end, promotion.lower() if promotion is not None else None) for start, end, promotion in board.get_legal_moves()}
+        candidates = [(move, weight) for move, weight in self.get_moves(board.zobristKey) if move in legal_moves]
+        if not candidates:
+            return None
+        return generator.choices([move for move, _ in candidates], weights=[weight for _, weight in candidates])[0]
+
+    def close(self) -> None:
+        """
+        Unmap and close the book file.
+        """
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    @classmethod
+    def build(cls, games : list[str], path : str, max_ply : int = 16, fen : str = INITIAL_FEN) -> int:
+        """
+        Build a book file from game records.
+        The weight of a move is the number of games where it was played in the position (at most 65535).
+        A game is read until its first illegal move.
+
+        Parameters:
+        - games: The games, as strings of moves in coordinate notation (e.g. "e2e4 e7e5 g1f3")
+        - path: The path of the book file to write
+        - max_ply: The number of moves (of both players) of every game added to the book
+        - fen: The position where the games start
+
+        Return:
+        - int -> The number of records of the book
+        """
+        weights = {}
+        for game in games:
+            board = ChessBoard(fen)
+            for text in game.split()[:max_ply]:
+                start = (ord(text[0]) - 97, 8 - int(text[1]))
+                end = (ord(text[2]) - 97, 8 - int(text[3]))
+                legal = [move for move in board.get_legal_moves() if move[0] == start and move[1] == end]
+                if not legal:
+                    break
+                promotion = text[4] if len(text) > 4 else legal[0][2]
+                record = (board.zobristKey, cls.encode_move(start, end, promotion))
+                weights[record] = min(weights.get(record, 0) + 1, 65535)
+                board.make_move(start, end, promotion)
+
+        with open(path, "wb") as file:
+            for (key, move), weight in sorted(weights.items()):
+                file.write(cls.RECORD.pack(key, move, weight))
+        return len(weights)
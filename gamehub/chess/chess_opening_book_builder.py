@@ -0,0 +1,47 @@
+"""
+This module contains the ChessOpeningBookBuilder class, used to build the opening book file
+of ChessOpeningBook from game records.
+It is not imported by the package, so it can be run as a script without loading the book module twice.
+
+Usage example (rebuild the built-in book):
+    python -m gamehub.chess.chess_opening_book_builder --games gamehub/chess/data/opening_games.txt --output gamehub/chess/data/opening_book.bin
+"""
+import argparse
+
+from gamehub.chess.chess_opening_book import ChessOpeningBook
+
+class ChessOpeningBookBuilder:
+    """
+    Class used to build an opening book file from the command line, with ChessOpeningBook.build.
+    """
+    def main(self, argv : list[str] = None) -> int:
+        """
+        Parse the command line arguments and build a book file.
+
+        Return:
+        - int -> The exit code
+        """
+        parser = argparse.ArgumentParser(prog="python -m gamehub.chess.chess_opening_book_builder",
+                                         description="Build an opening book from game records.")
+        parser.add_argument("--games",
+                            type=str,
+                            required=True,
+                            help="The file of the games, one per line in coordinate notation (lines starting with # are ignored).")
+        parser.add_argument("--output",
+                            type=str,
+                            default=ChessOpeningBook.DEFAULT_PATH,
+                            help="The book file to write.")
+        parser.add_argument("--max-ply",
+                            type=int,
+                            default=16,
+                            help="The number of moves of every game added to the book.")
+        args = parser.parse_args(argv)
+
+        with open(args.games, "r", encoding="utf-8") as file:
+            games = [line for line in file if line.strip() and not line.startswith("#")]
+        records = ChessOpeningBook.build(games, args.output, args.max_ply)
+        print(f"{records} records from {len(games)} games written to {args.output}")
+        return 0
+
+if __name__ == "__main__":
+    raise SystemExit(ChessOpeningBookBuilder().main())
@@ -0,0 +1,208 @@
+"""
+This module contains the ChessPerft class, used to check the correctness
+and to measure the speed of the chess move generator without the curses interface.
+
+Usage example:
+    python -m gamehub.chess.chess_perft --suite --depth 3
+    python -m gamehub.chess.chess_perft --fen "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1" --depth 2 --divide
+    python -m gamehub.chess.chess_perft --depth 5 --workers 4
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from gamehub.chess.chess_board import ChessBoard
+
+class ChessPerft:
+    """
+    Class used to count the leaf nodes of the move tree (perft) of a chess position.
+    The moves are generated with ChessBoard.get_legal_moves and applied with make_move/unmake_move.
+    With more than one worker the subtrees of the root moves are counted by a pool of processes,
+    which receive the positions after the root moves as FEN strings.
+
+    Attributes:
+    - SUITE: The benchmark positions as (name, fen, {depth: expected nodes})
+    - workers: The number of processes (1 to count in the current process)
+    """
+    # Reference node counts (https://www.chessprogramming.org/Perft_Results)
+    SUITE = [
+        ("Initial position", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", {1: 20, 2: 400, 3: 8902, 4: 197281}),
+        ("Kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", {1: 48, 2: 2039, 3: 97862}),
+        ("Position 3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", {1: 14, 2: 191, 3: 2812, 4: 43238}),
+        ("Position 4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", {1: 6, 2: 264, 3: 9467}),
+        ("Position 5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", {1: 44, 2: 1486, 3: 62379}),
+        ("Position 6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10", {1: 46, 2: 2079, 3: 89890}),
+    ]
+
+    def __init__(self, workers : int = 1) -> None:
+        self.workers = workers
+
+    def perft(self, board : ChessBoard, depth : int) -> int:
+        """
+        Count the leaf nodes of the move tree of the given depth.
+        The board is left unchanged.
+
+        Parameters:
+        - board: The position to start from
+        - depth: The depth of the move tree
+
+        Return:
+        - int -> The number of leaf nodes
+        """
+        if depth == 0:
+            return 1
+        moves = board.get_legal_moves()
+        if depth == 1:
+            return len(moves)
+        nodes = 0
+        for start, end, promotion in moves:
+            undo = board.make_move(start, end, promotion)
+            nodes += self.perft(board, depth - 1)
+            board.unmake_move(undo)
+        return nodes
+
+    def divide(self, board : ChessBoard, depth : int) -> dict[str, int]:
+        """
+        Count the leaf nodes of the move tree of the given depth for every root move.
+        With more than one worker every root move is counted by a process of the pool;
+        the results are in the order of the root moves whatever the order the processes finish in.
+
+        Parameters:
+        - board: The position to start from
+        - depth: The depth of the move tree (at least 1)
+
+        Return:
+        - dict[str, int] -> The number of leaf nodes by root move (in coordinate notation, e.g. "e2e4")
+        """
+        if self.workers > 1 and depth > 1:
+            return self.divide_parallel(board, depth)
+        results = {}
+        for start, end, promotion in board.get_legal_moves():
+            undo = board.make_move(start, end, promotion)
+            results[board.convert_move_to_algebraic(start, end, promotion)] = self.perft(board, depth - 1)
+            board.unmake_move(undo)
+        return results
+
+    def divide_parallel(self, board : ChessBoard, depth : int) -> dict[str, int]:
+        """
+        Count the leaf nodes for every root move with a pool of processes (one task per root move).
+
+        Parameters:
+        - board: The position to start from
+        - depth: The depth of the move tree (at least 1)
+
+        Return:
+        - dict[str, int] -> The number of leaf nodes by root move (in coordinate notation, e.g. "e2e4")
+        """
+        names, fens = [], []
+        for start, end, promotion in board.get_legal_moves():
+            undo = board.make_move(start, end, promotion)
+            names.append(board.convert_move_to_algebraic(start, end, promotion))
+            fens.append(board.convert_board_to_fen())
+            board.unmake_move(undo)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            counts = executor.map(type(self).perft_fen, fens, [depth - 1] * len(fens))
+            return dict(zip(names, counts))
+
+    @classmethod
+    def perft_fen(cls, fen : str, depth : int) -> int:
+        """
+        Count the leaf nodes of the move tree of a position given as FEN string (the function run by the processes of the pool).
+        """
+        return cls().perft(ChessBoard(fen), depth)
+
+    def benchmark(self, board : ChessBoard, depth : int) -> tuple[int, float, float]:
+        """
+        Run perft and measure its speed (with the pool of processes if there is more than one worker).
+
+        Parameters:
+        - board: The position to start from
+        - depth: The depth of the move tree
+
+        Return:
+        - tuple[int, float, float] -> (nodes, seconds, nodes per second)
+        """
+        start_time = time.perf_counter()
+        if self.workers > 1 and depth > 1:
+            nodes = sum(self.divide_parallel(board, depth).values())
+        else:
+            nodes = self.perft(board, depth)
+        elapsed = time.perf_counter() - start_time
+        return nodes, elapsed, nodes / elapsed if elapsed > 0 else float("inf")
+
+    def run_suite(self, max_depth : int = 3, output=print) -> bool:
+        """
+        Run the benchmark suite up to the given depth, checking the node counts.
+
+        Parameters:
+        - max_depth: The maximum depth to run for every position
+        - output: The function used to report the results (print by default)
+
+        Return:
+        - bool -> True if all the node counts match the expected ones
+        """
+        all_correct = True
+        for name, fen, expected_nodes in self.SUITE:
+            for depth, expected in sorted(expected_nodes.items()):
+                if depth > max_depth:
+                    break
+                nodes, elapsed, nps = self.benchmark(ChessBoard(fen), depth)
+                correct = nodes == expected
+                all_correct = all_correct and correct
+                output(f"{name} depth {depth}: {nodes} nodes (expected {expected}) "
+                       f"{'OK' if correct else 'FAIL'} in {elapsed:.3f}s, {nps:.0f} nodes/s")
+        return all_correct
+
+    def main(self, argv : list[str] = None) -> int:
+        """
+        Parse the command line arguments and run perft or the benchmark suite.
+
+        Return:
+        - int -> The exit code (1 if a node count of the suite is wrong)
+        """
+        parser = argparse.ArgumentParser(prog="python -m gamehub.chess.chess_perft",
+                                         description="Count and time the nodes of the chess move tree.")
+        parser.add_argument("--fen",
+                            type=str,
+                            default="rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+                            help="The position to start from.")
+        parser.add_argument("--depth",
+                            type=int,
+                            default=3,
+                            help="The depth of the move tree (maximum depth with --suite).")
+        parser.add_argument("--divide",
+                            action="store_true",
+                            help="Report the node count of every root move.")
+        parser.add_argument("--suite",
+                            action="store_true",
+                            help="Run the benchmark suite of positions with known node counts.")
+        parser.add_argument("--workers",
+                            type=int,
+                            default=1,
+                            help="The number of processes counting the subtrees of the root moves.")
+        args = parser.parse_args(argv)
+        if args.workers < 1:
+            parser.error("--workers must be at least 1")
+        self.workers = args.workers
+
+        if args.suite:
+            return 0 if self.run_suite(args.depth) else 1
+
+        board = ChessBoard(args.fen)
+        if args.divide:
+            start_time = time.perf_counter()
+            results = self.divide(board, args.depth)
+            elapsed = time.perf_counter() - start_time
+            for move, move_nodes in sorted(results.items()):
+                print(f"{move}: {move_nodes}")
+            nodes = sum(results.values())
+            nps = nodes / elapsed if elapsed > 0 else float("inf")
+        else:
+            nodes, elapsed, nps = self.benchmark(board, args.depth)
+        print(f"Nodes: {nodes}")
+        print(f"Time: {elapsed:.3f}s")
+        print(f"Nodes/s: {nps:.0f}")
+        return 0
+
+if __name__ == "__main__":
+    raise SystemExit(ChessPerft().main())
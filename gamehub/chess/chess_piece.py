@@ -1,8 +1,13 @@
-import copy
+KNIGHT_OFFSETS = [(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)]
+KING_OFFSETS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+ROOK_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRECTIONS = [(1, 1), (-1, -1), (1, -1), (-1, 1)]
 
 class ChessPiece:
     """
     A class to represent a chess piece.
+    The instances have no __dict__ (__slots__) and share the strings of the class tables,
+    so they are small and fast to create, copy and compare.
 
     Attributes
     - piece: The type of the piece (Pawn, Rook, Knight, Bishop, Queen, King)
@@ -11,61 +16,36 @@ class ChessPiece:
     - piece_symbol: The unicode symbol of the piece (♟, ♙, ♜, ♖, ♞, ♘, ♝, ♗, ♛, ♕, ♚, ♔)
     - piece_char: The character of the piece (P, R, N, B, Q, K, p, r, n, b, q, k)
     """
-    def __init__(self, piece_char: str, position: tuple[int, int]) -> None:
-        # if the piece is uppercase it is white, otherwise it is black
-        self.piece_char = piece_char
-
-        if piece_char in ['P', 'R', 'N', 'B', 'Q', 'K']:
-            self.color = 'w'
-        elif piece_char in ['p', 'r', 'n', 'b', 'q', 'k']:
-            self.color = 'b'
-        else:
-            raise ValueError("Invalid piece character")
+    __slots__ = ("piece_char", "color", "piece", "piece_symbol", "position")
 
-        # set the piece type and the piece symbol
-        if piece_char == 'P':
-            self.piece = 'Pawn'
-            self.piece_symbol = '♟'
-        elif piece_char == 'p':
-            self.piece = 'Pawn'
-            self.piece_symbol = '♙'
-        elif piece_char == 'R':
-            self.piece = 'Rook'
-            self.piece_symbol = '♜'
-        elif piece_char == 'r':
-            self.piece = 'Rook'
-            self.piece_symbol = '♖'
-        elif piece_char == 'N':
-            self.piece = 'Knight'
-            self.piece_symbol = '♞'
-        elif piece_char == 'n':
-            self.piece = 'Knight'
-            self.piece_symbol = '♘'
-        elif piece_char == 'B':
-            self.piece = 'Bishop'
-            self.piece_symbol = '♝'
-        elif piece_char == 'b':
-            self.piece = 'Bishop'
-            self.piece_symbol = '♗'
-        elif piece_char == 'Q':
-            self.piece = 'Queen'
-            self.piece_symbol = '♛'
-        elif piece_char == 'q':
-            self.piece = 'Queen'
-            self.piece_symbol = '♕'
-        elif piece_char == 'K':
-            self.piece = 'King'
-            self.piece_symbol = '♚'
-        elif piece_char == 'k':
-            self.piece = 'King'
-            self.piece_symbol = '♔'
-        else:
-            raise ValueError("Invalid piece")
+    PIECE_NAMES = {"P": "Pawn", "R": "Rook", "N": "Knight", "B": "Bishop", "Q": "Queen", "K": "King",
+                   "p": "Pawn", "r": "Rook", "n": "Knight", "b": "Bishop", "q": "Queen", "k": "King"}
+    PIECE_SYMBOLS = {"P": "♟", "R": "♜", "N": "♞", "B": "♝", "Q": "♛", "K": "♚",
+                     "p": "♙", "r": "♖", "n": "♘", "b": "♗", "q": "♕", "k": "♔"}
+    # if the piece is uppercase it is white, otherwise it is black
+    PIECE_COLORS = {char: "w" if char.isupper() else "b" for char in PIECE_NAMES}
+    # The characters stored in the pieces are the keys of this table, so equal characters are the same object
+    PIECE_CHARS = {char: char for char in PIECE_NAMES}
 
-        if position[0] >= 0 and position[0] < 8 and position[1] >= 0 and position[1] < 8:
-            self.position = position
-        else:
+    def __init__(self, piece_char: str, position: tuple[int, int]) -> None:
+        if piece_char not in self.PIECE_NAMES:
+            raise ValueError("Invalid piece character")
+        if not (0 <= position[0] < 8 and 0 <= position[1] < 8):
             raise ValueError("Invalid position")
+        self.piece_char = self.PIECE_CHARS[piece_char]
+        self.color = self.PIECE_COLORS[piece_char]
+        self.piece = self.PIECE_NAMES[piece_char]
+        self.piece_symbol = self.PIECE_SYMBOLS[piece_char]
+        self.position = position
+
+    def __copy__(self) -> 'ChessPiece':
+        piece = ChessPiece.__new__(ChessPiece)
+        piece.piece_char = self.piece_char
+        piece.color = self.color
+        piece.piece = self.piece
+        piece.piece_symbol = self.piece_symbol
+        piece.position = self.position
+        return piece
 
     def __repr__(self) -> str:
         return f"ChessPiece(piece={self.piece}, color='{self.color}', position={self.position})"
@@ -73,9 +53,9 @@ class ChessPiece:
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, ChessPiece):
             return False
-        return (self.piece == value.piece and
-                self.color == value.color and
-                self.position == value.position)
+        return self.piece_char == value.piece_char and self.position == value.position
+
+    __hash__ = None
 
     def get_piece_char(self) -> str:
         """
@@ -92,7 +72,7 @@ class ChessPiece:
         """
         return self.color != piece.color
 
-    def legal_moves(self, matrix : list[list['ChessPiece']], check_king_under_attack=True) -> list[tuple[int, int]]:
+    def legal_moves(self, matrix : list[list['ChessPiece']], check_king_under_attack=True, king_position=None) -> list[tuple[int, int]]:
         """
         Return the legal moves of the piece.
         If check_king_under_attack is True, the moves that put the king under attack are removed.
@@ -100,6 +80,7 @@ class ChessPiece:
         Parameters:
         - matrix: The matrix of the chess board
         - check_king_under_attack: A boolean to check if the king is under attack
+        - king_position: The position of the king of my color (searched in the matrix if None)
 
         Return:
         - The legal moves of the piece
@@ -122,14 +103,24 @@ class ChessPiece:
 
         #remove moves that put the king under attack
         if check_king_under_attack:
-            for move in moves[:]: #iterate over a copy of the list (to avoid removing elements while iterating over the list)
-                new_matrix = copy.deepcopy(matrix)
-                piece = new_matrix[self.position[1]][self.position[0]]
-                piece.position = move
-                new_matrix[self.position[1]][self.position[0]] = None
-                new_matrix[move[1]][move[0]] = piece
-                if self.king_under_attack(new_matrix):
-                    moves.remove(move)
+            start = self.position
+            if king_position is None and self.piece != 'King':
+                king_position = self.find_king(matrix)
+            safe_moves = []
+            for move in moves:
+                # make the move in place, check the king and unmake it (restoring the captured piece)
+                captured = matrix[move[1]][move[0]]
+                matrix[start[1]][start[0]] = None
+                matrix[move[1]][move[0]] = self
+                self.position = move
+                try:
+                    if not self.king_under_attack(matrix, move if self.piece == 'King' else king_position):
+                        safe_moves.append(move)
+                finally:
+                    self.position = start
+                    matrix[start[1]][start[0]] = self
+                    matrix[move[1]][move[0]] = captured
+            moves = safe_moves
         return moves
 
     def rook_moves(self, matrix : list[list['ChessPiece']]) -> list[tuple[int, int]]:
@@ -335,25 +326,71 @@ class ChessPiece:
             moves.append((x-1, y-1))
         return moves
     
+    def find_king(self, matrix : list[list['ChessPiece']]) -> tuple[int, int]:
+        """
+        Return the position of the king of my color in the matrix (None if there is no king).
+        """
+        for i in range(8):
+            for j in range(8):
+                if matrix[i][j] is not None and matrix[i][j].piece == 'King' and matrix[i][j].color == self.color:
+                    return (j, i)
+        return None
+
+    @staticmethod
+    def square_under_attack(matrix : list[list['ChessPiece']], square : tuple[int, int], attacker_color : str) -> bool:
+        """
+        Check if a square is attacked by a piece of the given color.
+        Instead of generating the moves of every enemy piece, look outward from the square
+        along the rook and bishop rays, the knight jumps, the pawn diagonals and the adjacent squares.
+
+        Parameters:
+        - matrix: The matrix of the chess board
+        - square: The square to check (x, y)
+        - attacker_color: The color of the attacking pieces
+
+        Return:
+        - bool -> True if the square is attacked
+        """
+        x, y = square
+        for directions, sliders in ((ROOK_DIRECTIONS, ('Rook', 'Queen')), (BISHOP_DIRECTIONS, ('Bishop', 'Queen'))):
+            for dx, dy in directions:
+                i, j = x + dx, y + dy
+                while 0 <= i < 8 and 0 <= j < 8:
+                    piece = matrix[j][i]
+                    if piece is not None:
+                        if piece.color == attacker_color and piece.piece in sliders:
+                            return True
+                        break
+                    i += dx
+                    j += dy
+        for offsets, attacker in ((KNIGHT_OFFSETS, 'Knight'), (KING_OFFSETS, 'King')):
+            for dx, dy in offsets:
+                i, j = x + dx, y + dy
+                if 0 <= i < 8 and 0 <= j < 8:
+                    piece = matrix[j][i]
+                    if piece is not None and piece.color == attacker_color and piece.piece == attacker:
+                        return True
+        # white pawns capture towards y - 1, so they attack the square from y + 1 (and vice versa)
+        j = y + 1 if attacker_color == 'w' else y - 1
+        if 0 <= j < 8:
+            for i in (x - 1, x + 1):
+                if 0 <= i < 8:
+                    piece = matrix[j][i]
+                    if piece is not None and piece.color == attacker_color and piece.piece == 'Pawn':
+                        return True
+        return False
+
     # check if the king of my color is under attack
-    def king_under_attack(self, matrix : list[list['ChessPiece']]) -> bool:
+    def king_under_attack(self, matrix : list[list['ChessPiece']], king_position : tuple[int, int] = None) -> bool:
         """
         Check if the king of my color is under attack in the matrix.
 
         Parameters:
         - matrix: The matrix where I want to check if the king is under attack
+        - king_position: The position of the king of my color (searched in the matrix if None)
         """
-        # Determine the position of the king of my color
-        for i in range(8):
-            for j in range(8):
-                if matrix[i][j] is not None and matrix[i][j].piece_char == 'K' and self.color == 'w':
-                    king_position = (j, i)
-                if matrix[i][j] is not None and matrix[i][j].piece_char == 'k' and self.color == 'b':
-                    king_position = (j, i)
-        for i in range(8):
-            for j in range(8):
-                if matrix[i][j] is not None and matrix[i][j].is_enemy(self):
-                    piece_moves = matrix[i][j].legal_moves(matrix, False)
-                    if king_position in piece_moves:
-                        return True
-        return False
+        if king_position is None:
+            king_position = self.find_king(matrix)
+            if king_position is None:
+                return False
+        return self.square_under_attack(matrix, king_position, 'b' if self.color == 'w' else 'w')
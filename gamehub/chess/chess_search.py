@@ -0,0 +1,609 @@
+import multiprocessing
+import time
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from gamehub.chess.chess_bitboard import ChessBitboard
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_piece import ChessPiece
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+from gamehub.chess.chess_transposition_table import TranspositionTable
+
+class SearchAborted(Exception):
+    """
+    Raised inside the search when the time or node budget is exhausted, or when the search is stopped.
+    """
+
+class ChessSearch:
+    """
+    A pure-Python chess engine that runs in-process on ChessBoard, alternative to the Stockfish ChessEngine.
+    It uses iterative deepening, alpha-beta with move ordering (MVV-LVA, killer moves, history heuristic)
+    and a quiescence search on captures, within a time and node budget.
+    With more than one worker the root moves are split between processes, each one searching its subtrees
+    with iterative deepening, and the results are merged at the deepest depth completed by all of them.
+
+    Attributes:
+    - max_time: The maximum time of a search in seconds (None for no limit)
+    - max_nodes: The maximum number of nodes of a search (None for no limit)
+    - max_depth: The maximum depth of the iterative deepening
+    - nodes: The number of nodes visited by the last search
+    - time_used: The time in seconds spent by the last search
+    - depth: The depth of the last completed iteration of the last search
+    - score: The score (in centipawns, from the point of view of the player to move) of the last search
+    - transposition_table: The table of the results of the positions already searched (kept between searches)
+    - stop_event: The event set by stop to interrupt the running search
+    - workers: The number of processes used to search the root moves (1 to search in the current thread)
+    - pool_stop_event: The event shared with the processes of the pool, set to stop the root moves they are searching
+    """
+    # The search used by the current process when it works for the pool of another search
+    worker_search = None
+    # The stop event of the pool the current process works for, set by init_worker
+    worker_stop_event = None
+    PIECE_VALUES = {"Pawn": 100, "Knight": 320, "Bishop": 330, "Rook": 500, "Queen": 900, "King": 0}
+    MATE_SCORE = 100000
+    # Scores beyond this threshold are mate scores (MATE_SCORE minus the distance to the mate)
+    MATE_THRESHOLD = MATE_SCORE - 1000
+    # Piece-square tables from the point of view of white (row 0 is the 8th rank), mirrored for black
+    PIECE_SQUARE_TABLES = {
+        "Pawn": [[0, 0, 0, 0, 0, 0, 0, 0],
+                 [50, 50, 50, 50, 50, 50, 50, 50],
+                 [10, 10, 20, 30, 30, 20, 10, 10],
+                 [5, 5, 10, 25, 25, 10, 5, 5],
+                 [0, 0, 0, 20, 20, 0, 0, 0],
+                 [5, -5, -10, 0, 0, -10, -5, 5],
+                 [5, 10, 10, -20, -20, 10, 10, 5],
+                 [0, 0, 0, 0, 0, 0, 0, 0]],
+        "Knight": [[-50, -40, -30, -30, -30, -30, -40, -50],
+                   [-40, -20, 0, 0, 0, 0, -20, -40],
+                   [-30, 0, 10, 15, 15, 10, 0, -30],
+                   [-30, 5, 15, 20, 20, 15, 5, -30],
+                   [-30, 0, 15, 20, 20, 15, 0, -30],
+                   [-30, 5, 10, 15, 15, 10, 5, -30],
+                   [-40, -20, 0, 5, 5, 0, -20, -40],
+                   [-50, -40, -30, -30, -30, -30, -40, -50]],
+        "Bishop": [[-20, -10, -10, -10, -10, -10, -10, -20],
+                   [-10, 0, 0, 0, 0, 0, 0, -10],
+                   [-10, 0, 5, 10, 10, 5, 0, -10],
+                   [-10, 5, 5, 10, 10, 5, 5, -10],
+                   [-10, 0, 10, 10, 10, 10, 0, -10],
+                   [-10, 10, 10, 10, 10, 10, 10, -10],
+                   [-10, 5, 0, 0, 0, 0, 5, -10],
+                   [-20, -10, -10, -10, -10, -10, -10, -20]],
+        "Rook": [[0, 0, 0, 0, 0, 0, 0, 0],
+                 [5, 10, 10, 10, 10, 10, 10, 5],
+                 [-5, 0, 0, 0, 0, 0, 0, -5],
+                 [-5, 0, 0, 0, 0, 0, 0, -5],
+                 [-5, 0, 0, 0, 0, 0, 0, -5],
+                 [-5, 0, 0, 0, 0, 0, 0, -5],
+                 [-5, 0, 0, 0, 0, 0, 0, -5],
+                 [0, 0, 0, 5, 5, 0, 0, 0]],
+        "Queen": [[-20, -10, -10, -5, -5, -10, -10, -20],
+                  [-10, 0, 0, 0, 0, 0, 0, -10],
+                  [-10, 0, 5, 5, 5, 5, 0, -10],
+                  [-5, 0, 5, 5, 5, 5, 0, -5],
+                  [0, 0, 5, 5, 5, 5, 0, -5],
+                  [-10, 5, 5, 5, 5, 5, 0, -10],
+                  [-10, 0, 5, 0, 0, 0, 0, -10],
+                  [-20, -10, -10, -5, -5, -10, -10, -20]],
+        "King": [[-30, -40, -40, -50, -50, -40, -40, -30],
+                 [-30, -40, -40, -50, -50, -40, -40, -30],
+                 [-30, -40, -40, -50, -50, -40, -40, -30],
+                 [-30, -40, -40, -50, -50, -40, -40, -30],
+                 [-20, -30, -30, -40, -40, -30, -30, -20],
+                 [-10, -20, -20, -20, -20, -20, -20, -10],
+                 [20, 20, 0, 0, 0, 0, 20, 20],
+                 [20, 30, 10, 0, 0, 10, 30, 20]],
+    }
+
+    def __init__(self, max_time : float = 1.0, max_nodes : int = None, max_depth : int = 64, hash_size : int = 16, workers : int = 1) -> None:
+        self.max_time = max_time
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.nodes = 0
+        self.time_used = 0.0
+        self.depth = 0
+        self.score = 0
+        self.deadline = None
+        self.node_limit = None
+        self.killers = []
+        self.history = {}
+        self.transposition_table = TranspositionTable(hash_size)
+        self.stop_event = threading.Event()
+        self.hash_size = hash_size
+        self.workers = workers
+        self.executor = None
+        self.pool_stop_event = None
+
+    def get_move(self, fen : str, on_info=None, limits : ChessSearchLimits = None) -> tuple:
+        """
+        Function that returns the best move found by the search for a given FEN string.
+
+        Parameters:
+        - fen: The FEN string of the current board state
+        - on_info: A function called with the info of every completed iteration (see search)
+        - limits: The limits of the search, that replace max_time, max_nodes and max_depth (see search)
+
+        Return:
+        - tuple -> The move as (start, end, promotion), None if there are no legal moves
+        """
+        self.stop_event.clear()
+        return self.run_search(fen, on_info, limits)
+
+    def get_move_async(self, fen : str, on_info=None, limits : ChessSearchLimits = None) -> Future:
+        """
+        Function that starts the search of the best move in a background thread, without blocking.
+        The search can be interrupted with stop: the best move of the last completed iteration is returned.
+
+        Parameters:
+        - fen: The FEN string of the current board state
+        - on_info: A function called (from the background thread) with the info of every completed iteration
+        - limits: The limits of the search, that replace max_time, max_nodes and max_depth (see search)
+
+        Return:
+        - Future -> The future result of get_move
+        """
+        # Cleared here and not in the thread, so a stop called right after this function is not lost
+        self.stop_event.clear()
+        future = Future()
+
+        def run_search() -> None:
+            try:
+                future.set_result(self.run_search(fen, on_info, limits))
+            except Exception as exception:
+                future.set_exception(exception)
+
+        threading.Thread(target=run_search, daemon=True).start()
+        return future
+
+    def run_search(self, fen : str, on_info=None, limits : ChessSearchLimits = None) -> tuple:
+        """
+        Search the position of the FEN string.
+
+        Return:
+        - tuple -> The best move as (start, end, promotion), None if there are no legal moves
+        """
+        return self.search(ChessBoard(fen), on_info, limits)
+
+    def stop(self) -> None:
+        """
+        Function that stops the running search as soon as possible.
+        """
+        self.stop_event.set()
+
+    def search(self, board : ChessBoard, on_info=None, limits : ChessSearchLimits = None) -> tuple:
+        """
+        Run the iterative deepening search on the board, until the budget is exhausted or the search is stopped.
+        The board is left unchanged.
+
+        Parameters:
+        - board: The position to search
+        - on_info: A function called after every completed iteration with a dict of
+          depth, score_cp or score_mate, nodes, nps, time (in milliseconds) and pv (list of moves, e.g. ["e2e4", "e7e5"])
+        - limits: The limits of the search. If they are set, the time (movetime or the share of the clock of the player to move),
+          the nodes and the depth are taken from them instead of max_time, max_nodes and max_depth
+
+        Return:
+        - tuple -> The best move as (start, end, promotion), None if there are no legal moves
+        """
+        start_time = time.perf_counter()
+        if limits is not None and limits.has_limits():
+            max_time, self.node_limit = limits.time_budget(board.playerToMove), limits.nodes
+            max_depth = limits.depth if limits.depth is not None else self.max_depth
+        else:
+            max_time, self.node_limit, max_depth = self.max_time, self.max_nodes, self.max_depth
+        self.reset(start_time, max_time, max_depth)
+
+        moves = board.get_legal_moves()
+        if not moves:
+            self.time_used = time.perf_counter() - start_time
+            return None
+        if self.workers > 1 and len(moves) > 1:
+            return self.search_parallel(board, moves, max_time, max_depth, on_info, start_time)
+        best_move = self.order_moves(board, moves, 0, None)[0]
+        for depth in range(1, max_depth + 1):
+            try:
+                score, move = self.search_root(board, moves, depth, best_move)
+            except SearchAborted:
+                break
+            best_move, self.score, self.depth = move, score, depth
+            if on_info is not None:
+                on_info(self.get_info(board, start_time))
+            # A forced mate has been found, searching deeper cannot change the result
+            if abs(score) >= self.MATE_THRESHOLD:
+                break
+        self.time_used = time.perf_counter() - start_time
+        return best_move
+
+    def reset(self, start_time : float, max_time : float, max_depth : int) -> None:
+        """
+        Reset the counters, the budget and the move ordering tables before a search.
+
+        Parameters:
+        - start_time: The time when the search started (time.perf_counter)
+        - max_time: The time of the search in seconds (None for no limit)
+        - max_depth: The maximum depth of the search
+        """
+        self.nodes = 0
+        self.depth = 0
+        self.score = 0
+        self.deadline = start_time + max_time if max_time is not None else None
+        self.killers = [[None, None] for _ in range(max_depth + 1)]
+        self.history = {}
+        self.transposition_table.new_search()
+
+    def search_parallel(self, board : ChessBoard, moves : list[tuple], max_time : float, max_depth : int, on_info, start_time : float) -> tuple:
+        """
+        Split the root moves between the processes of the pool (root splitting).
+        Every root move is searched with iterative deepening by a process, with an equal share of the time and node budget.
+        The best move is the best one at the deepest depth completed for all the root moves
+        (ties are broken by the order of the moves, so the result does not depend on the scheduling).
+
+        Return:
+        - tuple -> The best move as (start, end, promotion)
+        """
+        if self.executor is None:
+            self.pool_stop_event = multiprocessing.Event()
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=ChessSearch.init_worker,
+                                                initargs=(self.pool_stop_event,))
+        # The tasks of the previous search have all ended (see below), so the event can be cleared
+        self.pool_stop_event.clear()
+        moves = self.order_moves(board, moves, 0, None)
+        fen = board.convert_board_to_fen()
+        # Every process searches len(moves) / workers root moves one after the other
+        task_time = max_time * self.workers / len(moves) if max_time is not None else None
+        task_nodes = max(1, self.node_limit // len(moves)) if self.node_limit is not None else None
+        futures = [self.executor.submit(ChessSearch.search_root_move, fen, move, max_depth, task_time, task_nodes, self.hash_size)
+                   for move in moves]
+
+        pending = set(futures)
+        while pending and not self.stop_event.is_set() and (self.deadline is None or time.perf_counter() < self.deadline):
+            _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+        if pending:
+            # The tasks not started yet are cancelled, the running ones are stopped through the shared event
+            # and waited for (they end at their next node), so they do not keep the processes busy for the next search
+            self.pool_stop_event.set()
+            for future in pending:
+                future.cancel()
+            wait(pending)
+
+        results = [future.result() if not future.cancelled() else ([], 0) for future in futures]
+        self.nodes = sum(nodes for _, nodes in results)
+        depth = min(len(scores) for scores, _ in results)
+        best_move = moves[0]
+        if depth > 0:
+            best_index = max(range(len(moves)), key=lambda index: (results[index][0][depth - 1], -index))
+            best_move, self.score, self.depth = moves[best_index], results[best_index][0][depth - 1], depth
+            self.transposition_table.store(board.zobristKey, depth, self.score, TranspositionTable.EXACT, best_move)
+            if on_info is not None:
+                on_info(self.get_info(board, start_time))
+        self.time_used = time.perf_counter() - start_time
+        return best_move
+
+    @classmethod
+    def init_worker(cls, stop_event) -> None:
+        """
+        Keep the stop event of the pool in the current process (called once in every process of the pool).
+        """
+        cls.worker_stop_event = stop_event
+
+    @classmethod
+    def search_root_move(cls, fen : str, move : tuple, max_depth : int, max_time : float, max_nodes : int, hash_size : int) -> tuple[list[int], int]:
+        """
+        Search a root move with iterative deepening (the function run by the processes of the pool).
+        The transposition table is cleared first, so the result does not depend on the previous tasks of the process.
+
+        Parameters:
+        - fen: The FEN string of the root position
+        - move: The root move as (start, end, promotion)
+        - max_depth: The maximum depth, counting the root move
+        - max_time: The time of the search in seconds (None for no limit)
+        - max_nodes: The maximum number of nodes (None for no limit)
+        - hash_size: The size in MB of the transposition table of the process
+
+        Return:
+        - tuple[list[int], int] -> (the scores of the move from the point of view of the root player at depth 1, 2, ..., the nodes searched)
+        """
+        if cls.worker_search is None or cls.worker_search.hash_size != hash_size:
+            cls.worker_search = cls(hash_size=hash_size)
+        search = cls.worker_search
+        if cls.worker_stop_event is not None:
+            search.stop_event = cls.worker_stop_event
+        search.transposition_table.clear()
+        search.node_limit = max_nodes
+        search.reset(time.perf_counter(), max_time, max_depth)
+
+        board = ChessBoard(fen)
+        board.make_move(*move)
+        scores = []
+        for depth in range(1, max_depth + 1):
+            try:
+                score = -search.negamax(board, depth - 1, -cls.MATE_SCORE - 1, cls.MATE_SCORE + 1, 1)
+            except SearchAborted:
+                break
+            scores.append(score)
+            if abs(score) >= cls.MATE_THRESHOLD:
+                # The score of a forced mate does not change at higher depths
+                scores += [score] * (max_depth - depth)
+                break
+        return scores, search.nodes
+
+    def get_info(self, board : ChessBoard, start_time : float) -> dict:
+        """
+        Return the info of the last completed iteration, in the format of ChessEngine.parse_info_line.
+        """
+        elapsed = time.perf_counter() - start_time
+        info = {"depth": self.depth, "nodes": self.nodes,
+                "nps": int(self.nodes / elapsed) if elapsed > 0 else 0,
+                "time": int(elapsed * 1000),
+                "pv": self.principal_variation(board, self.depth)}
+        if abs(self.score) >= self.MATE_THRESHOLD:
+            # Moves (not plies) to the mate, negative if the player to move is mated
+            plies = self.MATE_SCORE - abs(self.score)
+            info["score_mate"] = (plies + 1) // 2 if self.score > 0 else -(plies // 2)
+        else:
+            info["score_cp"] = self.score
+        return info
+
+    def principal_variation(self, board : ChessBoard, max_length : int) -> list[str]:
+        """
+        Follow the best moves stored in the transposition table from the given position.
+        The board is left unchanged.
+
+        Return:
+        - list[str] -> The moves in coordinate notation (e.g. "e2e4")
+        """
+        moves = []
+        undos = []
+        try:
+            while len(moves) < max_length:
+                entry = self.transposition_table.entries[board.zobristKey & self.transposition_table.mask]
+                if entry is None or entry[0] != board.zobristKey or entry[4] is None:
+                    break
+                start, end, promotion = entry[4]
+                piece = board.matrix[start[1]][start[0]]
+                if piece is None or piece.color != board.playerToMove:
+                    break
+                moves.append(board.convert_move_to_algebraic(start, end, promotion))
+                undos.append(board.make_move(start, end, promotion))
+        finally:
+            for undo in reversed(undos):
+                board.unmake_move(undo)
+        return moves
+
+    def search_root(self, board : ChessBoard, moves : list[tuple], depth : int, previous_best : tuple) -> tuple[int, tuple]:
+        """
+        Search all the moves of the root position at the given depth.
+
+        Parameters:
+        - board: The root position
+        - moves: The legal moves of the root position
+        - depth: The depth of the search
+        - previous_best: The best move of the previous iteration (searched first)
+
+        Return:
+        - tuple[int, tuple] -> (score, best move)
+        """
+        alpha, beta = -self.MATE_SCORE - 1, self.MATE_SCORE + 1
+        best_move = None
+        for move in self.order_moves(board, moves, 0, previous_best):
+            undo = board.make_move(*move)
+            try:
+                score = -self.negamax(board, depth - 1, -beta, -alpha, 1)
+            finally:
+                board.unmake_move(undo)
+            if score > alpha or best_move is None:
+                alpha, best_move = score, move
+        self.transposition_table.store(board.zobristKey, depth, alpha, TranspositionTable.EXACT, best_move)
+        return alpha, best_move
+
+    def negamax(self, board : ChessBoard, depth : int, alpha : int, beta : int, ply : int) -> int:
+        """
+        Alpha-beta search in the negamax form.
+
+        Parameters:
+        - board: The position to search
+        - depth: The remaining depth
+        - alpha: The lower bound of the search window
+        - beta: The upper bound of the search window
+        - ply: The distance from the root
+
+        Return:
+        - int -> The score of the position from the point of view of the player to move
+        """
+        if depth <= 0:
+            return self.quiescence(board, alpha, beta, ply)
+        self.count_node()
+        if board.repetition_count() > 1 or board.is_fifty_move_rule():
+            # A position repeated in the search is a draw, as the players can keep repeating it
+            return 0
+
+        key = board.zobristKey
+        entry = self.transposition_table.probe(key)
+        table_move = None
+        if entry is not None:
+            _, entry_depth, entry_score, bound, table_move, _ = entry
+            if entry_depth >= depth:
+                entry_score = self.score_from_table(entry_score, ply)
+                if (bound == TranspositionTable.EXACT or
+                    (bound == TranspositionTable.LOWER_BOUND and entry_score >= beta) or
+                    (bound == TranspositionTable.UPPER_BOUND and entry_score <= alpha)):
+                    return entry_score
+
+        moves = board.get_legal_moves()
+        if not moves:
+            if board.king_under_attack(board.playerToMove):
+                return -self.MATE_SCORE + ply
+            return 0
+
+        original_alpha = alpha
+        best_move = None
+        for move in self.order_moves(board, moves, ply, table_move):
+            capture = board.matrix[move[1][1]][move[1][0]] is not None
+            undo = board.make_move(*move)
+            try:
+                score = -self.negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.unmake_move(undo)
+            if score >= beta:
+                if not capture:
+                    self.store_killer(move, ply)
+                    self.history[(move[0], move[1])] = self.history.get((move[0], move[1]), 0) + depth * depth
+                self.transposition_table.store(key, depth, self.score_to_table(beta, ply), TranspositionTable.LOWER_BOUND, move)
+                return beta
+            if score > alpha:
+                alpha = score
+                best_move = move
+        bound = TranspositionTable.EXACT if alpha > original_alpha else TranspositionTable.UPPER_BOUND
+        self.transposition_table.store(key, depth, self.score_to_table(alpha, ply), bound, best_move)
+        return alpha
+
+    def score_to_table(self, score : int, ply : int) -> int:
+        """
+        Convert a mate score from distance to the root to distance to the position, before storing it.
+        """
+        if score >= self.MATE_THRESHOLD:
+            return score + ply
+        if score <= -self.MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    def score_from_table(self, score : int, ply : int) -> int:
+        """
+        Convert a mate score stored in the table back to distance to the root.
+        """
+        if score >= self.MATE_THRESHOLD:
+            return score - ply
+        if score <= -self.MATE_THRESHOLD:
+            return score + ply
+        return score
+
+    def quiescence(self, board : ChessBoard, alpha : int, beta : int, ply : int) -> int:
+        """
+        Search only the captures (with the en passant captures) and the promotions to a queen until the position is quiet,
+        to avoid the horizon effect. The moves are generated directly by ChessBitboard.capture_moves.
+
+        Parameters:
+        - board: The position to search
+        - alpha: The lower bound of the search window
+        - beta: The upper bound of the search window
+        - ply: The distance from the root
+
+        Return:
+        - int -> The score of the position from the point of view of the player to move
+        """
+        self.count_node()
+        stand_pat = self.evaluate(board)
+        if stand_pat >= beta:
+            return beta
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        captures = ChessBitboard(board).capture_moves(board.playerToMove)
+        captures.sort(key=lambda move: self.mvv_lva(board, move), reverse=True)
+        for move in captures:
+            undo = board.make_move(*move)
+            try:
+                score = -self.quiescence(board, -beta, -alpha, ply + 1)
+            finally:
+                board.unmake_move(undo)
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def evaluate(self, board : ChessBoard) -> int:
+        """
+        Evaluate the position with material and piece-square tables.
+
+        Return:
+        - int -> The score in centipawns from the point of view of the player to move
+        """
+        score = 0
+        for y in range(8):
+            for x in range(8):
+                piece = board.matrix[y][x]
+                if piece is not None:
+                    if piece.color == "w":
+                        score += self.PIECE_VALUES[piece.piece] + self.PIECE_SQUARE_TABLES[piece.piece][y][x]
+                    else:
+                        score -= self.PIECE_VALUES[piece.piece] + self.PIECE_SQUARE_TABLES[piece.piece][7 - y][x]
+        return score if board.playerToMove == "w" else -score
+
+    def mvv_lva(self, board : ChessBoard, move : tuple) -> int:
+        """
+        Return the Most Valuable Victim - Least Valuable Attacker score of a capture,
+        with the value of the promoted piece for a promotion.
+        """
+        start, end, promotion = move
+        victim = board.matrix[end[1]][end[0]]
+        attacker = board.matrix[start[1]][start[0]]
+        if victim is not None:
+            score = 10 * self.PIECE_VALUES[victim.piece]
+        elif attacker.piece == "Pawn" and start[0] != end[0]:
+            score = 10 * self.PIECE_VALUES["Pawn"] # en passant, the captured pawn is not on the target square
+        else:
+            score = 0
+        if promotion is not None:
+            score += 10 * self.PIECE_VALUES[ChessPiece.PIECE_NAMES[promotion]]
+        return score - self.PIECE_VALUES[attacker.piece]
+
+    def order_moves(self, board : ChessBoard, moves : list[tuple], ply : int, best_move : tuple) -> list[tuple]:
+        """
+        Sort the moves so that the most promising ones are searched first:
+        the best move (if given), the captures by MVV-LVA, the promotions, the killer moves,
+        then the quiet moves by history score.
+
+        Parameters:
+        - board: The position of the moves
+        - moves: The legal moves
+        - ply: The distance from the root (to look up the killer moves)
+        - best_move: A move to search first, or None
+
+        Return:
+        - list[tuple] -> The sorted moves
+        """
+        killers = self.killers[ply] if ply < len(self.killers) else [None, None]
+
+        def move_score(move : tuple) -> int:
+            if move == best_move:
+                return 10000000
+            if board.matrix[move[1][1]][move[1][0]] is not None:
+                return 1000000 + self.mvv_lva(board, move)
+            if move[2] is not None:
+                return 900000
+            if move in killers:
+                return 800000
+            return self.history.get((move[0], move[1]), 0)
+
+        return sorted(moves, key=move_score, reverse=True)
+
+    def store_killer(self, move : tuple, ply : int) -> None:
+        """
+        Remember a quiet move that caused a beta cutoff at the given ply.
+        """
+        if ply < len(self.killers) and self.killers[ply][0] != move:
+            self.killers[ply][1] = self.killers[ply][0]
+            self.killers[ply][0] = move
+
+    def count_node(self) -> None:
+        """
+        Count a visited node and abort the search if the budget is exhausted.
+        """
+        self.nodes += 1
+        if self.stop_event.is_set():
+            raise SearchAborted()
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            raise SearchAborted()
+        if self.deadline is not None and self.nodes % 128 == 0 and time.perf_counter() >= self.deadline:
+            raise SearchAborted()
+
+    def close(self) -> None:
+        """
+        Function that stops the processes of the pool of the search, if any (provided also for compatibility with ChessEngine).
+        """
+        if self.executor is not None:
+            self.pool_stop_event.set()
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+            self.pool_stop_event = None
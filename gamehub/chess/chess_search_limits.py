@@ -0,0 +1,93 @@
+class ChessSearchLimits:
+    """
+    The limits of an engine search, following the parameters of the UCI "go" command.
+    Every limit is optional: the search stops when the first one is reached.
+    Without limits the engine searches at the default depth.
+
+    Attributes:
+    - movetime: The time of the search in milliseconds
+    - nodes: The maximum number of nodes of the search
+    - depth: The maximum depth of the search
+    - wtime: The time left on the clock of white in milliseconds
+    - btime: The time left on the clock of black in milliseconds
+    - winc: The increment of white per move in milliseconds
+    - binc: The increment of black per move in milliseconds
+    """
+    DEFAULT_DEPTH = 20
+    # Number of moves the remaining time of a clock is divided into
+    MOVES_TO_GO = 30
+    # Time kept on the clock to cover the overhead of reading the move, in milliseconds
+    SAFETY_MARGIN = 50
+
+    def __init__(self, movetime : int = None, nodes : int = None, depth : int = None,
+                 wtime : int = None, btime : int = None, winc : int = 0, binc : int = 0) -> None:
+        for name, value in (("movetime", movetime), ("nodes", nodes), ("depth", depth), ("wtime", wtime), ("btime", btime)):
+            if value is not None and value <= 0:
+                raise ValueError("Invalid search limit: " + name)
+        if winc < 0 or binc < 0:
+            raise ValueError("Invalid search limit: increment")
+        self.movetime = movetime
+        self.nodes = nodes
+        self.depth = depth
+        self.wtime = wtime
+        self.btime = btime
+        self.winc = winc
+        self.binc = binc
+
+    def has_limits(self) -> bool:
+        """
+        Return True if at least one limit is set.
+        """
+        return any(value is not None for value in (self.movetime, self.nodes, self.depth, self.wtime, self.btime))
+
+    def has_clock(self) -> bool:
+        """
+        Return True if the game is played with clocks (wtime or btime is set).
+        """
+        return self.wtime is not None or self.btime is not None
+
+    def to_go_command(self) -> str:
+        """
+        Return the UCI "go" command of the limits (e.g. "go movetime 1000\\n").
+        """
+        parameters = []
+        for name in ("wtime", "btime", "winc", "binc", "movetime", "nodes", "depth"):
+            value = getattr(self, name)
+            if value is not None and (self.has_clock() or name not in ("winc", "binc")):
+                parameters.append(f"{name} {value}")
+        if not self.has_limits():
+            parameters.append(f"depth {self.DEFAULT_DEPTH}")
+        return "go " + " ".join(parameters) + "\n"
+
+    def time_budget(self, color : str) -> float:
+        """
+        Return the time the player can spend on the current move, for engines that manage their own time.
+
+        Parameters:
+        - color: The color of the player to move
+
+        Return:
+        - float -> The time in seconds, None if there is no time limit
+        """
+        budget = None
+        clock = self.wtime if color == "w" else self.btime
+        if clock is not None:
+            increment = self.winc if color == "w" else self.binc
+            budget = min(clock / self.MOVES_TO_GO + increment * 3 / 4, clock - self.SAFETY_MARGIN)
+            budget = max(budget, 10)
+        if self.movetime is not None:
+            budget = self.movetime if budget is None else min(budget, self.movetime)
+        return budget / 1000 if budget is not None else None
+
+    def update_clock(self, color : str, elapsed : float) -> None:
+        """
+        Subtract the time used by a player for a move from its clock and add its increment.
+
+        Parameters:
+        - color: The color of the player that moved
+        - elapsed: The time spent on the move in seconds
+        """
+        if color == "w" and self.wtime is not None:
+            self.wtime = max(1, self.wtime - int(elapsed * 1000) + self.winc)
+        elif color == "b" and self.btime is not None:
+            self.btime = max(1, self.btime - int(elapsed * 1000) + self.binc)
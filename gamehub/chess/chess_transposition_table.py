@@ -0,0 +1,108 @@
+class TranspositionTable:
+    """
+    A fixed-size table of search results indexed by the Zobrist key of the position.
+    Every entry stores (key, depth, score, bound, best move, age). When two positions fall in the same slot,
+    the new result replaces the old one if the old one comes from a previous search (age)
+    or if it has been searched at a lower or equal depth (depth-preferred).
+
+    Attributes:
+    - size: The number of entries (a power of two)
+    - entries: The list of entries (None for an empty slot)
+    - age: The age of the current search, incremented by new_search
+    - hits: The number of probes that found the position
+    - misses: The number of probes that did not find the position
+    - stores: The number of results stored
+    - overwrites: The number of stored results that replaced the result of another position
+    """
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+    # Approximate memory used by an entry (the tuple, its key and the slot of the list), in bytes
+    ENTRY_SIZE = 160
+
+    def __init__(self, size_mb : int = 16) -> None:
+        if size_mb <= 0:
+            raise ValueError("Invalid transposition table size")
+        max_entries = max(1, size_mb * 1024 * 1024 // self.ENTRY_SIZE)
+        self.size = 1 << (max_entries.bit_length() - 1)
+        self.mask = self.size - 1
+        self.entries = [None] * self.size
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self) -> None:
+        """
+        Start a new search: the entries of the previous searches become replaceable.
+        """
+        self.age += 1
+
+    def probe(self, key : int) -> tuple:
+        """
+        Look up the entry of a position.
+
+        Parameters:
+        - key: The Zobrist key of the position
+
+        Return:
+        - tuple -> The entry (key, depth, score, bound, best move, age), None if the position is not in the table
+        """
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key : int, depth : int, score : int, bound : int, best_move : tuple) -> None:
+        """
+        Store the result of the search of a position, following the replacement policy.
+
+        Parameters:
+        - key: The Zobrist key of the position
+        - depth: The depth of the search
+        - score: The score of the position
+        - bound: EXACT, LOWER_BOUND (the score is at least this) or UPPER_BOUND (the score is at most this)
+        - best_move: The best move found, or None
+        """
+        index = key & self.mask
+        entry = self.entries[index]
+        if entry is not None and entry[0] == key:
+            # Keep the best move of the previous search of the same position if the new one has none
+            if best_move is None:
+                best_move = entry[4]
+        elif entry is not None:
+            if entry[5] == self.age and entry[1] > depth:
+                return
+            self.overwrites += 1
+        self.entries[index] = (key, depth, score, bound, best_move, self.age)
+        self.stores += 1
+
+    def clear(self) -> None:
+        """
+        Empty the table and reset the counters.
+        """
+        self.entries = [None] * self.size
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Return the counters of the table, useful to tune its size.
+
+        Return:
+        - dict[str, float] -> size, hits, misses, hit_rate, stores, overwrites and filled (fraction of used slots)
+        """
+        probes = self.hits + self.misses
+        return {"size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / probes if probes > 0 else 0.0,
+                "stores": self.stores,
+                "overwrites": self.overwrites,
+                "filled": sum(entry is not None for entry in self.entries) / self.size}
@@ -0,0 +1,77 @@
+import random
+
+class ChessZobrist:
+    """
+    The random 64-bit keys used to compute the Zobrist hash of a chess position.
+    The key of a position is the XOR of the keys of its pieces, side to move, castling rights and en passant file,
+    so it can be updated incrementally when a move is made.
+    The keys are generated from a fixed seed, so the same position always has the same hash (also between runs).
+
+    Attributes:
+    - piece_keys: A dictionary that maps every piece character to the keys of the 64 squares (indexed as y * 8 + x)
+    - black_to_move_key: The key added when black is to move
+    - castling_keys: A dictionary that maps every castling right (K, Q, k, q) to its key
+    - en_passant_keys: The keys of the en passant files (a to h)
+    """
+    SEED = 0x5A0B215
+
+    def __init__(self) -> None:
+        generator = random.Random(self.SEED)
+        self.piece_keys = {char: [generator.getrandbits(64) for _ in range(64)] for char in "PRNBQKprnbqk"}
+        self.black_to_move_key = generator.getrandbits(64)
+        self.castling_keys = {right: generator.getrandbits(64) for right in "KQkq"}
+        self.en_passant_keys = [generator.getrandbits(64) for _ in range(8)]
+
+    def piece_key(self, piece_char : str, position : tuple[int, int]) -> int:
+        """
+        Return the key of a piece in the given position.
+
+        Parameters:
+        - piece_char: The character of the piece
+        - position: The position of the piece (x, y)
+        """
+        return self.piece_keys[piece_char][position[1] * 8 + position[0]]
+
+    def side_key(self, player_to_move : str) -> int:
+        """
+        Return the key of the player to move (0 for white).
+        """
+        return self.black_to_move_key if player_to_move == "b" else 0
+
+    def castling_key(self, castling_rights : str) -> int:
+        """
+        Return the key of the castling rights (e.g. "KQkq" or "-").
+        """
+        key = 0
+        for right in castling_rights:
+            if right in self.castling_keys:
+                key ^= self.castling_keys[right]
+        return key
+
+    def en_passant_key(self, en_passant : str) -> int:
+        """
+        Return the key of the en passant square (e.g. "e3"), 0 if there is none ("-").
+        """
+        if en_passant == "-":
+            return 0
+        return self.en_passant_keys[ord(en_passant[0]) - 97]
+
+    def compute_key(self, matrix : list[list[object]], player_to_move : str, castling_rights : str, en_passant : str) -> int:
+        """
+        Compute from scratch the key of a position.
+
+        Parameters:
+        - matrix: The matrix of the chess board
+        - player_to_move: The color of the player to move
+        - castling_rights: The castling rights (e.g. "KQkq" or "-")
+        - en_passant: The en passant square (e.g. "e3" or "-")
+
+        Return:
+        - int -> The 64-bit key of the position
+        """
+        key = self.side_key(player_to_move) ^ self.castling_key(castling_rights) ^ self.en_passant_key(en_passant)
+        for y in range(8):
+            for x in range(8):
+                if matrix[y][x] is not None:
+                    key ^= self.piece_key(matrix[y][x].piece_char, (x, y))
+        return key
@@ -3,9 +3,16 @@ This module contains the GameOfLife class that implements the Game of Life game.
 """
 import curses
 from curses import wrapper
+from functools import partial
 import random
 import time
 
+from gamehub.life_engines.life_bitpacked_engine import LifeBitpackedEngine
+from gamehub.life_engines.life_hashlife_engine import LifeHashLifeEngine
+from gamehub.life_engines.life_incremental_engine import LifeIncrementalEngine
+from gamehub.life_engines.life_numpy_engine import LifeNumpyEngine
+from gamehub.life_engines.life_sparse_engine import LifeSparseEngine
+
 class GameOfLife:
     """
     Class used to run the Game of Life game.
@@ -15,13 +22,42 @@ class GameOfLife:
     - delta_time: How many seconds to sleep between each iteration
     - mode: The mode of the game (Automatic or Manual)
     - density: The percentage of alive cells in the initial matrix
-    - matrix: The matrix of cells
+    - engine: The engine that computes the generations ("python" for update_matrix, "numpy" for LifeNumpyEngine,
+      "hashlife" for LifeHashLifeEngine, "sparse" and "sparse-unbounded" for LifeSparseEngine,
+      "incremental" for LifeIncrementalEngine, "bitpacked" for LifeBitpackedEngine)
+    - generations: The number of generations computed before the first one is drawn (to skip ahead, at most
+      MAX_STEPPED_GENERATIONS for the engines that compute the generations one at a time)
+    - max_nodes: The size of the node table and of the result table that makes the "hashlife" engine collect them
+    - matrix: The matrix of cells (with an engine other than "python", it is updated when the game ends)
+
+    The engines other than "python" are classes with the same interface:
+    __init__(rows, cols), load(matrix), step(generations), live_cells(), to_matrix() and the generation attribute.
+    The engines with a changed_cells() method are drawn by delta: only the cells changed by the last generation.
     """
-    def __init__(self, speed: int = 100, mode: str = "Automatic", density: int = 30):
+    ENGINES = {"numpy": LifeNumpyEngine,
+               "hashlife": LifeHashLifeEngine,
+               "sparse": LifeSparseEngine,
+               "sparse-unbounded": partial(LifeSparseEngine, bounded=False),
+               "incremental": LifeIncrementalEngine,
+               "bitpacked": LifeBitpackedEngine}
+    # Only hashlife skips ahead without computing every generation, the other engines can skip at most MAX_STEPPED_GENERATIONS
+    SKIPPING_ENGINES = {"hashlife"}
+    MAX_STEPPED_GENERATIONS = 1000
+
+    def __init__(self, speed: int = 100, mode: str = "Automatic", density: int = 30, engine: str = "python", generations: int = 0, max_nodes: int = 500000):
+        if engine != "python" and engine not in self.ENGINES:
+            raise ValueError("Invalid engine")
+        if generations < 0 or (generations > self.MAX_STEPPED_GENERATIONS and engine not in self.SKIPPING_ENGINES):
+            raise ValueError("Invalid number of generations")
+        if max_nodes < 1:
+            raise ValueError("Invalid number of nodes")
         self.speed = speed
         self.delta_time = speed / 1000
         self.mode = mode
         self.density = density
+        self.engine = engine
+        self.generations = generations
+        self.max_nodes = max_nodes
         self.matrix = None
 
     def initialize_matrix(self, rows : int, cols : int, density : int) -> list[list[int]]:
@@ -117,6 +153,54 @@ class GameOfLife:
                         pass
         stdscr.refresh()
 
+    def draw_cells(self, stdscr : curses.window, cells : list[tuple[int, int]], color : int) -> None:
+        """
+        Draw the live cells returned by an engine in the terminal with the given color.
+        Each cell is represented by two spaces.
+
+        Parameters:
+        - stdscr: The standard screen object of curses
+        - cells: The positions (row, column) of the live cells
+        - color: The color to use to draw the cells
+        """
+        stdscr.clear()
+        for i, j in cells:
+            try:
+                stdscr.addstr(i, j * 2, "  ", color)
+            except curses.error:
+                pass
+        stdscr.refresh()
+
+    def draw_changes(self, stdscr : curses.window, changes : list[tuple[int, int, int]], color : int) -> None:
+        """
+        Draw only the cells changed by the last generation, without clearing the screen.
+        The cells that were born are drawn with the given color, the ones that died are erased.
+
+        Parameters:
+        - stdscr: The standard screen object of curses
+        - changes: The changed cells as (row, column, value), as returned by the changed_cells method of an engine
+        - color: The color to use to draw the live cells
+        """
+        for i, j, value in changes:
+            try:
+                stdscr.addstr(i, j * 2, "  ", color if value == 1 else curses.A_NORMAL)
+            except curses.error:
+                pass
+        stdscr.refresh()
+
+    def create_engine(self, rows : int, cols : int) -> object:
+        """
+        Create the engine selected with the engine attribute for a grid of the given size.
+
+        Return:
+        - The engine (None for the "python" engine, that uses update_matrix)
+        """
+        if self.engine == "python":
+            return None
+        if self.engine == "hashlife":
+            return self.ENGINES[self.engine](rows, cols, max_nodes=self.max_nodes)
+        return self.ENGINES[self.engine](rows, cols)
+
     def get_input_and_sleep(self, stdscr : curses.window) -> str:
         """
         Get the last key pressed by the user and sleep for
@@ -159,11 +243,32 @@ class GameOfLife:
         """
         COLOR_WHITE_WHITE, LINES, COLS = self.init_curses(stdscr)
         self.matrix = self.initialize_matrix(LINES, COLS, self.density)
+        engine = self.create_engine(LINES, COLS)
         last_key = None
+        if engine is None:
+            for _ in range(self.generations):
+                self.matrix = self.update_matrix(self.matrix)
+            while last_key != '\x1b':
+                self.draw_board(stdscr, self.matrix, COLOR_WHITE_WHITE)
+                self.matrix = self.update_matrix(self.matrix)
+                last_key = self.get_input_and_sleep(stdscr)
+            return
+
+        engine.load(self.matrix)
+        if self.generations > 0:
+            engine.step(self.generations)
+        # After the first drawing, only the changed cells are drawn if the engine tracks them
+        delta = hasattr(engine, "changed_cells")
+        drawn = False
         while last_key != '\x1b':
-            self.draw_board(stdscr, self.matrix, COLOR_WHITE_WHITE)
-            self.matrix = self.update_matrix(self.matrix)
+            if delta and drawn:
+                self.draw_changes(stdscr, engine.changed_cells(), COLOR_WHITE_WHITE)
+            else:
+                self.draw_cells(stdscr, engine.live_cells(), COLOR_WHITE_WHITE)
+            drawn = True
+            engine.step()
             last_key = self.get_input_and_sleep(stdscr)
+        self.matrix = engine.to_matrix()
 
     def init_game(self) -> None:
         """
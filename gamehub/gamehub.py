@@ -4,6 +4,9 @@ It is responsible for parsing the command line arguments and launching the selec
 """
 import argparse
 from gamehub.chess.chess import Chess
+from gamehub.chess.chess_analysis import ChessAnalysis
+from gamehub.chess.chess_move_cache import ChessMoveCache
+from gamehub.chess.chess_search_limits import ChessSearchLimits
 from . import snake, game_of_life, word_guesser
 
 class GameHub:
@@ -70,6 +73,19 @@ class GameHub:
                                          type=int,
                                          default=30,
                                          help="The initial density of the cells in the grid.\n")
+        game_of_life_parser.add_argument("--engine",
+                                         type=str,
+                                         default="python",
+                                         choices=["python", "numpy", "hashlife", "sparse", "sparse-unbounded", "incremental", "bitpacked"],
+                                         help="The engine that computes the generations (numpy requires NumPy and is faster on large grids; hashlife simulates an unbounded plane and skips ahead quickly; sparse stores only the live cells and is faster on low density grids, sparse-unbounded also on an unbounded plane; incremental updates and draws only the cells that changed; bitpacked stores the rows as bits and updates them with bitwise operations).\n")
+        game_of_life_parser.add_argument("--generations",
+                                         type=int,
+                                         default=0,
+                                         help="The number of generations computed before the first one is shown: at most 1000, as the generations are computed one at a time, except with --engine hashlife, which skips ahead (e.g. 1000000).\n")
+        game_of_life_parser.add_argument("--max-nodes",
+                                         type=int,
+                                         default=500000,
+                                         help="The number of cached nodes after which the hashlife engine clears its caches (a lower value uses less memory, a higher one recomputes less).\n")
 
         # Subparser for Word Guesser
         subparsers.add_parser("word_guesser", help="Play Word Guesser, a game where You have to guess a random 5-letter English word. After each attempt the letters that are not present in the target word are removed from the available letters list and the ones that are present are shown on the terminal. You have six attempts to guess the word.\n")
@@ -81,9 +97,121 @@ class GameHub:
                                   default="Multiplayer",
                                   choices=["Singleplayer", "Multiplayer"],
                                   help="Two players can play on the same terminal (Multiplayer) or you can play alone against an AI (Singleplayer).\n")
+        chess_parser.add_argument("--engine",
+                                  type=str,
+                                  default="Stockfish",
+                                  choices=["Stockfish", "Builtin"],
+                                  help="The AI used in Singleplayer mode: the external Stockfish binary or the built-in engine (no installation needed).\n")
+        chess_parser.add_argument("--hash",
+                                  type=int,
+                                  default=128,
+                                  help="The size in MB of the hash table of the AI.\n")
+        chess_parser.add_argument("--movetime",
+                                  type=int,
+                                  default=None,
+                                  help="The time in ms the AI can spend on every move.\n")
+        chess_parser.add_argument("--nodes",
+                                  type=int,
+                                  default=None,
+                                  help="The maximum number of nodes the AI can search for every move.\n")
+        chess_parser.add_argument("--depth",
+                                  type=int,
+                                  default=None,
+                                  help="The maximum depth of the search of the AI (20 for Stockfish if no limit is given).\n")
+        chess_parser.add_argument("--wtime",
+                                  type=int,
+                                  default=None,
+                                  help="The clock of white in ms (the AI manages the time of its clock).\n")
+        chess_parser.add_argument("--btime",
+                                  type=int,
+                                  default=None,
+                                  help="The clock of black in ms (the AI manages the time of its clock).\n")
+        chess_parser.add_argument("--winc",
+                                  type=int,
+                                  default=0,
+                                  help="The increment of white per move in ms.\n")
+        chess_parser.add_argument("--binc",
+                                  type=int,
+                                  default=0,
+                                  help="The increment of black per move in ms.\n")
+        chess_parser.add_argument("--workers",
+                                  type=int,
+                                  default=1,
+                                  help="The number of processes of the built-in engine, which splits the moves of the position between them (1 to search in a single process).\n")
+        chess_parser.add_argument("--pool-size",
+                                  type=int,
+                                  default=2,
+                                  help="The number of Stockfish processes kept running and reused between games.\n")
+        chess_parser.add_argument("--move-cache",
+                                  type=str,
+                                  default=None,
+                                  help="The file where the moves of the AI are cached between runs (by default they are cached in memory only).\n")
+        chess_parser.add_argument("--no-book",
+                                  action="store_true",
+                                  help="Do not use the opening book: the AI searches also the first moves of the game.\n")
+
+        # Subparser for the Chess analysis
+        chess_analysis_parser = subparsers.add_parser("chess_analysis", help="Analyse the chess positions of a FEN/EPD file without the terminal interface: for every position a JSON line is written with the number of legal moves, check, checkmate, stalemate and optionally the best move of an engine.\n")
+        chess_analysis_parser.add_argument("input",
+                                           type=str,
+                                           help="The file of the positions, one FEN or EPD per line (- for the standard input).\n")
+        chess_analysis_parser.add_argument("--output",
+                                           type=str,
+                                           default="-",
+                                           help="The file of the results in JSON lines (the standard output by default).\n")
+        chess_analysis_parser.add_argument("--workers",
+                                           type=int,
+                                           default=None,
+                                           help="The number of processes (the number of CPUs by default).\n")
+        chess_analysis_parser.add_argument("--chunk-size",
+                                           type=int,
+                                           default=256,
+                                           help="The number of positions sent to a process at a time.\n")
+        chess_analysis_parser.add_argument("--engine",
+                                           type=str,
+                                           default=None,
+                                           choices=["Stockfish", "Builtin"],
+                                           help="The engine used to find the best move of every position (no best move by default).\n")
+        chess_analysis_parser.add_argument("--hash",
+                                           type=int,
+                                           default=16,
+                                           help="The size in MB of the hash table of every engine.\n")
+        chess_analysis_parser.add_argument("--movetime",
+                                           type=int,
+                                           default=None,
+                                           help="The time in ms the engine can spend on every position.\n")
+        chess_analysis_parser.add_argument("--nodes",
+                                           type=int,
+                                           default=None,
+                                           help="The maximum number of nodes the engine can search for every position.\n")
+        chess_analysis_parser.add_argument("--depth",
+                                           type=int,
+                                           default=None,
+                                           help="The maximum depth of the search of the engine.\n")
 
         return parser.parse_args()
 
+    def create_search_limits(self) -> ChessSearchLimits:
+        """
+        Create the limits of the chess engine search from the command line arguments,
+        bounding the values to sensible ranges.
+
+        Returns:
+            ChessSearchLimits object (empty if no limit has been given).
+        """
+        def bounded(value : int, lower_bound : int, upper_bound : int) -> int:
+            return self.apply_bound(value, lower_bound, upper_bound) if value is not None else None
+
+        # The clocks are not options of chess_analysis
+        arguments = vars(self.args)
+        return ChessSearchLimits(movetime=bounded(self.args.movetime, 10, 3600000),
+                                 nodes=bounded(self.args.nodes, 1, 10**9),
+                                 depth=bounded(self.args.depth, 1, 64),
+                                 wtime=bounded(arguments.get("wtime"), 1000, 36000000),
+                                 btime=bounded(arguments.get("btime"), 1000, 36000000),
+                                 winc=self.apply_bound(arguments.get("winc", 0), 0, 600000),
+                                 binc=self.apply_bound(arguments.get("binc", 0), 0, 600000))
+
     def run(self) -> None:
         """
         Run the selected game.
@@ -94,11 +222,29 @@ class GameHub:
         elif self.args.game == "game_of_life":
             game = game_of_life.GameOfLife(self.apply_bound(self.args.speed, 50, 10000),
                                     self.args.mode,
-                                    self.apply_bound(self.args.density, 0, 100))
+                                    self.apply_bound(self.args.density, 0, 100),
+                                    self.args.engine,
+                                    self.apply_bound(self.args.generations, 0, 10**18 if self.args.engine in game_of_life.GameOfLife.SKIPPING_ENGINES else game_of_life.GameOfLife.MAX_STEPPED_GENERATIONS),
+                                    self.apply_bound(self.args.max_nodes, 1000, 10**8))
         elif self.args.game == "word_guesser":
             game = word_guesser.WordGuesser()
         elif self.args.game == "chess":
-            game = Chess(self.args.mode)
+            game = Chess(self.args.mode,
+                         engine=self.args.engine,
+                         hash_size=self.apply_bound(self.args.hash, 1, 4096),
+                         limits=self.create_search_limits(),
+                         workers=self.apply_bound(self.args.workers, 1, 256),
+                         pool_size=self.apply_bound(self.args.pool_size, 1, 64),
+                         move_cache=ChessMoveCache.shared(path=self.args.move_cache),
+                         use_opening_book=not self.args.no_book)
+        elif self.args.game == "chess_analysis":
+            game = ChessAnalysis(self.args.input,
+                                 self.args.output,
+                                 workers=self.apply_bound(self.args.workers, 1, 256) if self.args.workers is not None else None,
+                                 chunk_size=self.apply_bound(self.args.chunk_size, 1, 100000),
+                                 engine=self.args.engine,
+                                 hash_size=self.apply_bound(self.args.hash, 1, 4096),
+                                 limits=self.create_search_limits())
             
         if game is not None:
             game.init_game()
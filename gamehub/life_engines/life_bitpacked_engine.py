@@ -0,0 +1,87 @@
+class LifeBitpackedEngine:
+    """
+    A Game of Life engine that stores every row of the grid in a Python int (the bit x is the cell in column x),
+    so a cell takes one bit instead of a reference to an int object.
+    A generation works on whole rows with bitwise operations: the neighbors of all the cells of a row are
+    counted at once by adders on the shifted rows (the count is kept in bit planes, one int for every bit of the count).
+    The cells outside the grid are dead, as in GameOfLife.update_matrix.
+
+    Attributes:
+    - rows: The number of rows of the grid
+    - cols: The number of columns of the grid
+    - mask: The int with the bits of the cols columns set
+    - grid: The rows of the grid as ints
+    - generation: The number of generations computed since the grid was loaded
+    """
+    def __init__(self, rows : int, cols : int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.mask = (1 << cols) - 1
+        self.grid = [0] * rows
+        self.generation = 0
+
+    def load(self, matrix : list[list[int]]) -> None:
+        """
+        Set the cells of the grid from a matrix (rows x cols) of 0s and 1s.
+        """
+        # The first column is the lowest bit, so the row is reversed to build the binary string
+        self.grid = [int("".join("1" if cell == 1 else "0" for cell in reversed(row)), 2) for row in matrix]
+        self.generation = 0
+
+    def step(self, generations : int = 1) -> None:
+        """
+        Compute the given number of generations.
+        For every row the horizontal sums of three cells (of the row with the cell, without the cell) are computed once
+        as two bit planes, then the sums of the row above, of the row and of the row below are added.
+        """
+        mask = self.mask
+        for _ in range(generations):
+            grid = self.grid
+            # Horizontal sums of the cell and of its left and right neighbors (0-3), as bits 0 and 1
+            sums = []
+            for row in grid:
+                left, right = (row << 1) & mask, row >> 1
+                partial = left ^ right
+                sums.append((partial ^ row, (left & right) | (row & partial), partial, left & right))
+            sums.append((0, 0, 0, 0)) # The rows outside the grid (index -1 and rows) are dead
+            new_grid = []
+            for y, row in enumerate(grid):
+                above0, above1, _, _ = sums[y - 1]
+                below0, below1, _, _ = sums[y + 1]
+                _, _, middle0, middle1 = sums[y] # Without the cell itself (0-2)
+                # Bit 0 of the count and its carry
+                ones = above0 ^ middle0 ^ below0
+                carry = (above0 & middle0) | (below0 & (above0 ^ middle0))
+                # Bits 1 and 2 of the count: the sum of above1, middle1, below1 and carry
+                upper = above1 ^ middle1
+                lower = below1 ^ carry
+                twos = upper ^ lower
+                fours = (above1 & middle1) ^ (below1 & carry) ^ (upper & lower)
+                # A cell is alive with three neighbors, or with two if it was already alive (8 neighbors have bits 1 and 2 clear)
+                new_grid.append(twos & ~fours & (ones | row))
+            self.grid = new_grid
+        self.generation += generations
+
+    def live_cells(self) -> list[tuple[int, int]]:
+        """
+        Return the positions (row, column) of the live cells.
+        """
+        cells = []
+        for y, row in enumerate(self.grid):
+            while row:
+                lowest = row & -row
+                cells.append((y, lowest.bit_length() - 1))
+                row ^= lowest
+        return cells
+
+    def population(self) -> int:
+        """
+        Return the number of live cells.
+        """
+        return sum(bin(row).count("1") for row in self.grid)
+
+    def to_matrix(self) -> list[list[int]]:
+        """
+        Return the grid as a matrix (list of rows) of 0s and 1s, as used by GameOfLife.
+        """
+        return [[int(bit) for bit in reversed(format(row, "0" + str(self.cols) + "b"))] for row in self.grid]
@@ -0,0 +1,259 @@
+class LifeNode:
+    """
+    A node of the HashLife quadtree: a square of 2^level x 2^level cells made of four nodes of the level below.
+    The nodes of level 0 are the single cells (population 0 or 1, without children).
+    The nodes are created by LifeHashLifeEngine.join, so equal squares are (usually) the same object
+    and are compared and hashed by identity.
+
+    Attributes:
+    - nw, ne, sw, se: The four quadrants (north-west, north-east, south-west, south-east)
+    - level: The level of the node (the side of the square is 2^level)
+    - population: The number of live cells of the square
+    """
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw : 'LifeNode', ne : 'LifeNode', sw : 'LifeNode', se : 'LifeNode', level : int, population : int) -> None:
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+class LifeHashLifeEngine:
+    """
+    A Game of Life engine based on the HashLife algorithm: the plane is a quadtree of canonical nodes
+    (equal squares are shared) and the future of every node is memoised, so repeated patterns are computed once
+    and the generations can be advanced by powers of two (2^j generations in one step).
+    Unlike the other engines, the plane is unbounded: the cells that leave the grid keep evolving outside of it.
+    When the node table or the result table grows over max_nodes entries, both are cleared before the next advance
+    and the root is rebuilt from canonical nodes (so the nodes stay shared and the results keep being found).
+    The tables can grow over the limit during a single advance.
+
+    Attributes:
+    - rows: The number of rows of the grid (the visible part of the plane)
+    - cols: The number of columns of the grid
+    - max_nodes: The number of entries of the node table or of the result table that triggers their collection
+    - nodes: The canonical nodes, keyed by their four quadrants
+    - results: The memoised successors, keyed by (node, j)
+    - root: The quadtree of the plane
+    - origin: The position (row, column) of the top-left cell of the root in the plane (the grid starts in (0, 0))
+    - generation: The number of generations computed since the grid was loaded
+    """
+    def __init__(self, rows : int, cols : int, max_nodes : int = 500000) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.max_nodes = max_nodes
+        self.nodes = {}
+        self.results = {}
+        self.dead_cell = LifeNode(None, None, None, None, 0, 0)
+        self.live_cell = LifeNode(None, None, None, None, 0, 1)
+        self.empty_nodes = [self.dead_cell]
+        self.root = self.empty(1)
+        self.origin = (0, 0)
+        self.generation = 0
+
+    def join(self, nw : LifeNode, ne : LifeNode, sw : LifeNode, se : LifeNode) -> LifeNode:
+        """
+        Return the canonical node made of the four given quadrants, creating it if it is not in the node table.
+        """
+        key = (nw, ne, sw, se)
+        node = self.nodes.get(key)
+        if node is None:
+            node = LifeNode(nw, ne, sw, se, nw.level + 1, nw.population + ne.population + sw.population + se.population)
+            self.nodes[key] = node
+        return node
+
+    def empty(self, level : int) -> LifeNode:
+        """
+        Return the node of the given level without live cells.
+        """
+        while len(self.empty_nodes) <= level:
+            node = self.empty_nodes[-1]
+            self.empty_nodes.append(self.join(node, node, node, node))
+        return self.empty_nodes[level]
+
+    def pad(self, node : LifeNode) -> LifeNode:
+        """
+        Return the node of the level above with the given node in its center and dead cells around it.
+        """
+        empty = self.empty(node.level - 1)
+        return self.join(self.join(empty, empty, empty, node.nw), self.join(empty, empty, node.ne, empty),
+                         self.join(empty, node.sw, empty, empty), self.join(node.se, empty, empty, empty))
+
+    def is_padded(self, node : LifeNode) -> bool:
+        """
+        Check if the live cells of the node are all in its central square (half of its side).
+        """
+        return (node.level >= 2 and
+                node.population == node.nw.se.population + node.ne.sw.population + node.sw.ne.population + node.se.nw.population)
+
+    def life_4x4(self, node : LifeNode) -> LifeNode:
+        """
+        Compute by brute force the central 2x2 square of a 4x4 node after one generation.
+        """
+        cells = [[node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne],
+                 [node.nw.sw, node.nw.se, node.ne.sw, node.ne.se],
+                 [node.sw.nw, node.sw.ne, node.se.nw, node.se.ne],
+                 [node.sw.sw, node.sw.se, node.se.sw, node.se.se]]
+        result = []
+        for y in (1, 2):
+            for x in (1, 2):
+                neighbors = sum(cells[i][j].population for i in (y - 1, y, y + 1) for j in (x - 1, x, x + 1)) - cells[y][x].population
+                alive = neighbors == 3 or (neighbors == 2 and cells[y][x].population == 1)
+                result.append(self.live_cell if alive else self.dead_cell)
+        return self.join(*result)
+
+    def successor(self, node : LifeNode, j : int) -> LifeNode:
+        """
+        Return the central square of the node (a node of the level below) after 2^j generations (j <= level - 2).
+        The result is memoised: the nine overlapping squares of the level below are advanced recursively,
+        by 2^(j - 1) generations twice when j is the maximum, otherwise once and then their centers are joined.
+        """
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        key = (node, j)
+        result = self.results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self.life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join, successor = self.join, self.successor
+            c1 = successor(nw, j)
+            c2 = successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = successor(ne, j)
+            c4 = successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = successor(sw, j)
+            c8 = successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = successor(se, j)
+            if j < node.level - 2:
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                result = join(successor(join(c1, c2, c4, c5), j), successor(join(c2, c3, c5, c6), j),
+                              successor(join(c4, c5, c7, c8), j), successor(join(c5, c6, c8, c9), j))
+
+        self.results[key] = result
+        return result
+
+    def build(self, matrix : list[list[int]], level : int, y : int, x : int) -> LifeNode:
+        """
+        Build the node of the given level for the square of the matrix with the top-left cell in (y, x)
+        (the cells outside the matrix are dead).
+        """
+        if y >= self.rows or x >= self.cols:
+            return self.empty(level)
+        if level == 0:
+            return self.live_cell if matrix[y][x] == 1 else self.dead_cell
+        half = 1 << (level - 1)
+        node = self.join(self.build(matrix, level - 1, y, x), self.build(matrix, level - 1, y, x + half),
+                         self.build(matrix, level - 1, y + half, x), self.build(matrix, level - 1, y + half, x + half))
+        return node if node.population > 0 else self.empty(level)
+
+    def load(self, matrix : list[list[int]]) -> None:
+        """
+        Set the cells of the plane from a matrix (rows x cols) of 0s and 1s (the cells outside the grid are dead).
+        """
+        level = 2
+        while (1 << level) < max(self.rows, self.cols):
+            level += 1
+        self.root = self.build(matrix, level, 0, 0)
+        self.origin = (0, 0)
+        self.generation = 0
+
+    def step(self, generations : int = 1) -> None:
+        """
+        Compute the given number of generations, advancing the plane by the powers of two of the binary representation of the number.
+        """
+        remaining = generations
+        j = 0
+        while remaining:
+            if remaining & 1:
+                self.advance(j)
+            remaining >>= 1
+            j += 1
+        self.generation += generations
+
+    def collect_garbage(self) -> None:
+        """
+        Clear the node table and the result table, and rebuild the root from new canonical nodes.
+        The tables are cleared together, so the results are never keyed by nodes that are no longer canonical.
+        """
+        self.nodes = {}
+        self.results = {}
+        self.empty_nodes = [self.dead_cell]
+        rebuilt = {}
+
+        def canonicalise(node : LifeNode) -> LifeNode:
+            if node.level == 0:
+                return node
+            canonical = rebuilt.get(node)
+            if canonical is None:
+                canonical = self.join(canonicalise(node.nw), canonicalise(node.ne), canonicalise(node.sw), canonicalise(node.se))
+                rebuilt[node] = canonical
+            return canonical
+
+        self.root = canonicalise(self.root)
+
+    def advance(self, j : int) -> None:
+        """
+        Advance the plane by 2^j generations.
+        The tables are collected first if they are over the limit.
+        The root is padded until the live cells are far enough from its border not to reach it in 2^j generations.
+        """
+        if len(self.nodes) > self.max_nodes or len(self.results) > self.max_nodes:
+            self.collect_garbage()
+        root, (y, x) = self.root, self.origin
+        while root.level < j + 2 or not self.is_padded(root):
+            offset = 1 << (root.level - 1)
+            root, y, x = self.pad(root), y - offset, x - offset
+        offset = 1 << (root.level - 1)
+        root, y, x = self.pad(root), y - offset, x - offset
+        # The successor is the central square of the root, a quarter of its side from the border
+        offset = 1 << (root.level - 2)
+        self.root, self.origin = self.successor(root, j), (y + offset, x + offset)
+
+    def collect(self, node : LifeNode, y : int, x : int, cells : list[tuple[int, int]]) -> None:
+        """
+        Add to cells the live cells of the node (with the top-left cell in (y, x)) that are in the grid.
+        """
+        size = 1 << node.level
+        if node.population == 0 or y >= self.rows or x >= self.cols or y + size <= 0 or x + size <= 0:
+            return
+        if node.level == 0:
+            cells.append((y, x))
+            return
+        half = size >> 1
+        self.collect(node.nw, y, x, cells)
+        self.collect(node.ne, y, x + half, cells)
+        self.collect(node.sw, y + half, x, cells)
+        self.collect(node.se, y + half, x + half, cells)
+
+    def live_cells(self) -> list[tuple[int, int]]:
+        """
+        Return the positions (row, column) of the live cells of the grid.
+        """
+        cells = []
+        self.collect(self.root, self.origin[0], self.origin[1], cells)
+        return cells
+
+    def population(self) -> int:
+        """
+        Return the number of live cells of the whole plane (also outside the grid).
+        """
+        return self.root.population
+
+    def to_matrix(self) -> list[list[int]]:
+        """
+        Return the grid as a matrix (list of rows) of 0s and 1s, as used by GameOfLife.
+        """
+        matrix = [[0] * self.cols for _ in range(self.rows)]
+        for y, x in self.live_cells():
+            matrix[y][x] = 1
+        return matrix
@@ -0,0 +1,99 @@
+class LifeIncrementalEngine:
+    """
+    A Game of Life engine that re-evaluates only the cells that can change: a cell can change only if it
+    or one of its neighbors changed in the last generation, so once the grid is made of still lifes and
+    small oscillators a generation costs little more than the cells that changed.
+    The cells are stored in two flat lists with a border of dead cells (the cells outside the grid are dead,
+    as in GameOfLife.update_matrix), used in turn for the current and the next generation (no list is allocated per generation).
+    The cells changed by the last generation are exposed by changed_cells, so only they have to be drawn.
+
+    Attributes:
+    - rows: The number of rows of the grid
+    - cols: The number of columns of the grid
+    - width: The number of columns of the flat lists (the columns of the grid and the border)
+    - grid: The cells of the current generation (1 alive, 0 dead), the cell (y, x) at index (y + 1) * width + x + 1
+    - buffer: The cells of the previous generation, overwritten by the next one
+    - cells: The indexes of the cells of the grid (without the border)
+    - inside: For every index, True if it is a cell of the grid, False if it is in the border
+    - offsets: The differences between the indexes of the eight neighbors and the index of a cell
+    - changes: The indexes of the cells changed by the last generation (all the cells after load)
+    - generation: The number of generations computed since the grid was loaded
+    """
+    def __init__(self, rows : int, cols : int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.width = cols + 2
+        self.grid = [0] * ((rows + 2) * self.width)
+        self.buffer = [0] * ((rows + 2) * self.width)
+        self.cells = [(y + 1) * self.width + x + 1 for y in range(rows) for x in range(cols)]
+        self.inside = [False] * len(self.grid)
+        for index in self.cells:
+            self.inside[index] = True
+        self.offsets = [dy * self.width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy != 0 or dx != 0]
+        self.changes = self.cells
+        self.generation = 0
+
+    def load(self, matrix : list[list[int]]) -> None:
+        """
+        Set the cells of the grid from a matrix (rows x cols) of 0s and 1s.
+        Every cell is evaluated by the next generation.
+        """
+        for y in range(self.rows):
+            start = (y + 1) * self.width + 1
+            self.grid[start:start + self.cols] = matrix[y]
+        self.buffer = self.grid.copy()
+        self.changes = self.cells
+        self.generation = 0
+
+    def step(self, generations : int = 1) -> None:
+        """
+        Compute the given number of generations.
+        Only the cells changed by the last generation and their neighbors are evaluated; the other cells are the same
+        in the two lists, because they did not change in the last generation, so the lists can be swapped.
+        """
+        offsets, inside, width = self.offsets, self.inside, self.width
+        for _ in range(generations):
+            grid, buffer = self.grid, self.buffer
+            candidates = set(self.changes)
+            for index in self.changes:
+                candidates.update([index + offset for offset in offsets])
+            changes = []
+            for index in candidates:
+                if not inside[index]:
+                    continue
+                above, below = index - width, index + width
+                neighbors = (grid[above - 1] + grid[above] + grid[above + 1] +
+                             grid[index - 1] + grid[index + 1] +
+                             grid[below - 1] + grid[below] + grid[below + 1])
+                # A cell is alive with three neighbors, or with two if it was already alive
+                cell = 1 if neighbors == 3 or (neighbors == 2 and grid[index] == 1) else 0
+                buffer[index] = cell
+                if cell != grid[index]:
+                    changes.append(index)
+            self.grid, self.buffer = buffer, grid
+            self.changes = changes
+        self.generation += generations
+
+    def changed_cells(self) -> list[tuple[int, int, int]]:
+        """
+        Return the cells changed by the last generation (all the cells after load).
+
+        Return:
+        - list[tuple[int, int, int]] -> The cells as (row, column, value), the value is 1 if the cell was born, 0 if it died
+        """
+        width, grid = self.width, self.grid
+        return [(index // width - 1, index % width - 1, grid[index]) for index in self.changes]
+
+    def live_cells(self) -> list[tuple[int, int]]:
+        """
+        Return the positions (row, column) of the live cells.
+        """
+        width, grid = self.width, self.grid
+        return [(index // width - 1, index % width - 1) for index in self.cells if grid[index] == 1]
+
+    def to_matrix(self) -> list[list[int]]:
+        """
+        Return the grid as a matrix (list of rows) of 0s and 1s, as used by GameOfLife.
+        """
+        width = self.width
+        return [self.grid[(y + 1) * width + 1:(y + 1) * width + 1 + self.cols] for y in range(self.rows)]
@@ -0,0 +1,58 @@
+try:
+    import numpy
+except ImportError: # NumPy is optional, it is needed only by this engine
+    numpy = None
+
+class LifeNumpyEngine:
+    """
+    A Game of Life engine that stores the grid in a NumPy array of uint8 and computes a generation with array operations.
+    The neighbors of all the cells are counted at once by summing the eight shifted copies of the grid,
+    padded with a border of dead cells (the cells outside the grid are dead, as in GameOfLife.update_matrix).
+
+    Attributes:
+    - rows: The number of rows of the grid
+    - cols: The number of columns of the grid
+    - grid: The cells (1 alive, 0 dead) as a rows x cols array
+    - generation: The number of generations computed since the grid was loaded
+    """
+    def __init__(self, rows : int, cols : int) -> None:
+        if numpy is None:
+            raise ImportError("The numpy engine requires NumPy (pip install numpy)")
+        self.rows = rows
+        self.cols = cols
+        self.grid = numpy.zeros((rows, cols), dtype=numpy.uint8)
+        self.padded = numpy.zeros((rows + 2, cols + 2), dtype=numpy.uint8)
+        self.generation = 0
+
+    def load(self, matrix : list[list[int]]) -> None:
+        """
+        Set the cells of the grid from a matrix (rows x cols) of 0s and 1s.
+        """
+        self.grid = numpy.array(matrix, dtype=numpy.uint8).reshape(self.rows, self.cols)
+        self.generation = 0
+
+    def step(self, generations : int = 1) -> None:
+        """
+        Compute the given number of generations.
+        """
+        padded = self.padded
+        for _ in range(generations):
+            padded[1:-1, 1:-1] = self.grid
+            neighbors = (padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:] +
+                         padded[1:-1, :-2] + padded[1:-1, 2:] +
+                         padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:])
+            # A cell is alive with three neighbors, or with two if it was already alive
+            self.grid = ((neighbors == 3) | ((neighbors == 2) & (self.grid == 1))).astype(numpy.uint8)
+        self.generation += generations
+
+    def live_cells(self) -> list[tuple[int, int]]:
+        """
+        Return the positions (row, column) of the live cells.
+        """
+        return [(int(y), int(x)) for y, x in numpy.argwhere(self.grid)]
+
+    def to_matrix(self) -> list[list[int]]:
+        """
+        Return the grid as a matrix (list of rows) of 0s and 1s, as used by GameOfLife.
+        """
+        return self.grid.tolist()
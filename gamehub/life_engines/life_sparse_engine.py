@@ -0,0 +1,75 @@
+class LifeSparseEngine:
+    """
+    A Game of Life engine that stores only the live cells, in a set of positions (row, column).
+    A generation counts the neighbors of the live cells only (every live cell adds one to its eight neighbors),
+    so its cost depends on the population and not on the size of the grid: it is fast on low density grids.
+    The plane can be bounded (the cells outside the grid are dead, as in GameOfLife.update_matrix)
+    or unbounded (the cells that leave the grid keep evolving outside of it).
+
+    Attributes:
+    - rows: The number of rows of the grid
+    - cols: The number of columns of the grid
+    - bounded: True if the cells outside the grid are dead, False for an unbounded plane
+    - cells: The positions (row, column) of the live cells
+    - generation: The number of generations computed since the grid was loaded
+    """
+    NEIGHBORS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy != 0 or dx != 0]
+
+    def __init__(self, rows : int, cols : int, bounded : bool = True) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.bounded = bounded
+        self.cells = set()
+        self.generation = 0
+
+    def load(self, matrix : list[list[int]]) -> None:
+        """
+        Set the live cells from a matrix (rows x cols) of 0s and 1s.
+        """
+        self.cells = {(y, x) for y, row in enumerate(matrix) for x, cell in enumerate(row) if cell == 1}
+        self.generation = 0
+
+    def step(self, generations : int = 1) -> None:
+        """
+        Compute the given number of generations.
+        """
+        neighbors = self.NEIGHBORS
+        rows, cols = self.rows, self.cols
+        for _ in range(generations):
+            counts = {}
+            get = counts.get
+            for y, x in self.cells:
+                for dy, dx in neighbors:
+                    position = (y + dy, x + dx)
+                    counts[position] = get(position, 0) + 1
+            # A cell is alive with three neighbors, or with two if it was already alive
+            cells = self.cells
+            cells = {position for position, count in counts.items() if count == 3 or (count == 2 and position in cells)}
+            if self.bounded:
+                cells = {(y, x) for y, x in cells if 0 <= y < rows and 0 <= x < cols}
+            self.cells = cells
+        self.generation += generations
+
+    def live_cells(self) -> list[tuple[int, int]]:
+        """
+        Return the positions (row, column) of the live cells of the grid.
+        """
+        if self.bounded:
+            return list(self.cells)
+        rows, cols = self.rows, self.cols
+        return [(y, x) for y, x in self.cells if 0 <= y < rows and 0 <= x < cols]
+
+    def population(self) -> int:
+        """
+        Return the number of live cells (with an unbounded plane, also the ones outside the grid).
+        """
+        return len(self.cells)
+
+    def to_matrix(self) -> list[list[int]]:
+        """
+        Return the grid as a matrix (list of rows) of 0s and 1s, as used by GameOfLife.
+        """
+        matrix = [[0] * self.cols for _ in range(self.rows)]
+        for y, x in self.live_cells():
+            matrix[y][x] = 1
+        return matrix
@@ -0,0 +1,98 @@
+"""
+Module that contains the TestChessAnalysis class,
+which is used to test the ChessAnalysis class (the batch analysis of positions).
+"""
+import io
+import json
+import multiprocessing
+import os
+import pytest
+from gamehub.chess.chess_analysis import ChessAnalysis
+from gamehub.chess.chess_search import ChessSearch
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+POSITIONS = """rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1
+# A comment
+
+8/8/4K3/8/8/8/2R5/k2R4 b - - bm Rd1; id "checkmate";
+8/8/4k3/8/8/8/2q5/K7 w - -
+not a position
+6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1
+"""
+
+class TestChessAnalysis:
+    """
+    Class to test the ChessAnalysis class.
+    """
+    @pytest.mark.parametrize("line, expected",
+                             [("8/8/8/8/8/8/8/K6k w - - 3 40", ("8/8/8/8/8/8/8/K6k w - - 3 40", {})),
+                              ("8/8/8/8/8/8/8/K6k w - -", ("8/8/8/8/8/8/8/K6k w - - 0 1", {})),
+                              ('8/8/8/8/8/8/8/K6k b - - bm Kg1; id "pos 1";', ("8/8/8/8/8/8/8/K6k b - - 0 1", {"bm": "Kg1", "id": "pos 1"}))])
+    def test_normalize_fen(self, line : str, expected : tuple[str, dict]) -> None:
+        """
+        Verify that FEN and EPD lines are converted to FEN strings with the EPD operations.
+        """
+        assert ChessAnalysis.normalize_fen(line) == expected
+
+    def test_analyse_in_process(self) -> None:
+        """
+        Verify the results of the positions (in the order of the input), and that the invalid lines are reported.
+        """
+        output = io.StringIO()
+        count = ChessAnalysis("-", workers=1).analyse(io.StringIO(POSITIONS), output)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert count == 5 and [result["line"] for result in results] == [1, 4, 5, 6, 7]
+        assert results[0] == {"line": 1, "fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", "legal_moves": 20,
+                              "check": False, "checkmate": False, "stalemate": False}
+        assert results[1]["id"] == "checkmate" and results[1]["checkmate"] and results[1]["legal_moves"] == 0
+        assert results[2]["stalemate"] and not results[2]["check"]
+        assert results[3] == {"line": 6, "input": "not a position", "error": "Invalid FEN string"}
+        assert "best_move" not in results[4]
+
+    def test_analyse_with_process_pool_and_engine(self, tmp_path) -> None:
+        """
+        Verify that the process pool gives the same results in the same order, with the best moves of the engine.
+        """
+        input_path = tmp_path / "positions.epd"
+        input_path.write_text(POSITIONS * 3, encoding="utf-8")
+        output_path = tmp_path / "results.jsonl"
+        ChessAnalysis(str(input_path), str(output_path), workers=2, chunk_size=2,
+                      engine="Builtin", limits=ChessSearchLimits(depth=2)).init_game()
+        results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        assert len(results) == 15 and [result["line"] for result in results] == [n + 7 * k for k in range(3) for n in (1, 4, 5, 6, 7)]
+        assert results[4]["best_move"] == "a1a8"                                 # Mate in one
+        assert results[1]["best_move"] is None and results[2]["best_move"] is None  # No legal moves
+        assert ChessAnalysis.worker_engine is None # The pool does not create engines in the current process
+
+    def test_promotion_best_move(self) -> None:
+        """
+        Verify that the best move of a promotion is written in UCI notation, with the promoted piece.
+        """
+        output = io.StringIO()
+        ChessAnalysis("-", workers=1, engine="Builtin", limits=ChessSearchLimits(depth=3)).analyse(
+            io.StringIO("7k/4P3/8/8/8/8/8/K7 w - - 0 1\n8/4P1k1/3q4/8/8/8/8/K7 w - - 0 1\n"), output)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert results[0]["best_move"] == "e7e8q" and results[0]["legal_moves"] == 7
+        assert results[1]["best_move"] == "e7e8n"
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="The patched class is inherited only by forked processes")
+    def test_process_pool_closes_engines(self, tmp_path, monkeypatch) -> None:
+        """
+        Verify that the engine of every process of the pool is closed when the pool shuts down.
+        """
+        closed_dir = tmp_path / "closed"
+        closed_dir.mkdir()
+        original_close = ChessSearch.close
+
+        def close(search : ChessSearch) -> None:
+            (closed_dir / str(os.getpid())).write_text("closed", encoding="utf-8")
+            original_close(search)
+
+        monkeypatch.setattr(ChessSearch, "close", close)
+        input_path = tmp_path / "positions.epd"
+        input_path.write_text(POSITIONS * 4, encoding="utf-8")
+        output_path = tmp_path / "results.jsonl"
+        ChessAnalysis(str(input_path), str(output_path), workers=2, chunk_size=1,
+                      engine="Builtin", limits=ChessSearchLimits(depth=1)).init_game()
+        assert 1 <= len(list(closed_dir.iterdir())) <= 2
+        assert not (closed_dir / str(os.getpid())).exists() # Only the engines of the pool are closed
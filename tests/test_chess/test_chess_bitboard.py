@@ -0,0 +1,148 @@
+"""
+Module that contains the TestChessBitboard class,
+which is used to test the ChessBitboard class.
+"""
+import random
+from collections import Counter
+import pytest
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_bitboard import ChessBitboard
+
+class TestChessBitboard:
+    """
+    Class to test the ChessBitboard class against the matrix based move generation of ChessPiece.
+    """
+    @pytest.mark.parametrize("fen",
+                             ["rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1",
+                              "2qrr1k1/1b3ppp/p2p2n1/1p5Q/2p1P3/2PB2B1/PP3PPP/3RRNK1 b - - 0 20",
+                              "8/5p2/p4K2/3pp3/8/1P3q2/1kr2R2/8 w - - 0 43",
+                              "8/8/4k3/8/8/8/2q5/K7 w - - 0 47",
+                              "8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62",
+                              "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+                              "P7/1PK5/5k2/5pp1/8/8/8/8 w - - 0 67",
+                              "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w - - 0 1"])
+    def test_legal_moves_match_chess_piece(self, fen : str) -> None:
+        """
+        For every piece of the position, the legal moves of the bitboard must be the same of ChessPiece.legal_moves.
+        """
+        board = ChessBoard(fen)
+        bitboard = ChessBitboard(board)
+        for y in range(8):
+            for x in range(8):
+                piece = board.matrix[y][x]
+                if piece is not None:
+                    assert Counter(bitboard.legal_moves((x, y))) == Counter(piece.legal_moves(board.matrix))
+
+    @pytest.mark.parametrize("fen, color, expected",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", "w", 20),
+                              ("8/8/4k3/8/8/8/2q5/K7 w - - 0 47", "w", 0),
+                              ("8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62", "b", 0),
+                              ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", "w", 14),
+                              ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", "w", 48),    # Castlings
+                              ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", "w", 6),
+                              ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", "w", 44),            # Castling and underpromotions
+                              ("8/8/8/KPp4r/8/8/8/7k w - c6 0 1", "w", 4)])                                          # The en passant capture uncovers the king
+    def test_legal_moves_count(self, fen : str, color : str, expected : int) -> None:
+        """
+        Verify the number of legal moves of a color in known positions.
+        """
+        assert ChessBitboard(ChessBoard(fen)).legal_moves_count(color) == expected
+
+    @pytest.mark.parametrize("fen, color, expected",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", "w", False),
+                              ("8/5p2/p4K2/3pp3/8/1P3q2/1kr2R2/8 w - - 0 43", "w", True),
+                              ("8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62", "b", True),
+                              ("8/8/8/8/8/8/8/k7 w - - 0 1", "w", False)])
+    def test_king_under_attack(self, fen : str, color : str, expected : bool) -> None:
+        """
+        Verify that the check detection works, also when the king is missing.
+        """
+        assert ChessBitboard(ChessBoard(fen)).king_under_attack(color) == expected
+
+    def test_random_games_match_chess_piece(self) -> None:
+        """
+        Play some random games and verify that, at every ply, the bitboard
+        and ChessPiece agree on the legal moves of every piece of the player to move.
+        """
+        generator = random.Random(1234)
+        for _ in range(3):
+            board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+            color = "w"
+            for _ in range(40):
+                bitboard = ChessBitboard(board)
+                moves = []
+                for y in range(8):
+                    for x in range(8):
+                        piece = board.matrix[y][x]
+                        if piece is not None and piece.color == color:
+                            piece_moves = piece.legal_moves(board.matrix)
+                            assert Counter(bitboard.legal_moves((x, y))) == Counter(piece_moves)
+                            moves += [((x, y), move) for move in piece_moves]
+                if not moves:
+                    break
+                start, end = generator.choice(moves)
+                piece = board.matrix[start[1]][start[0]]
+                piece.position = end
+                board.matrix[end[1]][end[0]] = piece
+                board.matrix[start[1]][start[0]] = None
+                color = "b" if color == "w" else "w"
+
+    @pytest.mark.parametrize("fen, color, expected",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", "w", True),
+                              ("8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62", "b", False),                   # Checkmate
+                              ("8/8/4k3/8/8/8/2q5/K7 w - - 0 47", "w", False),                     # Stalemate
+                              ("4k3/8/8/8/8/8/3PPP2/r2RK3 w - - 0 1", "w", True),                  # The checking rook can only be captured
+                              ("4k3/8/8/8/8/2B5/3PPP2/r3K3 w - - 0 1", "w", True),                 # The check can only be blocked
+                              ("4k3/8/8/8/8/5n2/3PPP2/r3K3 w - - 0 1", "w", False),                # Double check, the king cannot move
+                              ("4k3/8/8/8/8/8/5PPP/6Kr w - - 0 1", "w", True),                     # The king captures the checking rook
+                              ("3r1r2/8/8/3pP3/4K3/r7/8/b6k w - d6 0 1", "w", True),            # The checking pawn is captured en passant
+                              ("3r1r2/8/8/3pP3/4K3/r7/8/b6k w - - 0 1", "w", False),
+                              ("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1", "b", False)])                     # Only the king, stalemate
+    def test_has_any_legal_move(self, fen : str, color : str, expected : bool) -> None:
+        """
+        Verify that has_any_legal_move detects if there is a legal move, also in check and double check.
+        """
+        bitboard = ChessBitboard(ChessBoard(fen))
+        assert bitboard.has_any_legal_move(color) == expected
+        assert bitboard.has_any_legal_move(color) == (bitboard.legal_moves_count(color) > 0)
+
+    @pytest.mark.parametrize("fen, expected",
+                             [("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", [((4, 3), (3, 2), None)]),                          # En passant
+                              ("3rk3/4P3/8/8/8/8/8/4K3 w - - 0 1", [((4, 1), (3, 0), "Q")]),                            # Capture-promotion
+                              ("4k3/P7/8/8/8/8/8/4K3 w - - 0 1", [((0, 1), (0, 0), "Q")]),                              # Quiet promotion
+                              ("4k3/8/8/8/8/8/1p6/R3K3 b - - 0 1", [((1, 6), (0, 7), "q"), ((1, 6), (1, 7), "q")]),     # Black promotions
+                              ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", [])])                                                 # No castling
+    def test_capture_moves(self, fen : str, expected : list[tuple]) -> None:
+        """
+        Verify that capture_moves generates the captures, the en passant captures and only the promotions to a queen.
+        """
+        board = ChessBoard(fen)
+        assert sorted(ChessBitboard(board).capture_moves(board.playerToMove)) == expected
+
+    def test_capture_moves_match_legal_moves(self) -> None:
+        """
+        Verify that capture_moves generates the legal moves that capture (also en passant) or promote to a queen, in random games.
+        """
+        generator = random.Random(3)
+        for fen in ["r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1"]:
+            board = ChessBoard(fen)
+            for _ in range(100):
+                moves = board.get_legal_moves()
+                if not moves:
+                    break
+                expected = [(start, end, promotion) for start, end, promotion in moves
+                            if (promotion is None and (board.matrix[end[1]][end[0]] is not None or
+                                                       (board.matrix[start[1]][start[0]].piece == "Pawn" and start[0] != end[0])))
+                            or promotion in ("Q", "q")]
+                assert sorted(ChessBitboard(board).capture_moves(board.playerToMove)) == sorted(expected)
+                board.make_move(*generator.choice(moves))
+
+    def test_between(self) -> None:
+        """
+        Verify the squares between two aligned squares.
+        """
+        bitboard = ChessBitboard(ChessBoard("8/8/8/8/8/8/8/8 w - - 0 1"))
+        assert bitboard.squares(bitboard.between(56, 60)) == [57, 58, 59]   # a1-e1
+        assert bitboard.squares(bitboard.between(63, 0)) == [9, 18, 27, 36, 45, 54]   # h1-a8
+        assert bitboard.between(56, 57) == 0 and bitboard.between(0, 17) == 0
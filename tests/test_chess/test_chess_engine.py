@@ -2,7 +2,22 @@
 Module that contains the TestChessEngine class,
 which is used to test the ChessEngine class.
 """
+import io
+import pytest
 from gamehub.chess.chess_engine import ChessEngine
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+class FakeProcess:
+    """
+    Object that replaces the Stockfish process: the commands are written to a string
+    and the output is read from the given lines.
+    """
+    def __init__(self, output_lines : list[str]) -> None:
+        self.stdin = io.StringIO()
+        self.stdout = io.StringIO("".join(output_lines))
+
+    def poll(self):
+        return None
 
 class TestChessEngine:
     """
@@ -17,4 +32,94 @@ class TestChessEngine:
 
         chess_engine = ChessEngine()
         move = chess_engine.get_move()
-        assert chess_engine.convert_algebraic_to_coordinates(move) == (4,1,4,3)
+        assert chess_engine.convert_algebraic_to_coordinates(move) == ((4, 1), (4, 3), None)
+        assert chess_engine.convert_algebraic_to_coordinates("e7e8n") == ((4, 1), (4, 0), "n")
+
+    def test_new_game(self, monkeypatch):
+        """
+        Verify that new_game sends ucinewgame and waits for the engine to be ready.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess(["readyok\n"])
+        chess_engine.new_game()
+        assert chess_engine.process.stdin.getvalue() == "ucinewgame\nisready\n"
+
+    def test_new_game_terminated_engine(self, monkeypatch):
+        """
+        Verify that new_game raises an OSError if the engine process terminated.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess([])
+        with pytest.raises(OSError):
+            chess_engine.new_game()
+
+    def test_parse_info_line(self, monkeypatch):
+        """
+        Verify that parse_info_line extracts depth, score, nodes, speed and principal variation.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        info = ChessEngine().parse_info_line("info depth 12 seldepth 18 multipv 1 score cp -35 nodes 120000 nps 600000 time 200 pv e7e5 g1f3")
+        assert info == {"depth": 12, "seldepth": 18, "score_cp": -35, "nodes": 120000, "nps": 600000, "time": 200, "pv": ["e7e5", "g1f3"]}
+        assert ChessEngine().parse_info_line("info depth 3 score mate -2 pv d8h4")["score_mate"] == -2
+
+    def test_get_move_streams_info(self, monkeypatch):
+        """
+        Verify that get_move passes the info lines of the search to the callback.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess(["info string NNUE enabled\n",
+                                            "info depth 1 score cp 20 nodes 30 nps 30000 time 1 pv e7e5\n",
+                                            "info depth 2 score cp 15 nodes 90 nps 45000 time 2 pv e7e5 g1f3\n",
+                                            "bestmove e7e5 ponder g1f3\n"])
+        infos = []
+        assert chess_engine.get_move("fen", infos.append) == ((4, 1), (4, 3), None)
+        assert [info["depth"] for info in infos] == [1, 2] and infos[1]["pv"] == ["e7e5", "g1f3"]
+
+    def test_get_move_underpromotion(self, monkeypatch):
+        """
+        Verify that the promotion of the best move of Stockfish is kept.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess(["bestmove e7e8n\n"])
+        assert chess_engine.get_move("8/4P1k1/3q4/8/8/8/8/K7 w - - 0 1") == ((4, 1), (4, 0), "n")
+
+    def test_get_move_async(self, monkeypatch):
+        """
+        Verify that get_move_async returns a future with the move, and that a terminated engine sets an exception.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess(["bestmove d8h4\n"])
+        assert chess_engine.get_move_async("fen").result(timeout=5) == ((3, 0), (7, 4), None)
+        chess_engine.process = FakeProcess([])
+        with pytest.raises(OSError):
+            chess_engine.get_move_async("fen").result(timeout=5)
+
+    def test_stop(self, monkeypatch):
+        """
+        Verify that stop sends the stop command to the engine.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess([])
+        chess_engine.stop()
+        assert chess_engine.process.stdin.getvalue() == "stop\n"
+
+    def test_get_move_limits(self, monkeypatch):
+        """
+        Verify that get_move sends the search limits and reports the nodes and the time used.
+        """
+        monkeypatch.setattr(ChessEngine, "__init__", lambda n: None)
+        chess_engine = ChessEngine()
+        chess_engine.process = FakeProcess(["info depth 8 score cp 10 nodes 4000 nps 400000 time 10 pv e7e5\n",
+                                            "bestmove e7e5\n"])
+        chess_engine.get_move("8/8/8/8/8/8/8/8 b - - 0 1", limits=ChessSearchLimits(movetime=100, nodes=5000))
+        assert chess_engine.process.stdin.getvalue() == "position fen 8/8/8/8/8/8/8/8 b - - 0 1\ngo movetime 100 nodes 5000\n"
+        assert chess_engine.nodes == 4000 and chess_engine.time_used >= 0
+        chess_engine.process = FakeProcess(["bestmove e7e5\n"])
+        chess_engine.get_move("fen")
+        assert chess_engine.process.stdin.getvalue().endswith("go depth 20\n")
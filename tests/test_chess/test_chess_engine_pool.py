@@ -0,0 +1,113 @@
+"""
+Module that contains the TestChessEnginePool class,
+which is used to test the ChessEnginePool class.
+"""
+import threading
+import pytest
+from gamehub.chess.chess_engine_pool import ChessEnginePool
+
+class FakeEngine:
+    """
+    Engine that records the commands received, used instead of the Stockfish process.
+    """
+    started = 0
+
+    def __init__(self, hash_size : int) -> None:
+        FakeEngine.started += 1
+        self.hash_size = hash_size
+        self.alive = True
+        self.new_games = 0
+        self.closed = False
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def new_game(self) -> None:
+        if not self.alive:
+            raise OSError("The engine process terminated")
+        self.new_games += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+class TestChessEnginePool:
+    """
+    Class to test the ChessEnginePool class.
+    """
+    def test_engine_is_reused(self) -> None:
+        """
+        Verify that a released engine is reused by the next checkout after a ucinewgame.
+        """
+        FakeEngine.started = 0
+        pool = ChessEnginePool(2, 64, FakeEngine)
+        engine = pool.checkout()
+        pool.release(engine)
+        assert pool.checkout() is engine
+        assert FakeEngine.started == 1 and engine.new_games == 1 and engine.hash_size == 64
+
+    def test_warm_up(self) -> None:
+        """
+        Verify that warm_up starts all the engines of the pool.
+        """
+        FakeEngine.started = 0
+        pool = ChessEnginePool(3, 128, FakeEngine)
+        pool.warm_up()
+        assert FakeEngine.started == 3 and len(pool.idle) == 3
+        engines = [pool.checkout() for _ in range(3)]
+        assert FakeEngine.started == 3 and len(set(map(id, engines))) == 3
+
+    def test_crashed_engine_is_replaced(self) -> None:
+        """
+        Verify that an engine that crashed while idle or in use is discarded and replaced.
+        """
+        pool = ChessEnginePool(1, 128, FakeEngine)
+        engine = pool.checkout()
+        engine.alive = False
+        pool.release(engine)
+        assert engine.closed and pool.engine_count == 0
+        new_engine = pool.checkout()
+        assert new_engine is not engine
+        pool.release(new_engine)
+        new_engine.alive = False
+        assert pool.checkout() not in (engine, new_engine)
+
+    def test_checkout_waits_for_release(self) -> None:
+        """
+        Verify that when all the engines are in use a checkout waits for a release (or times out).
+        """
+        pool = ChessEnginePool(1, 128, FakeEngine)
+        engine = pool.checkout()
+        with pytest.raises(TimeoutError):
+            pool.checkout(timeout=0.01)
+        timer = threading.Timer(0.05, pool.release, [engine])
+        timer.start()
+        assert pool.checkout(timeout=5) is engine
+        timer.join()
+
+    def test_close(self) -> None:
+        """
+        Verify that close terminates the idle engines.
+        """
+        pool = ChessEnginePool(2, 128, FakeEngine)
+        pool.warm_up()
+        engines = list(pool.idle)
+        pool.close()
+        assert all(engine.closed for engine in engines) and pool.engine_count == 0
+
+    def test_invalid_size(self) -> None:
+        """
+        Verify that a pool without engines cannot be created.
+        """
+        with pytest.raises(ValueError):
+            ChessEnginePool(0)
+
+    def test_shared_pool(self, monkeypatch) -> None:
+        """
+        Verify that the shared pool is created once per process for every size and hash size.
+        """
+        monkeypatch.setattr(ChessEnginePool, "shared_pools", {})
+        pool = ChessEnginePool.shared(3, 32)
+        assert ChessEnginePool.shared(3, 32) is pool and pool.size == 3 and pool.hash_size == 32
+        other = ChessEnginePool.shared(3, 256)
+        assert other is not pool and other.hash_size == 256 and ChessEnginePool.shared(1, 32).size == 1
+        assert ChessEnginePool.shared() is ChessEnginePool.shared(2, 128)
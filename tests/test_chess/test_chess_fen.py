@@ -0,0 +1,71 @@
+"""
+Module that contains the TestChessFenCodec class,
+which is used to test the ChessFenCodec class and its benchmark.
+"""
+import pytest
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_fen import ChessFenCodec
+from gamehub.chess.chess_fen_benchmark import ChessFenBenchmark
+from gamehub.chess.chess_piece import ChessPiece
+
+class TestChessFenCodec:
+    """
+    Class to test the ChessFenCodec class.
+    """
+    @pytest.mark.parametrize("placement",
+                             ["rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR",
+                              "8/5p2/p4K2/3pp3/8/1P3q2/1kr2R2/8",
+                              "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1"])
+    def test_round_trip(self, placement : str) -> None:
+        """
+        Verify that the placement is unchanged after parsing and serializing it, and that the pieces have the right positions.
+        """
+        codec = ChessFenCodec()
+        matrix = codec.parse_placement(placement)
+        assert codec.serialize_placement(matrix) == placement
+        for y in range(8):
+            for x in range(8):
+                assert matrix[y][x] is None or matrix[y][x].position == (x, y)
+
+    def test_reuse_pieces(self) -> None:
+        """
+        Verify that the pieces of the previous matrix are reused only when the same piece is in the same square.
+        """
+        codec = ChessFenCodec()
+        before = codec.parse_placement("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR")
+        after = codec.parse_placement("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR", before)
+        assert after[7][0] is before[7][0] and after[0][4] is before[0][4]
+        assert after[4][4] == ChessPiece("P", (4, 4)) and after[6][4] is None
+        assert after[2] is not before[2] # The empty rows are not shared
+
+    @pytest.mark.parametrize("placement", ["rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP",
+                                           "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR",
+                                           "rnbqkbnr/ppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR",
+                                           "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBXKBNR"])
+    def test_invalid_placement(self, placement : str) -> None:
+        """
+        Verify that placements without 8 rows of 8 squares or with unknown pieces are rejected.
+        """
+        with pytest.raises(ValueError):
+            ChessFenCodec().parse_placement(placement)
+
+    def test_board_load_fen(self) -> None:
+        """
+        Verify that ChessBoard.load_fen sets the whole position, reusing the pieces that did not move.
+        """
+        board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+        rook = board.matrix[7][7]
+        board.load_fen("rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w - e6 0 2")
+        assert board.matrix[7][7] is rook and board.enPassant == "e6" and board.fullMoveCounter == 2
+        assert board == ChessBoard("rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w - e6 0 2")
+        assert board.zobristKey == board.compute_zobrist_key() and board.kingPositions == {"w": (4, 7), "b": (4, 0)}
+
+    def test_benchmark(self) -> None:
+        """
+        Verify that the benchmark round trip succeeds on a small corpus of random positions.
+        """
+        benchmark = ChessFenBenchmark()
+        corpus = benchmark.generate_corpus(300)
+        assert len(corpus) == 300 and len(set(corpus)) > 250
+        parse_rate, serialize_rate, round_trip = benchmark.benchmark(corpus)
+        assert round_trip and parse_rate > 0 and serialize_rate > 0
@@ -0,0 +1,115 @@
+"""
+Module that contains the TestChessMoveCache class,
+which is used to test the ChessMoveCache class.
+"""
+import pytest
+from concurrent.futures import Future
+from gamehub.chess.chess import Chess
+from gamehub.chess.chess_move_cache import ChessMoveCache
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+INITIAL_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+class FakeEngine:
+    """
+    Object that replaces the engine in Chess: it counts the searches and always plays e2e4.
+    """
+    def __init__(self) -> None:
+        self.searches = 0
+        self.nodes = 100
+        self.time_used = 0.5
+
+    def get_move_async(self, fen : str, on_info=None, limits=None):
+        self.searches += 1
+        future = Future()
+        future.set_result(((4, 6), (4, 4), None))
+        return future
+
+class TestChessMoveCache:
+    """
+    Class to test the ChessMoveCache class.
+    """
+    def test_get_put(self) -> None:
+        """
+        Verify that a move is found for the same engine, position (whatever the move counters) and limits.
+        """
+        cache = ChessMoveCache()
+        limits = ChessSearchLimits(movetime=100)
+        cache.put("Stockfish", INITIAL_FEN, limits, ((4, 6), (4, 4), None))
+        assert cache.get("Stockfish", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 5 12", limits) == ((4, 6), (4, 4), None)
+        assert cache.get("Builtin", INITIAL_FEN, limits) is None
+        assert cache.get("Stockfish", INITIAL_FEN, ChessSearchLimits(movetime=200)) is None
+        assert cache.hits == 1 and cache.misses == 2
+
+    def test_clock_searches_not_cached(self) -> None:
+        """
+        Verify that the searches limited by the clocks are not cached.
+        """
+        cache = ChessMoveCache()
+        limits = ChessSearchLimits(wtime=60000, btime=60000)
+        cache.put("Stockfish", INITIAL_FEN, limits, ((4, 6), (4, 4), None))
+        assert len(cache.entries) == 0 and cache.get("Stockfish", INITIAL_FEN, limits) is None
+
+    def test_lru_eviction(self) -> None:
+        """
+        Verify that the least recently used move is evicted when the cache is full.
+        """
+        cache = ChessMoveCache(capacity=2)
+        limits = ChessSearchLimits()
+        cache.put("Stockfish", "8/8/8/8/8/8/8/K6k w - - 0 1", limits, ((0, 7), (0, 6), None))
+        cache.put("Stockfish", "8/8/8/8/8/8/8/K6k b - - 0 1", limits, ((7, 7), (7, 6), None))
+        cache.get("Stockfish", "8/8/8/8/8/8/8/K6k w - - 0 1", limits)
+        cache.put("Stockfish", INITIAL_FEN, limits, ((4, 6), (4, 4), None))
+        assert cache.get("Stockfish", "8/8/8/8/8/8/8/K6k b - - 0 1", limits) is None
+        assert cache.get("Stockfish", "8/8/8/8/8/8/8/K6k w - - 0 1", limits) == ((0, 7), (0, 6), None)
+        with pytest.raises(ValueError):
+            ChessMoveCache(capacity=0)
+
+    def test_persistence(self, tmp_path) -> None:
+        """
+        Verify that the moves saved to the file are loaded by a new cache, and that a corrupted file is ignored.
+        """
+        path = str(tmp_path / "cache" / "moves.json")
+        cache = ChessMoveCache(path=path)
+        cache.put("Builtin", INITIAL_FEN, ChessSearchLimits(depth=4), ((6, 7), (5, 5), None))
+        cache.save()
+        assert ChessMoveCache(path=path).get("Builtin", INITIAL_FEN, ChessSearchLimits(depth=4)) == ((6, 7), (5, 5), None)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        assert len(ChessMoveCache(path=path).entries) == 0
+
+    @pytest.mark.parametrize("content", ['{}', '[1]', '[["x"]]', '[["x", 5]]', '[["x", [1, 2]]]', '[[1, [0, 0, 0, 0]]]',
+                                         '[["x", [0, 0, 0, 9]]]', '[["x", [0, 0, 0, 0]], "y"]'])
+    def test_wrongly_shaped_file(self, tmp_path, content : str) -> None:
+        """
+        Verify that a JSON file with entries of the wrong shape is ignored, so Chess can start with an empty cache.
+        """
+        path = tmp_path / "moves.json"
+        path.write_text(content, encoding="utf-8")
+        cache = ChessMoveCache(path=str(path))
+        assert len(cache.entries) == 0
+        assert cache.get("Stockfish", INITIAL_FEN, ChessSearchLimits(depth=4)) is None
+
+    def test_promotion_persistence(self, tmp_path) -> None:
+        """
+        Verify that the promotion of a move is kept in the file, and that the moves saved without it are ignored.
+        """
+        path = str(tmp_path / "moves.json")
+        fen = "8/4P1k1/3q4/8/8/8/8/K7 w - - 0 1"
+        cache = ChessMoveCache(path=path)
+        cache.put("Builtin", fen, ChessSearchLimits(depth=3), ((4, 1), (4, 0), "N"))
+        cache.save()
+        assert ChessMoveCache(path=path).get("Builtin", fen, ChessSearchLimits(depth=3)) == ((4, 1), (4, 0), "N")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write('[["Builtin|x|depth=3", [4, 1, 4, 0]]]')
+        assert len(ChessMoveCache(path=path).entries) == 0
+
+    def test_chess_uses_cache(self) -> None:
+        """
+        Verify that Chess searches a position only the first time.
+        """
+        engine = FakeEngine()
+        c = Chess(mode="Singleplayer", move_cache=ChessMoveCache(), use_opening_book=False)
+        assert c.wait_for_engine_move(None, engine) == ((4, 6), (4, 4), None) and c.engine_stats == (100, 0.5)
+        assert c.wait_for_engine_move(None, engine) == ((4, 6), (4, 4), None) and c.engine_stats == (0, 0.0)
+        assert engine.searches == 1
@@ -0,0 +1,85 @@
+"""
+Module that contains the TestChessOpeningBook class,
+which is used to test the ChessOpeningBook class.
+"""
+import random
+import pytest
+from gamehub.chess.chess import Chess
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_opening_book import ChessOpeningBook
+
+INITIAL_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+class TestChessOpeningBook:
+    """
+    Class to test the ChessOpeningBook class.
+    """
+    @pytest.mark.parametrize("move", [((4, 6), (4, 4), None), ((0, 1), (0, 0), "q"), ((7, 6), (7, 7), "n")])
+    def test_encode_decode_move(self, move : tuple) -> None:
+        """
+        Verify that a move is unchanged after encoding and decoding it.
+        """
+        assert ChessOpeningBook.decode_move(ChessOpeningBook.encode_move(*move)) == move
+
+    def test_build_and_lookup(self, tmp_path) -> None:
+        """
+        Verify that the book built from the games contains the moves of every position with their weights, sorted by key.
+        """
+        path = str(tmp_path / "book.bin")
+        games = ["e2e4 e7e5 g1f3", "e2e4 c7c5", "d2d4 d7d5", "e2e4 e7e5 f1c4", "e2e5 e7e5"] # The last game is illegal from the first move
+        assert ChessOpeningBook.build(games, path, max_ply=2) == 5
+        book = ChessOpeningBook(path)
+        assert book.record_count == 5
+        keys = [book.RECORD.unpack_from(book.data, i * book.RECORD.size)[0] for i in range(book.record_count)]
+        assert keys == sorted(keys)
+        assert sorted(book.get_moves(ChessBoard(INITIAL_FEN).zobristKey)) == [(((3, 6), (3, 4), None), 1), (((4, 6), (4, 4), None), 3)]
+        board = ChessBoard(INITIAL_FEN)
+        board.make_move((4, 6), (4, 4))
+        assert sorted(book.get_moves(board.zobristKey)) == [(((2, 1), (2, 3), None), 1), (((4, 1), (4, 3), None), 2)]
+        board.make_move((4, 1), (4, 3))
+        assert book.get_moves(board.zobristKey) == [] and book.choose_move(board) is None
+        book.close()
+
+    def test_choose_move(self, tmp_path) -> None:
+        """
+        Verify that the moves are chosen according to their weights.
+        """
+        path = str(tmp_path / "book.bin")
+        ChessOpeningBook.build(["e2e4"] * 9 + ["d2d4"], path)
+        book = ChessOpeningBook(path)
+        generator = random.Random(0)
+        moves = [book.choose_move(ChessBoard(INITIAL_FEN), generator) for _ in range(200)]
+        assert set(moves) == {((4, 6), (4, 4), None), ((3, 6), (3, 4), None)} and moves.count(((4, 6), (4, 4), None)) > 150
+        book.close()
+
+    def test_choose_underpromotion(self, tmp_path) -> None:
+        """
+        Verify that the promotion of a move of the book is kept.
+        """
+        path = str(tmp_path / "book.bin")
+        fen = "8/4P1k1/3q4/8/8/8/8/K7 w - - 0 1"
+        ChessOpeningBook.build(["e7e8n"], path, fen=fen)
+        book = ChessOpeningBook(path)
+        assert book.choose_move(ChessBoard(fen)) == ((4, 1), (4, 0), "n")
+        book.close()
+
+    def test_invalid_file(self, tmp_path) -> None:
+        """
+        Verify that a file that is not made of whole records is rejected, and that an empty book has no moves.
+        """
+        path = tmp_path / "book.bin"
+        path.write_bytes(b"\x00" * 13)
+        with pytest.raises(ValueError):
+            ChessOpeningBook(str(path))
+        path.write_bytes(b"")
+        assert ChessOpeningBook(str(path)).get_moves(0) == []
+
+    def test_builtin_book(self) -> None:
+        """
+        Verify that the built-in book has moves for the initial position, and that Chess plays them without the engine.
+        """
+        book = ChessOpeningBook.shared()
+        assert book is not None and len(book.get_moves(ChessBoard(INITIAL_FEN).zobristKey)) >= 4
+        c = Chess(mode="Singleplayer")
+        c.move_piece((4, 6), (4, 4))
+        assert c.wait_for_engine_move(None, None) in c.board.get_legal_moves()
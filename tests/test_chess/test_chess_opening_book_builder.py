@@ -0,0 +1,38 @@
+"""
+Module that contains the TestChessOpeningBookBuilder class,
+which is used to test the ChessOpeningBookBuilder class.
+"""
+import os
+import subprocess
+import sys
+import gamehub
+from gamehub.chess.chess_opening_book import ChessOpeningBook
+from gamehub.chess.chess_opening_book_builder import ChessOpeningBookBuilder
+
+class TestChessOpeningBookBuilder:
+    """
+    Class to test the ChessOpeningBookBuilder class.
+    """
+    def test_main(self, tmp_path, capsys) -> None:
+        """
+        Verify that the command line builds the book from the games of the file, skipping the comments and the empty lines.
+        """
+        games, path = tmp_path / "games.txt", tmp_path / "book.bin"
+        games.write_text("# comment\ne2e4 e7e5\n\nd2d4 d7d5\n", encoding="utf-8")
+        assert ChessOpeningBookBuilder().main(["--games", str(games), "--output", str(path), "--max-ply", "1"]) == 0
+        assert "2 records from 2 games" in capsys.readouterr().out
+        book = ChessOpeningBook(str(path))
+        assert book.record_count == 2
+        book.close()
+
+    def test_runs_as_script(self, tmp_path) -> None:
+        """
+        Verify that the builder runs with python -m without warnings (the module is not imported by the package,
+        so runpy does not find it already loaded).
+        """
+        games, path = tmp_path / "games.txt", tmp_path / "book.bin"
+        games.write_text("e2e4 e7e5\n", encoding="utf-8")
+        result = subprocess.run([sys.executable, "-W", "error", "-m", "gamehub.chess.chess_opening_book_builder",
+                                 "--games", str(games), "--output", str(path)],
+                                cwd=os.path.dirname(os.path.dirname(gamehub.__file__)), capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0 and result.stderr == "" and path.exists()
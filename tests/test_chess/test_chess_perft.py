@@ -0,0 +1,63 @@
+"""
+Module that contains the TestChessPerft class,
+which is used to test the ChessPerft class.
+"""
+import pytest
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_perft import ChessPerft
+
+class TestChessPerft:
+    """
+    Class to test the ChessPerft class.
+    """
+    @pytest.mark.parametrize("name, fen, depth, expected",
+                             [(name, fen, depth, nodes)
+                              for name, fen, expected_nodes in ChessPerft.SUITE
+                              for depth, nodes in expected_nodes.items() if depth <= 2])
+    def test_perft_suite(self, name : str, fen : str, depth : int, expected : int) -> None:
+        """
+        Verify the node counts of the benchmark suite (only the fast depths).
+        """
+        assert ChessPerft().perft(ChessBoard(fen), depth) == expected
+
+    def test_perft_leaves_board_unchanged(self) -> None:
+        """
+        Verify that perft restores the board after exploring the move tree.
+        """
+        fen = "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10"
+        board = ChessBoard(fen)
+        ChessPerft().perft(board, 2)
+        assert board == ChessBoard(fen) and board.convert_board_to_fen() == fen
+
+    def test_divide(self) -> None:
+        """
+        Verify that divide reports every root move and that the counts add up to perft.
+        """
+        board = ChessBoard("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1")
+        results = ChessPerft().divide(board, 2)
+        assert len(results) == 14 and sum(results.values()) == 191
+        assert results["g2g3"] == 4 and results["b4f4"] == 2
+
+    def test_main_suite(self, capsys) -> None:
+        """
+        Verify that the command line runs the suite headless and reports the nodes per second.
+        """
+        assert ChessPerft().main(["--suite", "--depth", "2"]) == 0
+        output = capsys.readouterr().out
+        assert "FAIL" not in output and "nodes/s" in output
+
+    def test_divide_parallel(self) -> None:
+        """
+        Verify that the pool of processes gives the same counts, in the same order, as the serial divide.
+        """
+        board = ChessBoard("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10")
+        serial = ChessPerft().divide(board, 2)
+        parallel = ChessPerft(workers=2).divide(board, 2)
+        assert list(parallel.items()) == list(serial.items()) and sum(parallel.values()) == 2079
+
+    def test_benchmark_parallel(self) -> None:
+        """
+        Verify that the benchmark with a pool of processes counts the same nodes.
+        """
+        nodes, _, _ = ChessPerft(workers=2).benchmark(ChessBoard("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"), 2)
+        assert nodes == 191
@@ -2,6 +2,7 @@
 Module that contains the TestChessPiece class,
 which is used to test the ChessPiece class.
 """
+import copy
 from collections import Counter
 import pytest
 from gamehub.chess.chess_piece import ChessPiece
@@ -113,3 +114,56 @@ class TestChessPiece:
         """
         with pytest.raises(ValueError):
             ChessPiece(char, position)
+
+    def test_chess_piece_is_compact(self) -> None:
+        """
+        Verify that the pieces have no __dict__, share the strings of the class tables and are copied and compared by value.
+        """
+        piece = ChessPiece("".join(["n"]), (1, 0)) # A character that is not the literal "n"
+        assert not hasattr(piece, "__dict__")
+        with pytest.raises(AttributeError):
+            piece.moved = True
+        assert piece.piece_char is ChessPiece.PIECE_CHARS["n"] and piece.piece is ChessPiece.PIECE_NAMES["n"]
+        duplicate = copy.copy(piece)
+        assert duplicate == piece and duplicate is not piece and duplicate.piece_symbol == "♘"
+        duplicate.position = (2, 2)
+        assert duplicate != piece and piece.position == (1, 0)
+        assert ChessPiece("N", (1, 0)) != piece
+        # The characters are compared by value, not by identity
+        duplicate = copy.copy(piece)
+        duplicate.piece_char = type("Char", (str,), {})("n")
+        assert duplicate.piece_char is not piece.piece_char and duplicate == piece
+
+    @pytest.mark.parametrize("square, attacker_color, expected",
+                             [((6, 7), "b", False),  # white king
+                              ((6, 0), "w", False),  # black king
+                              ((7, 1), "w", True),   # queen on the h file
+                              ((5, 1), "w", False),  # queen diagonal blocked by the knight on g6
+                              ((4, 3), "b", True),   # knight on g6 and pawn on d6
+                              ((3, 5), "b", True),   # pawn on c4
+                              ((3, 4), "w", True),   # pawn on c3
+                              ((0, 0), "b", True),   # bishop on b7 and queen on c8
+                              ((0, 4), "w", False)])
+    def test_square_under_attack(self, square : tuple[int, int], attacker_color : str, expected : bool) -> None:
+        """
+        Check the squares attacked by the pieces of a color looking outward from the square
+        """
+        matrix = self.chess_piece_matrix_factory()
+        assert ChessPiece.square_under_attack(matrix, square, attacker_color) == expected
+
+    def test_square_under_attack_matches_legal_moves(self) -> None:
+        """
+        Every square must be attacked exactly when it is reached by the capture moves of an enemy piece
+        """
+        matrix = self.chess_piece_matrix_factory()
+        for attacker_color in ("w", "b"):
+            attacked = set()
+            for row in matrix:
+                for piece in row:
+                    if piece is not None and piece.color == attacker_color:
+                        attacked.update(move for move in piece.legal_moves(matrix, False)
+                                        if matrix[move[1]][move[0]] is not None)
+            for y in range(8):
+                for x in range(8):
+                    if matrix[y][x] is not None and matrix[y][x].color != attacker_color:
+                        assert ChessPiece.square_under_attack(matrix, (x, y), attacker_color) == ((x, y) in attacked)
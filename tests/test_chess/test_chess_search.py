@@ -0,0 +1,196 @@
+"""
+Module that contains the TestChessSearch class,
+which is used to test the ChessSearch class (the built-in chess engine).
+"""
+import time
+import pytest
+from gamehub.chess.chess import Chess
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_search import ChessSearch
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+class TestChessSearch:
+    """
+    Class to test the ChessSearch class.
+    """
+    @pytest.mark.parametrize("fen, expected",
+                             [("rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b - - 0 2", ((3, 0), (7, 4), None)),      # Qh4#
+                              ("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1", ((0, 7), (0, 0), None)),                                  # Ra8#
+                              ("r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5Q2/PPPP1PPP/RNB1K1NR w - - 0 4", ((5, 5), (5, 1), None))]) # Qxf7#
+    def test_finds_mate_in_one(self, fen : str, expected : tuple) -> None:
+        """
+        Verify that the search finds the checkmate in one move.
+        """
+        search = ChessSearch(max_time=5)
+        assert search.get_move(fen) == expected and search.score >= ChessSearch.MATE_SCORE - 2
+
+    def test_captures_free_piece(self) -> None:
+        """
+        Verify that the search captures an undefended queen.
+        """
+        assert ChessSearch(max_time=5, max_depth=2).get_move("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1") == ((3, 6), (3, 3), None)
+
+    def test_avoids_losing_the_queen(self) -> None:
+        """
+        Verify that the quiescence search sees that the queen would be recaptured.
+        """
+        move = ChessSearch(max_time=5, max_depth=1).get_move("4k3/2p5/3p4/8/8/8/8/3QK3 w - - 0 1")
+        assert move != ((3, 7), (3, 2), None)
+
+    @pytest.mark.parametrize("fen, gain",
+                             [("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", 100),   # En passant capture
+                              ("4k3/P7/8/8/8/8/8/4K3 w - - 0 1", 700)])     # Quiet promotion
+    def test_quiescence_moves(self, fen : str, gain : int) -> None:
+        """
+        Verify that the quiescence search sees the en passant captures and the quiet promotions to a queen.
+        """
+        search = ChessSearch(max_time=5)
+        search.reset(time.perf_counter(), 5, 64)
+        board = ChessBoard(fen)
+        assert search.quiescence(board, -ChessSearch.MATE_SCORE, ChessSearch.MATE_SCORE, 0) >= search.evaluate(board) + gain
+        assert board.convert_board_to_fen() == fen
+
+    def test_node_budget(self) -> None:
+        """
+        Verify that the search stops when the node budget is exhausted and still returns a legal move.
+        """
+        board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+        search = ChessSearch(max_time=None, max_nodes=500)
+        best_move = search.search(board)
+        assert search.nodes <= 500 and best_move in board.get_legal_moves()
+        assert board.convert_board_to_fen() == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+    def test_info_callback(self) -> None:
+        """
+        Verify that the info of every completed iteration is passed to the callback, with the principal variation.
+        """
+        infos = []
+        ChessSearch(max_time=None, max_depth=3).get_move("rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b - - 0 2", infos.append)
+        assert infos[-1]["score_mate"] == 1 and infos[-1]["pv"][0] == "d8h4"
+        infos = []
+        ChessSearch(max_time=None, max_depth=2).get_move("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", infos.append)
+        assert [info["depth"] for info in infos] == [1, 2] and len(infos[-1]["pv"]) == 2 and "score_cp" in infos[-1]
+
+    def test_async_search_stop(self) -> None:
+        """
+        Verify that the search runs in the background and that stop interrupts it with a legal move.
+        """
+        search = ChessSearch(max_time=None)
+        future = search.get_move_async("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+        search.stop()
+        move = future.result(timeout=10)
+        board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+        assert move in board.get_legal_moves()
+
+    def test_search_limits(self) -> None:
+        """
+        Verify that the limits given to the search replace the budget of the engine, and that the nodes and time used are reported.
+        """
+        search = ChessSearch(max_time=None, max_depth=64)
+        search.get_move("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", limits=ChessSearchLimits(nodes=300))
+        assert search.nodes <= 300 and search.time_used > 0
+        search.get_move("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", limits=ChessSearchLimits(depth=2))
+        assert search.depth == 2
+        search.get_move("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", limits=ChessSearchLimits(movetime=100))
+        assert search.time_used < 1
+
+    def test_no_legal_moves(self) -> None:
+        """
+        Verify that the search returns None when there are no legal moves.
+        """
+        assert ChessSearch().get_move("8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62") is None
+
+    def test_repetition_is_a_draw(self) -> None:
+        """
+        Verify that a position repeated in the search is scored as a draw.
+        """
+        search = ChessSearch(max_time=None, max_depth=2)
+        board = ChessBoard("7k/8/8/8/8/8/8/K6Q w - - 0 1")
+        for start, end in [((0, 7), (1, 7)), ((7, 0), (6, 0)), ((1, 7), (0, 7))]:
+            board.make_move(start, end)
+        search.reset(0.0, None, 2)
+        assert search.negamax(board, 2, -ChessSearch.MATE_SCORE, ChessSearch.MATE_SCORE, 1) != 0
+        board.make_move((6, 0), (7, 0))
+        assert search.negamax(board, 2, -ChessSearch.MATE_SCORE, ChessSearch.MATE_SCORE, 1) == 0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_finds_underpromotion(self, workers : int) -> None:
+        """
+        Verify that the move returned by the search keeps the promotion: e8=N forks the king and the queen.
+        """
+        search = ChessSearch(max_time=None, max_depth=3, workers=workers)
+        try:
+            move = search.get_move("8/4P1k1/3q4/8/8/8/8/K7 w - - 0 1")
+        finally:
+            search.close()
+        assert move == ((4, 1), (4, 0), "N")
+
+    def test_parallel_search(self) -> None:
+        """
+        Verify that the search split between processes finds the mate and reports the depth and the nodes of all of them.
+        """
+        search = ChessSearch(max_time=None, max_depth=2, workers=2)
+        infos = []
+        try:
+            move = search.get_move("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1", infos.append)
+        finally:
+            search.close()
+        assert move == ((0, 7), (0, 0), None)
+        assert search.depth == 2 and search.nodes > 0 and search.executor is None
+        assert len(infos) == 1 and infos[0]["score_mate"] == 1
+
+    def test_parallel_search_is_deterministic(self) -> None:
+        """
+        Verify that the search split between processes finds the same move every time.
+        """
+        fen = "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5Q2/PPPP1PPP/RNB1K1NR w - - 0 4"
+        search = ChessSearch(max_time=None, max_depth=2, workers=2)
+        try:
+            moves = [search.get_move(fen) for _ in range(2)]
+        finally:
+            search.close()
+        assert moves[0] == moves[1] == ((5, 5), (5, 1), None)
+
+    def test_parallel_search_stops_running_tasks(self) -> None:
+        """
+        Verify that stop ends the root moves being searched by the processes (not only the ones not started yet),
+        so the next search does not wait for them.
+        """
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        search = ChessSearch(max_time=None, max_depth=64, workers=2)
+        try:
+            future = search.get_move_async(fen)
+            time.sleep(0.5)
+            start = time.perf_counter()
+            search.stop()
+            move = future.result(timeout=10)
+            stop_elapsed = time.perf_counter() - start
+            start = time.perf_counter()
+            next_move = search.get_move(fen, limits=ChessSearchLimits(depth=1))
+            next_elapsed = time.perf_counter() - start
+        finally:
+            search.close()
+        legal_moves = ChessBoard(fen).get_legal_moves()
+        assert move in legal_moves and next_move in legal_moves
+        assert stop_elapsed < 2.0 and next_elapsed < 2.0
+
+    def test_parallel_search_deadline(self) -> None:
+        """
+        Verify that the search split between processes ends at its deadline, even if the root moves have no time limit left.
+        """
+        search = ChessSearch(max_time=0.3, max_depth=64, workers=2)
+        try:
+            start = time.perf_counter()
+            search.get_move("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+            elapsed = time.perf_counter() - start
+        finally:
+            search.close()
+        assert elapsed < 1.5
+
+    def test_chess_creates_builtin_engine(self) -> None:
+        """
+        Verify that Chess uses the built-in engine when requested.
+        """
+        assert isinstance(Chess("Singleplayer", engine="Builtin").create_engine(), ChessSearch)
+        engine = Chess("Singleplayer", engine="Builtin", workers=3).create_engine()
+        assert engine.workers == 3 and engine.executor is None
@@ -0,0 +1,62 @@
+"""
+Module that contains the TestChessSearchLimits class,
+which is used to test the ChessSearchLimits class.
+"""
+import pytest
+from gamehub.chess.chess import Chess
+from gamehub.chess.chess_search_limits import ChessSearchLimits
+
+class TestChessSearchLimits:
+    """
+    Class to test the ChessSearchLimits class.
+    """
+    @pytest.mark.parametrize("limits, expected",
+                             [(ChessSearchLimits(), "go depth 20\n"),
+                              (ChessSearchLimits(movetime=1000), "go movetime 1000\n"),
+                              (ChessSearchLimits(nodes=50000, depth=12), "go nodes 50000 depth 12\n"),
+                              (ChessSearchLimits(wtime=60000, btime=50000, winc=500, binc=500), "go wtime 60000 btime 50000 winc 500 binc 500\n"),
+                              (ChessSearchLimits(winc=500), "go depth 20\n")])
+    def test_go_command(self, limits : ChessSearchLimits, expected : str) -> None:
+        """
+        Verify the UCI "go" command of the limits (depth 20 when no limit is set).
+        """
+        assert limits.to_go_command() == expected
+
+    def test_invalid_limits(self) -> None:
+        """
+        Verify that zero or negative limits are rejected.
+        """
+        with pytest.raises(ValueError):
+            ChessSearchLimits(movetime=0)
+        with pytest.raises(ValueError):
+            ChessSearchLimits(winc=-1)
+
+    def test_time_budget(self) -> None:
+        """
+        Verify the time given to a move: movetime, a share of the clock plus the increment, or no limit.
+        """
+        assert ChessSearchLimits().time_budget("w") is None
+        assert ChessSearchLimits(movetime=250).time_budget("b") == 0.25
+        limits = ChessSearchLimits(wtime=30000, btime=3000, winc=1000)
+        assert limits.time_budget("w") == pytest.approx(1.75)
+        assert limits.time_budget("b") == pytest.approx(0.1)
+        assert ChessSearchLimits(wtime=30000, movetime=200).time_budget("w") == pytest.approx(0.2)
+        # Never more than the time left on the clock
+        assert ChessSearchLimits(wtime=60, winc=10000).time_budget("w") == pytest.approx(0.01)
+
+    def test_update_clock(self) -> None:
+        """
+        Verify that a move subtracts the time spent from the clock of the player and adds its increment.
+        """
+        limits = ChessSearchLimits(wtime=60000, btime=60000, winc=2000)
+        limits.update_clock("w", 5.0)
+        limits.update_clock("b", 1.5)
+        assert limits.wtime == 57000 and limits.btime == 58500
+
+    def test_chess_updates_clock(self) -> None:
+        """
+        Verify that Chess updates the clock of the player that moves.
+        """
+        c = Chess(limits=ChessSearchLimits(wtime=60000, btime=60000, winc=1000))
+        c.move_piece((4, 6), (4, 4))
+        assert 60000 < c.limits.wtime <= 61000 and c.limits.btime == 60000
@@ -0,0 +1,80 @@
+"""
+Module that contains the TestTranspositionTable class,
+which is used to test the TranspositionTable class.
+"""
+import pytest
+from gamehub.chess.chess_search import ChessSearch
+from gamehub.chess.chess_transposition_table import TranspositionTable
+
+class TestTranspositionTable:
+    """
+    Class to test the TranspositionTable class.
+    """
+    @pytest.mark.parametrize("size_mb", [1, 16, 128])
+    def test_size_within_memory_budget(self, size_mb : int) -> None:
+        """
+        Verify that the number of entries is a power of two that fits the memory budget.
+        """
+        table = TranspositionTable(size_mb)
+        assert table.size & (table.size - 1) == 0
+        assert table.size * TranspositionTable.ENTRY_SIZE <= size_mb * 1024 * 1024 < 2 * table.size * TranspositionTable.ENTRY_SIZE
+
+    def test_invalid_size(self) -> None:
+        """
+        Verify that a non positive size raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            TranspositionTable(0)
+
+    def test_store_and_probe(self) -> None:
+        """
+        Verify that a stored entry is found and that the hit/miss counters are updated.
+        """
+        table = TranspositionTable(1)
+        key = 0x123456789ABCDEF
+        assert table.probe(key) is None
+        table.store(key, 3, 42, TranspositionTable.LOWER_BOUND, ((4, 6), (4, 4), None))
+        assert table.probe(key) == (key, 3, 42, TranspositionTable.LOWER_BOUND, ((4, 6), (4, 4), None), 0)
+        assert table.probe(key + table.size) is None
+        stats = table.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 2 and stats["stores"] == 1
+
+    def test_depth_preferred_replacement(self) -> None:
+        """
+        Verify that, in the same search, a shallower result does not replace a deeper one of another position.
+        """
+        table = TranspositionTable(1)
+        table.store(5, 6, 10, TranspositionTable.EXACT, None)
+        table.store(5 + table.size, 2, 20, TranspositionTable.EXACT, None)
+        assert table.probe(5) is not None and table.probe(5 + table.size) is None
+        table.store(5 + table.size, 6, 20, TranspositionTable.EXACT, None)
+        assert table.probe(5) is None and table.get_stats()["overwrites"] == 1
+
+    def test_age_replacement(self) -> None:
+        """
+        Verify that the results of a previous search are always replaceable.
+        """
+        table = TranspositionTable(1)
+        table.store(7, 8, 10, TranspositionTable.EXACT, None)
+        table.new_search()
+        table.store(7 + table.size, 1, 20, TranspositionTable.EXACT, None)
+        assert table.probe(7) is None and table.probe(7 + table.size)[2] == 20
+
+    def test_same_position_keeps_best_move(self) -> None:
+        """
+        Verify that storing a position again without a best move keeps the previous best move.
+        """
+        table = TranspositionTable(1)
+        move = ((4, 6), (4, 4), None)
+        table.store(9, 2, 10, TranspositionTable.EXACT, move)
+        table.store(9, 3, -5, TranspositionTable.UPPER_BOUND, None)
+        assert table.probe(9)[4] == move
+
+    def test_search_uses_table(self) -> None:
+        """
+        Verify that the search stores and reuses its results.
+        """
+        search = ChessSearch(max_time=None, max_depth=3, hash_size=1)
+        search.get_move("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w - - 0 3")
+        stats = search.transposition_table.get_stats()
+        assert stats["stores"] > 0 and stats["hits"] > 0
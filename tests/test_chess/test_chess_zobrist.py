@@ -0,0 +1,78 @@
+"""
+Module that contains the TestChessZobrist class,
+which is used to test the ChessZobrist class and the Zobrist hash of ChessBoard.
+"""
+import random
+import pytest
+from gamehub.chess.chess import Chess
+from gamehub.chess.chess_board import ChessBoard
+from gamehub.chess.chess_zobrist import ChessZobrist
+
+class TestChessZobrist:
+    """
+    Class to test the Zobrist hash of the chess positions.
+    """
+    def test_keys_are_deterministic(self) -> None:
+        """
+        Verify that the keys do not change between instances (so they can be stored on disk).
+        """
+        first, second = ChessZobrist(), ChessZobrist()
+        assert first.piece_keys == second.piece_keys and first.castling_keys == second.castling_keys
+        assert all(0 <= key < 2 ** 64 for keys in first.piece_keys.values() for key in keys)
+
+    @pytest.mark.parametrize("fen, other_fen",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 0 1"),
+                              ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w Kkq - 0 1"),
+                              ("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1", "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"),
+                              ("8/8/4k3/8/8/8/2q5/K7 w - - 0 47", "8/8/4k3/8/8/8/2Q5/K7 w - - 0 47")])
+    def test_key_covers_position_state(self, fen : str, other_fen : str) -> None:
+        """
+        Verify that the side to move, the castling rights, the en passant square and the pieces change the key.
+        """
+        assert ChessBoard(fen).zobristKey != ChessBoard(other_fen).zobristKey
+
+    def test_key_ignores_counters(self) -> None:
+        """
+        Verify that the half move and full move counters do not change the key.
+        """
+        assert ChessBoard("8/8/4k3/8/8/8/2q5/K7 w - - 0 47").zobristKey == ChessBoard("8/8/4k3/8/8/8/2q5/K7 w - - 12 80").zobristKey
+
+    def test_transposition_has_same_key(self) -> None:
+        """
+        Verify that the same position reached with different move orders has the same key.
+        """
+        first, second = Chess(), Chess()
+        for start, end in [((6, 7), (5, 5)), ((6, 0), (5, 2)), ((1, 7), (2, 5))]:
+            first.move_piece(start, end)
+        for start, end in [((1, 7), (2, 5)), ((6, 0), (5, 2)), ((6, 7), (5, 5))]:
+            second.move_piece(start, end)
+        assert first.board.zobristKey == second.board.zobristKey
+
+    def test_incremental_key_in_random_games(self) -> None:
+        """
+        Play random games with Chess.move_piece and verify that the incremental key
+        is always equal to the key computed from scratch, and that unmake_move restores it.
+        """
+        generator = random.Random(42)
+        for _ in range(3):
+            chess = Chess()
+            for _ in range(60):
+                moves = chess.board.get_legal_moves()
+                if not moves:
+                    break
+                start, end, promotion = generator.choice(moves)
+                key = chess.board.zobristKey
+                undo = chess.board.make_move(start, end, promotion)
+                chess.board.unmake_move(undo)
+                assert chess.board.zobristKey == key
+                chess.move_piece(start, end)
+                assert chess.board.zobristKey == chess.board.compute_zobrist_key()
+
+    def test_promotion_updates_key(self) -> None:
+        """
+        Verify that the promotion of Chess.detect_promotion_and_promote updates the key.
+        """
+        chess = Chess(fen="P7/1PK5/5k2/5pp1/8/8/8/8 w - - 0 67")
+        key = chess.board.zobristKey
+        chess.detect_promotion_and_promote()
+        assert chess.board.zobristKey != key and chess.board.zobristKey == chess.board.compute_zobrist_key()
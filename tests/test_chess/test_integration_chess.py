@@ -3,7 +3,11 @@ Module to test the TestChess class,
 which is used to test the Chess class.
 """
 from gamehub.chess.chess import Chess
+from gamehub.chess.chess_bitboard import ChessBitboard
 from gamehub.chess.chess_engine import ChessEngine
+from gamehub.chess.chess_engine_pool import ChessEnginePool
+from gamehub.chess.chess_move_cache import ChessMoveCache
+from gamehub.chess.chess_search_limits import ChessSearchLimits
 import pytest # type: ignore
 
 class TestChess:
@@ -57,8 +61,8 @@ class TestChess:
         """
         # We need to mock the chess engine to return the moves we want 
         def chess_engine_best_move_factory():
-            best_moves = [(4, 1 , 4, 3), # e7e5
-                          (3, 0, 7, 4)]  # d8h4 (checkmate)
+            best_moves = [((4, 1), (4, 3), None), # e7e5
+                          ((3, 0), (7, 4), None)]  # d8h4 (checkmate)
             for best_move in best_moves:
                 yield best_move
 
@@ -70,6 +74,12 @@ class TestChess:
         monkeypatch.setattr(ChessEngine, "__init__", lambda *args: None)
         monkeypatch.setattr(ChessEngine, "get_move", get_next_best_move)
         monkeypatch.setattr(ChessEngine, "close", lambda *args: None)
+        monkeypatch.setattr(ChessEngine, "is_alive", lambda *args: True)
+        monkeypatch.setattr(ChessEngine, "new_game", lambda *args: None)
+        monkeypatch.setattr(ChessEngine, "nodes", 0, raising=False)
+        monkeypatch.setattr(ChessEngine, "time_used", 0.0, raising=False)
+        monkeypatch.setattr(ChessEnginePool, "shared_pools", {})
+        monkeypatch.setattr(ChessMoveCache, "shared_cache", None)
 
         # Mock the user input
         def input_factory():
@@ -92,10 +102,42 @@ class TestChess:
         monkeypatch.setattr(Chess, "init_curses", mock_init_curses)
         monkeypatch.setattr(Chess, "check_terminal_size", lambda *args: True)
         monkeypatch.setattr(Chess, "update_screen", lambda *args: None)
+        monkeypatch.setattr(Chess, "poll_while_thinking", lambda *args: False)
 
         c = Chess()
         c.single_player_gameloop(None)
         assert c.checkmate == True
+        assert len(ChessEnginePool.shared(c.pool_size, c.hash_size).idle) == 1 # the engine is given back to the pool
+
+    def test_engine_pool_settings(self, monkeypatch) -> None:
+        """
+        Verify that the Stockfish engines are taken from the shared pool with the size and the hash size of the game.
+        """
+        monkeypatch.setattr(ChessEnginePool, "shared_pools", {})
+        monkeypatch.setattr(ChessEnginePool, "checkout", lambda self: self)
+        monkeypatch.setattr(ChessEnginePool, "release", lambda self, engine: None)
+        first = Chess("Singleplayer", hash_size=64, use_opening_book=False).checkout_engine()
+        second = Chess("Singleplayer", hash_size=256, pool_size=4, use_opening_book=False).checkout_engine()
+        assert (first.size, first.hash_size) == (2, 64) and (second.size, second.hash_size) == (4, 256)
+
+    def test_single_player_gameloop_underpromotion(self, monkeypatch):
+        """
+        Test that the underpromotion chosen by the engine is played by the gameloop.
+        After h2h3 the built-in engine promotes e2e1 to a knight, forking the king and the queen.
+        """
+        inputs = iter([(35, 18, False), (35, 15, False), # h2h3
+                       (0, 0, True)])                    # ESC
+        monkeypatch.setattr(Chess, "get_input", lambda *args: next(inputs))
+        monkeypatch.setattr(Chess, "init_curses", lambda self, *args: (None, None, None))
+        monkeypatch.setattr(Chess, "check_terminal_size", lambda *args: True)
+        monkeypatch.setattr(Chess, "update_screen", lambda *args: None)
+        monkeypatch.setattr(Chess, "poll_while_thinking", lambda *args: False)
+
+        c = Chess("Singleplayer", fen="k7/8/8/8/8/3Q4/4p1KP/8 w - - 0 1", engine="Builtin",
+                  limits=ChessSearchLimits(depth=3), move_cache=ChessMoveCache(), use_opening_book=False)
+        c.single_player_gameloop(None)
+        assert c.board.matrix[7][4].piece_char == "n"
+        assert c.board.convert_board_to_fen().startswith("k7/8/8/8/8/3Q3P/6K1/4n3 w")
 
     @pytest.mark.parametrize("fen, expected",
                              [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", ("w", 1)),
@@ -108,7 +150,7 @@ class TestChess:
         assert c.current_player == expected[0] and c.turn == expected[1]
 
     @pytest.mark.parametrize("starting_fen, start, end, expected",
-                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (4, 6), (4, 4), "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2"), # e4
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (4, 6), (4, 4), "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"), # e4
                               ("8/5b2/8/P5kp/1P3pp1/3R4/2K5/8 b - - 0 32", (7, 3), (7, 4), "8/5b2/8/P5k1/1P3ppp/3R4/2K5/8 w - - 0 33")])
     def test_move_piece(self, starting_fen : str, start : tuple[int, int], end : tuple[int, int], expected : str) -> None:
         """
@@ -119,6 +161,52 @@ class TestChess:
         c.move_piece(start, end)
         assert c.board.convert_board_to_fen() == expected
 
+    def test_move_piece_full_move_counter(self) -> None:
+        """
+        Verify that the full move counter is incremented after the moves of Black only, and that the turn follows it.
+        """
+        c = Chess()
+        c.move_piece((4, 6), (4, 4))
+        assert c.board.convert_board_to_fen().endswith(" b KQkq - 0 1") and c.turn == 1
+        c.move_piece((4, 1), (4, 3))
+        assert c.board.convert_board_to_fen().endswith(" w KQkq - 0 2") and c.turn == 2
+
+    def test_draw_by_threefold_repetition(self) -> None:
+        """
+        Verify that the game is drawn when the same position occurs for the third time.
+        """
+        c = Chess()
+        knight_moves = [((6, 7), (5, 5)), ((6, 0), (5, 2)), ((5, 5), (6, 7)), ((5, 2), (6, 0))]
+        for start, end in knight_moves * 2:
+            assert c.draw is None
+            c.move_piece(start, end)
+            c.check, c.checkmate, c.stalemate = c.detect_check_checkmate_stalemate()
+        assert c.draw == "threefold repetition" and not c.stalemate
+
+    @pytest.mark.parametrize("fen, start, end, expected",
+                             [("8/8/4k3/8/8/8/4K3/8 w - - 99 80", (4, 6), (4, 7), "fifty-move rule"),
+                              ("7k/8/6K1/8/8/8/8/R7 w - - 99 80", (0, 7), (0, 0), None)])   # The checkmate wins
+    def test_draw_by_fifty_move_rule(self, fen : str, start : tuple[int, int], end : tuple[int, int], expected : str) -> None:
+        """
+        Verify that the game is drawn after fifty moves of each player without captures or pawn moves, unless the last move is a checkmate.
+        """
+        c = Chess(fen=fen)
+        c.move_piece(start, end)
+        c.check, c.checkmate, c.stalemate = c.detect_check_checkmate_stalemate()
+        assert c.draw == expected and c.checkmate == (expected is None)
+
+    def test_move_piece_castling_and_promotion(self) -> None:
+        """
+        Verify that the castlings are legal moves of the king in the game, and that move_piece applies them
+        and the promotions without scanning the board after the move.
+        """
+        c = Chess(fen="r3k2r/1P6/8/8/8/8/8/R3K2R w KQkq - 0 1")
+        assert (6, 7) in c.get_legal_moves((4, 7)) and (2, 7) in c.get_legal_moves((4, 7))
+        c.move_piece((4, 7), (6, 7))
+        assert c.board.convert_board_to_fen() == "r3k2r/1P6/8/8/8/8/8/R4RK1 b kq - 1 1"
+        c.move_piece((4, 0), (3, 0))
+        c.move_piece((1, 1), (0, 0), "N")
+        assert c.board.convert_board_to_fen() == "N2k3r/8/8/8/8/8/8/R4RK1 b - - 0 2"
 
     @pytest.mark.parametrize("fen, expected",
                              [("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2", "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 2"),
@@ -147,3 +235,54 @@ class TestChess:
         c = Chess(fen=fen)
         check, checkmate, stalemate = c.detect_check_checkmate_stalemate()
         assert check == expected[0] and checkmate == expected[1] and stalemate == expected[2]
+
+    @pytest.mark.parametrize("fen", ["rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1",
+                                     "8/5p2/p4K2/3pp3/8/1P3q2/1kr2R2/8 w - - 0 43",
+                                     "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 b - - 0 10",
+                                     "7k/4P3/8/8/8/8/8/K7 w - - 0 1",
+                                     "1r5k/8/8/8/8/8/6p1/K6R b - - 0 1"])
+    def test_legal_move_table(self, fen : str) -> None:
+        """
+        Verify that the legal move table has the same moves of ChessPiece.legal_moves for every piece of the current player.
+        """
+        c = Chess(fen=fen)
+        table = c.get_legal_move_table()
+        for y in range(8):
+            for x in range(8):
+                piece = c.board.matrix[y][x]
+                if piece is not None and piece.color == c.current_player:
+                    assert sorted(table[(x, y)]) == sorted(piece.legal_moves(c.board.matrix))
+                else:
+                    assert (x, y) not in table and c.get_legal_moves((x, y)) == []
+        assert c.get_all_possible_moves_count() == len(c.board.get_legal_moves())
+        assert c.get_all_possible_moves_count() == ChessBitboard(c.board).legal_moves_count(c.current_player)
+
+    def test_legal_move_table_computed_once_per_position(self, monkeypatch) -> None:
+        """
+        Verify that the legal moves are generated once per position, and again after a move.
+        """
+        calls = []
+        original = ChessBitboard.legal_move_table
+        def counting_legal_move_table(self, color):
+            calls.append(color)
+            return original(self, color)
+        monkeypatch.setattr(ChessBitboard, "legal_move_table", counting_legal_move_table)
+
+        c = Chess()
+        c.get_legal_moves((4, 6))
+        c.get_all_possible_moves_count()
+        assert calls == ["w"]
+        c.move_piece((4, 6), (4, 4))
+        c.check, c.checkmate, c.stalemate = c.detect_check_checkmate_stalemate()
+        assert sorted(c.get_legal_moves((4, 1))) == [(4, 2), (4, 3)]
+        assert calls == ["w", "b"]
+
+    def test_detection_stops_at_first_legal_move(self) -> None:
+        """
+        Verify that the end of game detection does not generate all the legal moves, and that it reuses the table when it exists.
+        """
+        c = Chess(fen="8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62")
+        assert c.checkmate and c.legal_move_table is None
+        c = Chess()
+        assert c.legal_move_table is None and c.has_any_legal_move()
+        assert c.get_all_possible_moves_count() == 20 and c.has_any_legal_move()
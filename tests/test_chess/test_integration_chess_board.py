@@ -56,3 +56,164 @@ class TestChessBoardIntegration:
         """
         board = ChessBoard(fen)
         assert board.detect_king_coordinates(color) == expected
+
+    @pytest.mark.parametrize("fen, start, end, expected",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", (4, 6), (4, 4), "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b - - 0 1"),
+                              ("8/5b2/8/P5kp/1P3pp1/3R4/2K5/8 b - - 0 32", (5, 1), (3, 3), "8/8/8/P2b2kp/1P3pp1/3R4/2K5/8 w - - 1 33"),
+                              ("8/5b2/8/P5kp/1P3pp1/3R4/2K5/8 b - - 0 32", (6, 4), (6, 5), "8/5b2/8/P5kp/1P3p2/3R2p1/2K5/8 w - - 0 33"),
+                              ("1k6/1PK5/8/8/8/8/8/8 w - - 0 67", (1, 1), (1, 0), "1Q6/2K5/8/8/8/8/8/8 b - - 0 67")])
+    def test_make_move(self, fen : str, start : tuple[int, int], end : tuple[int, int], expected : str) -> None:
+        """
+        Verify that make_move applies the move (with promotion to a queen) and updates the counters.
+        """
+        board = ChessBoard(fen)
+        board.make_move(start, end)
+        assert board.convert_board_to_fen() == expected
+
+    @pytest.mark.parametrize("fen",
+                             ["rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1",
+                              "2qrr1k1/1b3ppp/p2p2n1/1p5Q/2p1P3/2PB2B1/PP3PPP/3RRNK1 b - - 5 20",
+                              "1k3rr1/npp5/p7/8/8/5p2/PPP3p1/1KQ5 b - - 0 34",
+                              "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                              "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"])
+    def test_make_unmake_move_restores_board(self, fen : str) -> None:
+        """
+        Verify that, for every legal move, unmake_move restores exactly the board before make_move.
+        """
+        board = ChessBoard(fen)
+        reference = ChessBoard(fen)
+        for start, end, promotion in board.get_legal_moves():
+            undo = board.make_move(start, end, promotion)
+            board.unmake_move(undo)
+            assert board == reference
+            assert all(piece.position == (x, y) for y, row in enumerate(board.matrix) for x, piece in enumerate(row) if piece is not None)
+
+    @pytest.mark.parametrize("fen, expected",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", 20),
+                              ("8/8/4k3/8/8/8/2q5/K7 w - - 0 47", 0),
+                              ("8/5p2/p4K2/3pp3/8/1P3q2/1kr2R2/8 w - - 0 43", 5),
+                              ("1k3rr1/npp5/p7/8/8/5p2/PPP3p1/1KQ5 b - - 0 34", 28)])   # g2g1 with the four promotions
+    def test_get_legal_moves(self, fen : str, expected : int) -> None:
+        """
+        Verify the number of legal moves of the player to move.
+        """
+        assert len(ChessBoard(fen).get_legal_moves()) == expected
+
+    @pytest.mark.parametrize("fen, start, end, promotion, expected",
+                             [("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", (4, 7), (6, 7), None, "r3k2r/8/8/8/8/8/8/R4RK1 b kq - 1 1"),     # White castles kingside
+                              ("r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1", (4, 0), (2, 0), None, "2kr3r/8/8/8/8/8/8/R3K2R w KQ - 1 2"),     # Black castles queenside
+                              ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", (0, 7), (0, 0), None, "R3k2r/8/8/8/8/8/8/4K2R b Kk - 0 1"),      # Both queenside rights are lost
+                              ("rnbqkbnr/ppp1pppp/8/8/3p4/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (4, 6), (4, 4), None,
+                               "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"),                                        # The en passant square is set
+                              ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", (4, 6), (4, 4), None,
+                               "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"),                                          # No pawn can capture en passant
+                              ("rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1", (3, 4), (4, 5), None,
+                               "rnbqkbnr/ppp1pppp/8/8/8/4p3/PPPP1PPP/RNBQKBNR w KQkq - 0 2"),                                          # En passant capture
+                              ("1k6/1PK5/8/8/8/8/8/8 w - - 0 67", (1, 1), (1, 0), "N", "1N6/2K5/8/8/8/8/8/8 b - - 0 67")])             # Underpromotion
+    def test_make_move_special_moves(self, fen : str, start : tuple[int, int], end : tuple[int, int], promotion : str, expected : str) -> None:
+        """
+        Verify that make_move applies castlings, en passant captures and promotions, updating the castling rights,
+        the en passant square and the Zobrist key, and that unmake_move restores the board.
+        """
+        board = ChessBoard(fen)
+        undo = board.make_move(start, end, promotion)
+        assert board.convert_board_to_fen() == expected
+        assert board.zobristKey == board.compute_zobrist_key() == ChessBoard(expected).zobristKey
+        board.unmake_move(undo)
+        assert board == ChessBoard(fen) and board.zobristKey == ChessBoard(fen).zobristKey
+        assert all(piece.position == (x, y) for y, row in enumerate(board.matrix) for x, piece in enumerate(row) if piece is not None)
+
+    @pytest.mark.parametrize("fen, expected",
+                             [("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", {"e1g1", "e1c1"}),
+                              ("r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1", {"e1g1"}),
+                              ("r3k2r/8/8/8/8/8/8/RN2K1NR w KQkq - 0 1", set()),          # The squares between king and rook are occupied
+                              ("r3k2r/8/8/8/4r3/8/8/R3K2R w KQkq - 0 1", set()),          # The king is in check
+                              ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", {"e1g1", "e1c1"}),
+                              ("r3k2r/8/8/8/8/8/6r1/R3K2R w KQkq - 0 1", {"e1c1"}),       # The king would end in check
+                              ("r3k2r/8/8/8/8/8/3r4/R3K2R w KQkq - 0 1", {"e1g1"}),       # The king would cross an attacked square
+                              ("r3k2r/8/8/8/8/8/1r6/R3K2R w KQkq - 0 1", {"e1g1", "e1c1"})]) # Only the rook crosses the attacked square
+    def test_castling_moves(self, fen : str, expected : set[str]) -> None:
+        """
+        Verify the castlings generated by get_legal_moves.
+        """
+        board = ChessBoard(fen)
+        castlings = {board.convert_move_to_algebraic(start, end) for start, end, _ in board.get_legal_moves()
+                     if board.matrix[start[1]][start[0]].piece == "King" and abs(end[0] - start[0]) == 2}
+        assert castlings == expected
+
+    def test_en_passant_capture_evades_check(self) -> None:
+        """
+        Verify that the en passant capture of the pawn that gives check is generated (and is the only legal move).
+        """
+        board = ChessBoard("3r1r2/8/8/3pP3/4K3/r7/8/b6k w - d6 0 1")
+        assert board.get_legal_moves() == [((4, 3), (3, 2), None)]
+
+    def test_repetition_count(self) -> None:
+        """
+        Verify that the position counts are updated by make_move, restored by unmake_move and reset by a pawn move.
+        """
+        board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+        knight_moves = [((6, 7), (5, 5)), ((6, 0), (5, 2)), ((5, 5), (6, 7)), ((5, 2), (6, 0))]
+        undos = [board.make_move(start, end) for start, end in knight_moves * 2]
+        assert board.repetition_count() == 3 and board.is_threefold_repetition() and board.halfMoveCounter == 8
+        board.unmake_move(undos.pop())
+        assert board.repetition_count() == 2 and not board.is_threefold_repetition()
+        undo = board.make_move((4, 1), (4, 3))
+        assert board.halfMoveCounter == 0 and board.positionCounts == {board.zobristKey: 1}
+        board.unmake_move(undo)
+        assert board.repetition_count() == 2 and board.halfMoveCounter == 7
+        for undo in reversed(undos):
+            board.unmake_move(undo)
+        assert board.positionCounts == {board.zobristKey: 1} and board.positionCountsStack == []
+
+    def test_repetition_history_does_not_depend_on_half_move_counter(self) -> None:
+        """
+        Verify that unmake_move restores the position counts from the undo information,
+        even if the half move counter has been changed after the move.
+        """
+        board = ChessBoard("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+        counts = dict(board.positionCounts)
+        undo = board.make_move((4, 6), (4, 4))
+        board.halfMoveCounter = 5
+        board.unmake_move(undo)
+        assert board.positionCounts == counts and board.positionCountsStack == []
+        undo = board.make_move((6, 7), (5, 5))
+        board.halfMoveCounter = 0
+        board.unmake_move(undo)
+        assert board.positionCounts == counts and board.positionCountsStack == []
+
+    @pytest.mark.parametrize("fen, start, end, expected",
+                             [("8/8/4k3/8/8/8/4K3/8 w - - 99 80", (4, 6), (4, 7), True),      # The 100th half move
+                              ("8/8/4k3/8/8/8/4K3/8 w - - 98 80", (4, 6), (4, 7), False),
+                              ("8/8/4k3/8/8/3p4/4K3/8 w - - 99 80", (4, 6), (3, 5), False)])  # A capture resets the counter
+    def test_fifty_move_rule(self, fen : str, start : tuple[int, int], end : tuple[int, int], expected : bool) -> None:
+        """
+        Verify the half move counter and the fifty-move rule.
+        """
+        board = ChessBoard(fen)
+        board.make_move(start, end)
+        assert board.is_fifty_move_rule() == expected
+
+    def test_king_positions_index(self) -> None:
+        """
+        Verify that the king positions are updated by make_move and restored by unmake_move.
+        """
+        board = ChessBoard("8/5b2/8/P5kp/1P3pp1/3R4/2K5/8 b - - 0 32")
+        assert board.kingPositions == {"w": (2, 6), "b": (6, 3)}
+        undo_black = board.make_move((6, 3), (5, 2))
+        undo_white = board.make_move((2, 6), (3, 7))
+        assert board.detect_king_coordinates("b") == (5, 2) and board.detect_king_coordinates("w") == (3, 7)
+        board.unmake_move(undo_white)
+        board.unmake_move(undo_black)
+        assert board.kingPositions == board.locate_kings() == {"w": (2, 6), "b": (6, 3)}
+
+    @pytest.mark.parametrize("fen, color, expected",
+                             [("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1", "w", False),
+                              ("8/5p2/p4K2/3pp3/8/1P3q2/1kr2R2/8 w - - 0 43", "w", True),
+                              ("8/8/4K3/8/8/8/2R5/k2R4 b - - 0 62", "b", True),
+                              ("8/8/8/8/8/8/8/k7 w - - 0 1", "w", False)])
+    def test_king_under_attack(self, fen : str, color : str, expected : bool) -> None:
+        """
+        Verify that the check detection based on the king positions index works, also when the king is missing.
+        """
+        assert ChessBoard(fen).king_under_attack(color) == expected
@@ -7,6 +7,7 @@ import pytest # type: ignore
 from gamehub.snake import Snake
 from gamehub.game_of_life import GameOfLife
 from gamehub.chess.chess import Chess
+from gamehub.chess.chess_analysis import ChessAnalysis
 from gamehub.word_guesser import WordGuesser
 from gamehub.gamehub import GameHub
 
@@ -39,14 +40,18 @@ class TestIntegrationGameHub:
                 game="game_of_life",
                 speed=100,
                 mode="Automatic",
-                density=30)
+                density=30,
+                engine="python",
+                generations=10**6,
+                max_nodes=20000)
         
         monkeypatch.setattr(GameHub, "setup_parsers", namespace_generator)
         monkeypatch.setattr(GameOfLife, "init_game", lambda n: None)
 
         g = GameHub()
         game = g.run()
-        assert game.speed == 100 and game.mode == "Automatic" and game.density == 30
+        assert game.speed == 100 and game.mode == "Automatic" and game.density == 30 and game.engine == "python" and game.generations == 1000 # bounded
+        assert game.max_nodes == 20000
 
     def test_integration_arguments_chess(self, monkeypatch) -> None:
         """
@@ -55,14 +60,56 @@ class TestIntegrationGameHub:
         def namespace_generator(self) -> argparse.Namespace:
             return argparse.Namespace(
                 game="chess",
-                mode="Multiplayer")
+                mode="Multiplayer",
+                engine="Builtin",
+                hash=16,
+                movetime=500,
+                nodes=None,
+                depth=None,
+                wtime=60000,
+                btime=60000,
+                winc=1000,
+                binc=-5,
+                workers=0,
+                pool_size=100,
+                move_cache=None,
+                no_book=True)
         
         monkeypatch.setattr(GameHub, "setup_parsers", namespace_generator)
         monkeypatch.setattr(Chess, "init_game", lambda n: None)
 
         g = GameHub()
         game = g.run()
-        assert game.mode == "Multiplayer"
+        assert game.mode == "Multiplayer" and game.engine == "Builtin" and game.hash_size == 16
+        assert game.limits.movetime == 500 and game.limits.nodes is None and game.limits.wtime == 60000 and game.limits.winc == 1000
+        assert game.limits.binc == 0 # bounded
+        assert game.opening_book is None
+        assert game.workers == 1 and game.pool_size == 64 # bounded
+
+    def test_integration_arguments_chess_analysis(self, monkeypatch) -> None:
+        """
+        Test the interaction between GameHub and ChessAnalysis when the user specifies 'chess_analysis'.
+        """
+        def namespace_generator(self) -> argparse.Namespace:
+            return argparse.Namespace(
+                game="chess_analysis",
+                input="positions.epd",
+                output="-",
+                workers=1000,
+                chunk_size=64,
+                engine="Builtin",
+                hash=8,
+                movetime=None,
+                nodes=None,
+                depth=3)
+
+        monkeypatch.setattr(GameHub, "setup_parsers", namespace_generator)
+        monkeypatch.setattr(ChessAnalysis, "init_game", lambda n: None)
+
+        g = GameHub()
+        game = g.run()
+        assert game.input_path == "positions.epd" and game.workers == 256 and game.chunk_size == 64 # bounded
+        assert game.engine == "Builtin" and game.hash_size == 8 and game.limits.depth == 3 and not game.limits.has_clock()
 
     def test_integration_arguments_word_guesser(self, monkeypatch) -> None:
         """
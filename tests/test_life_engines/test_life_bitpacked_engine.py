@@ -0,0 +1,36 @@
+"""
+Module that contains the TestLifeBitpackedEngine class,
+which is used to test the specific behavior of the LifeBitpackedEngine class
+(the generations shared by all the engines, also with rows longer than 64 cells, are tested in test_life_engines).
+"""
+from gamehub.life_engines.life_bitpacked_engine import LifeBitpackedEngine
+
+class TestLifeBitpackedEngine:
+    """
+    Class to test the LifeBitpackedEngine class.
+    """
+    def test_every_neighbor_count(self) -> None:
+        """
+        Verify the adders with every number of neighbors (0 to 8) of a dead and of a live cell.
+        The cell is in the center of a 3x3 grid and the neighbors are set in order.
+        """
+        neighbors = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)]
+        for cell in (0, 1):
+            for count in range(9):
+                matrix = [[0, 0, 0], [0, cell, 0], [0, 0, 0]]
+                for y, x in neighbors[:count]:
+                    matrix[y][x] = 1
+                engine = LifeBitpackedEngine(3, 3)
+                engine.load(matrix)
+                engine.step()
+                assert engine.to_matrix()[1][1] == int(count == 3 or (count == 2 and cell == 1))
+
+    def test_packed_rows(self) -> None:
+        """
+        Verify that every row is stored in an int, with the first column in the lowest bit.
+        """
+        engine = LifeBitpackedEngine(2, 4)
+        engine.load([[1, 0, 0, 1], [0, 1, 1, 0]])
+        assert engine.grid == [0b1001, 0b0110]
+        engine.step(2)
+        assert engine.to_matrix() == [[0, 1, 1, 0], [0, 1, 1, 0]] and engine.generation == 2
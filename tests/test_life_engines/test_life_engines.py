@@ -0,0 +1,82 @@
+"""
+Module that contains the TestLifeEngines class,
+which is used to test every engine of GameOfLife.ENGINES against GameOfLife.update_matrix.
+"""
+import random
+import pytest
+from gamehub.game_of_life import GameOfLife
+
+# The engines that simulate an unbounded plane (the cells that leave the grid keep evolving outside of it)
+UNBOUNDED_ENGINES = {"hashlife", "sparse-unbounded"}
+
+class TestLifeEngines:
+    """
+    Class to test the interface and the generations shared by all the engines.
+    """
+    def create_engine(self, engine_name : str, rows : int, cols : int) -> object:
+        """
+        Create the engine of GameOfLife.ENGINES with the given name (the test is skipped if it needs NumPy and it is not installed).
+        """
+        if engine_name == "numpy":
+            pytest.importorskip("numpy")
+        return GameOfLife.ENGINES[engine_name](rows, cols)
+
+    def reference_generations(self, matrix : list[list[int]], generations : int, unbounded : bool) -> list[list[list[int]]]:
+        """
+        Compute the generations of the matrix with update_matrix.
+        For an unbounded plane the matrix is surrounded by a margin of dead cells that the pattern cannot reach,
+        and the generations are cropped to the matrix.
+        """
+        rows, cols = len(matrix), len(matrix[0])
+        margin = generations + 1 if unbounded else 0
+        plane = [[0] * (cols + 2 * margin) for _ in range(rows + 2 * margin)]
+        for y in range(rows):
+            plane[y + margin][margin:margin + cols] = matrix[y]
+        results = []
+        for _ in range(generations):
+            plane = GameOfLife().update_matrix(plane)
+            results.append([row[margin:margin + cols] for row in plane[margin:margin + rows]])
+        return results
+
+    @pytest.mark.parametrize("engine_name", sorted(GameOfLife.ENGINES))
+    @pytest.mark.parametrize("matrix, expected",
+        [([[0, 0, 0], [0, 0, 0], [0, 0, 0]], [[0, 0, 0], [0, 0, 0], [0, 0, 0]]),
+        ([[1, 1, 1], [1, 1, 1], [1, 1, 1]], [[1, 0, 1], [0, 0, 0], [1, 0, 1]]),
+        ([[0, 1, 1], [1, 0, 1], [0, 1, 0]], [[0, 1, 1], [1, 0, 1], [0, 1, 0]]),
+        ([[0, 1, 0], [1, 0, 1], [1, 0, 1], [0, 1, 0]], [[0, 1, 0], [1, 0, 1], [1, 0, 1], [0, 1, 0]])])
+    def test_step(self, engine_name : str, matrix : list[list[int]], expected : list[list[int]]) -> None:
+        """
+        Verify a generation of known matrices (the same cases of update_matrix, also on an unbounded plane).
+        """
+        engine = self.create_engine(engine_name, len(matrix), len(matrix[0]))
+        engine.load(matrix)
+        engine.step()
+        assert engine.to_matrix() == expected and engine.generation == 1
+
+    @pytest.mark.parametrize("engine_name", sorted(GameOfLife.ENGINES))
+    @pytest.mark.parametrize("rows, cols, seed", [(1, 1, 0), (5, 9, 1), (20, 13, 2), (32, 40, 3), (3, 130, 4)])
+    def test_matches_update_matrix(self, engine_name : str, rows : int, cols : int, seed : int) -> None:
+        """
+        Verify that the engine computes the same generations of update_matrix (dead cells outside the grid for the
+        bounded engines), one at a time and all at once, also with rows longer than 64 cells.
+        The live cells, the population and the changed cells are checked for the engines that have them.
+        """
+        generator = random.Random(seed)
+        matrix = [[int(generator.random() < 0.4) for _ in range(cols)] for _ in range(rows)]
+        expected = self.reference_generations(matrix, 30, engine_name in UNBOUNDED_ENGINES)
+        engine = self.create_engine(engine_name, rows, cols)
+        engine.load(matrix)
+        previous = matrix
+        for generation in expected:
+            engine.step()
+            assert engine.to_matrix() == generation
+            if hasattr(engine, "changed_cells"):
+                assert sorted(engine.changed_cells()) == [(y, x, generation[y][x]) for y in range(rows) for x in range(cols)
+                                                          if generation[y][x] != previous[y][x]]
+            previous = generation
+        assert sorted(engine.live_cells()) == [(y, x) for y in range(rows) for x in range(cols) if expected[-1][y][x]]
+        if hasattr(engine, "population") and engine_name not in UNBOUNDED_ENGINES:
+            assert engine.population() == sum(map(sum, expected[-1]))
+        engine.load(matrix)
+        engine.step(30)
+        assert engine.to_matrix() == expected[-1] and engine.generation == 30
@@ -0,0 +1,75 @@
+"""
+Module that contains the TestLifeHashLifeEngine class,
+which is used to test the specific behavior of the LifeHashLifeEngine class
+(the generations shared by all the engines are tested in test_life_engines).
+"""
+from gamehub.life_engines.life_hashlife_engine import LifeHashLifeEngine
+
+GOSPER_GLIDER_GUN = ["........................O...........",
+                     "......................O.O...........",
+                     "............OO......OO............OO",
+                     "...........O...O....OO............OO",
+                     "OO........O.....O...OO..............",
+                     "OO........O...O.OO....O.O...........",
+                     "..........O.....O.......O...........",
+                     "...........O...O....................",
+                     "............OO......................"]
+
+class TestLifeHashLifeEngine:
+    """
+    Class to test the LifeHashLifeEngine class.
+    """
+    def test_skip_ahead_glider_gun(self) -> None:
+        """
+        Verify that the glider gun can be advanced a million generations (a glider of 5 cells every 30 generations).
+        """
+        matrix = [[1 if cell == "O" else 0 for cell in row] for row in GOSPER_GLIDER_GUN]
+        engine = LifeHashLifeEngine(len(matrix), len(matrix[0]))
+        engine.load(matrix)
+        engine.step(10**6)
+        # The gun is periodic (period 30): the grid is the same of generation 10 (10^6 = 30 * 33333 + 10),
+        # with 33333 more gliders outside of it
+        reference = LifeHashLifeEngine(len(matrix), len(matrix[0]))
+        reference.load(matrix)
+        reference.step(10)
+        assert engine.generation == 10**6 and engine.population() == reference.population() + 5 * 33333
+        assert engine.to_matrix() == reference.to_matrix()
+
+    def test_bounded_cache(self) -> None:
+        """
+        Verify that the caches are collected when they grow over their size and that the results are still correct.
+        """
+        matrix = [[1 if cell == "O" else 0 for cell in row] for row in GOSPER_GLIDER_GUN]
+        engine = LifeHashLifeEngine(len(matrix), len(matrix[0]), max_nodes=200)
+        engine.load(matrix)
+        collections = 0
+        for _ in range(300):
+            size = len(engine.nodes)
+            engine.step()
+            collections += len(engine.nodes) < size
+        assert collections > 0
+        reference = LifeHashLifeEngine(len(matrix), len(matrix[0]))
+        reference.load(matrix)
+        reference.step(300)
+        assert engine.population() == reference.population() and engine.to_matrix() == reference.to_matrix()
+
+    def test_collect_garbage(self) -> None:
+        """
+        Verify that the collection keeps only the canonical nodes of the root and that the root is still shared.
+        """
+        matrix = [[1 if cell == "O" else 0 for cell in row] for row in GOSPER_GLIDER_GUN]
+        engine = LifeHashLifeEngine(len(matrix), len(matrix[0]))
+        engine.load(matrix)
+        engine.step(100)
+        population, cells = engine.population(), engine.to_matrix()
+        engine.collect_garbage()
+        assert engine.results == {}
+        subtrees, stack = set(), [engine.root]
+        while stack:
+            node = stack.pop()
+            if node.level > 0 and node not in subtrees:
+                subtrees.add(node)
+                stack.extend([node.nw, node.ne, node.sw, node.se])
+        assert subtrees == set(engine.nodes.values())
+        assert engine.join(engine.root.nw, engine.root.ne, engine.root.sw, engine.root.se) is engine.root
+        assert engine.population() == population and engine.to_matrix() == cells
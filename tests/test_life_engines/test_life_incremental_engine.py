@@ -0,0 +1,33 @@
+"""
+Module that contains the TestLifeIncrementalEngine class,
+which is used to test the specific behavior of the LifeIncrementalEngine class
+(the generations and the changed cells shared by all the engines are tested in test_life_engines).
+"""
+from gamehub.life_engines.life_incremental_engine import LifeIncrementalEngine
+
+class TestLifeIncrementalEngine:
+    """
+    Class to test the LifeIncrementalEngine class.
+    """
+    def test_still_life(self) -> None:
+        """
+        Verify that a block does not change and that no cell is evaluated again once nothing changes.
+        """
+        matrix = [[0, 0, 0, 0], [0, 1, 1, 0], [0, 1, 1, 0], [0, 0, 0, 0]]
+        engine = LifeIncrementalEngine(4, 4)
+        engine.load(matrix)
+        assert len(engine.changed_cells()) == 16
+        engine.step(3)
+        assert engine.to_matrix() == matrix and engine.changed_cells() == [] and engine.generation == 3
+
+    def test_double_buffer(self) -> None:
+        """
+        Verify that the two lists are reused in turn instead of allocating a new one every generation.
+        """
+        engine = LifeIncrementalEngine(3, 3)
+        engine.load([[0, 0, 0], [1, 1, 1], [0, 0, 0]])
+        grid, buffer = engine.grid, engine.buffer
+        engine.step()
+        assert engine.grid is buffer and engine.buffer is grid
+        assert engine.to_matrix() == [[0, 1, 0], [0, 1, 0], [0, 1, 0]]
+        assert sorted(engine.changed_cells()) == [(0, 1, 1), (1, 0, 0), (1, 2, 0), (2, 1, 1)]
@@ -0,0 +1,23 @@
+"""
+Module that contains the TestLifeNumpyEngine class,
+which is used to test the specific behavior of the LifeNumpyEngine class
+(the generations shared by all the engines are tested in test_life_engines).
+"""
+import pytest
+
+numpy = pytest.importorskip("numpy")
+from gamehub.life_engines.life_numpy_engine import LifeNumpyEngine
+
+class TestLifeNumpyEngine:
+    """
+    Class to test the LifeNumpyEngine class.
+    """
+    def test_step_many_generations(self) -> None:
+        """
+        Verify that a blinker is back in its initial state after an even number of generations.
+        """
+        matrix = [[0, 0, 0], [1, 1, 1], [0, 0, 0]]
+        engine = LifeNumpyEngine(3, 3)
+        engine.load(matrix)
+        engine.step(4)
+        assert engine.to_matrix() == matrix and engine.generation == 4
@@ -0,0 +1,44 @@
+"""
+Module that contains the TestLifeSparseEngine class,
+which is used to test the specific behavior of the LifeSparseEngine class
+(the generations shared by all the engines are tested in test_life_engines).
+"""
+import random
+import pytest
+from gamehub.life_engines.life_hashlife_engine import LifeHashLifeEngine
+from gamehub.life_engines.life_sparse_engine import LifeSparseEngine
+
+class TestLifeSparseEngine:
+    """
+    Class to test the LifeSparseEngine class.
+    """
+    @pytest.mark.parametrize("rows, cols, seed", [(5, 9, 1), (12, 20, 2)])
+    def test_unbounded_matches_hashlife(self, rows : int, cols : int, seed : int) -> None:
+        """
+        Verify that the unbounded engine computes the same generations of the HashLife engine (also unbounded).
+        """
+        generator = random.Random(seed)
+        matrix = [[int(generator.random() < 0.4) for _ in range(cols)] for _ in range(rows)]
+        engine = LifeSparseEngine(rows, cols, bounded=False)
+        reference = LifeHashLifeEngine(rows, cols)
+        engine.load(matrix)
+        reference.load(matrix)
+        for _ in range(20):
+            engine.step()
+            reference.step()
+            assert engine.to_matrix() == reference.to_matrix() and engine.population() == reference.population()
+
+    def test_unbounded_glider(self) -> None:
+        """
+        Verify that a glider leaves the grid and keeps moving on an unbounded plane, while on a bounded one it becomes a block in the corner.
+        """
+        glider = [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+        bounded, unbounded = LifeSparseEngine(3, 3), LifeSparseEngine(3, 3, bounded=False)
+        bounded.load(glider)
+        unbounded.load(glider)
+        bounded.step(40)
+        unbounded.step(40)
+        assert bounded.to_matrix() == [[0, 0, 0], [0, 1, 1], [0, 1, 1]]
+        # Every 4 generations the glider moves by one cell down and right
+        assert unbounded.cells == {(y + 10, x + 10) for y in range(3) for x in range(3) if glider[y][x]}
+        assert unbounded.live_cells() == [] and unbounded.to_matrix() == [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
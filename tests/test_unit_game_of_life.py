@@ -189,3 +189,87 @@ class TestGameOfLife:
         assert game_of_life.matrix == [[0, 1, 1, 0, 0],
                             [1, 0, 0, 1, 0],
                             [0, 0, 0, 0, 0]]
+
+    def test_invalid_engine(self) -> None:
+        """
+        Test that verifies that the constructor rejects an unknown engine.
+        """
+        with pytest.raises(ValueError):
+            GameOfLife(engine="unknown")
+        with pytest.raises(ValueError):
+            GameOfLife(generations=-1)
+        with pytest.raises(ValueError):
+            GameOfLife(engine="bitpacked", generations=GameOfLife.MAX_STEPPED_GENERATIONS + 1)
+        assert GameOfLife(engine="hashlife", generations=10**18).generations == 10**18
+        with pytest.raises(ValueError):
+            GameOfLife(max_nodes=0)
+
+    def test_create_engine_max_nodes(self) -> None:
+        """
+        Test that verifies that the hashlife engine is created with the limit of its caches.
+        """
+        assert GameOfLife(engine="hashlife", max_nodes=1234).create_engine(3, 5).max_nodes == 1234
+
+    @pytest.mark.parametrize("engine", ["numpy", "sparse", "bitpacked"])
+    def test_gameloop_engine(self, monkeypatch, engine : str) -> None:
+        """
+        Test that verifies that the gameloop with an engine computes the same generations of update_matrix.
+        The live cells drawn at every iteration are recorded.
+        """
+        if engine == "numpy":
+            pytest.importorskip("numpy")
+        inputs = iter(["a", "\x1b"])
+        drawn = []
+        monkeypatch.setattr(GameOfLife, "get_input_and_sleep", lambda self, *args: next(inputs))
+        monkeypatch.setattr(GameOfLife, "init_curses", lambda self, *args: (None, 3, 5))
+        monkeypatch.setattr(GameOfLife, "draw_cells", lambda self, stdscr, cells, color: drawn.append(sorted(cells)))
+        monkeypatch.setattr(GameOfLife, "initialize_matrix", lambda self, *args: [[0, 1, 0, 0, 1],
+                                                                                  [1, 1, 0, 1, 0],
+                                                                                  [1, 1, 1, 0, 0]])
+        game_of_life = GameOfLife(engine=engine)
+        game_of_life.gameloop(None)
+        assert game_of_life.matrix == [[0, 1, 1, 0, 0],
+                                       [1, 0, 0, 1, 0],
+                                       [0, 0, 0, 0, 0]]
+        assert drawn == [[(0, 1), (0, 4), (1, 0), (1, 1), (1, 3), (2, 0), (2, 1), (2, 2)],
+                         [(0, 0), (0, 1), (0, 2), (1, 3), (2, 0), (2, 2)]]
+
+    @pytest.mark.parametrize("engine", ["python", "hashlife", "sparse", "sparse-unbounded", "incremental", "bitpacked"])
+    def test_gameloop_generations(self, monkeypatch, engine : str) -> None:
+        """
+        Test that verifies that the generations are skipped before the first one is drawn.
+        The blinker in the middle of the grid is back in its initial state after an even number of generations.
+        """
+        blinker = [[0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 1, 1, 0], [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]]
+        monkeypatch.setattr(GameOfLife, "get_input_and_sleep", lambda self, *args: "\x1b")
+        monkeypatch.setattr(GameOfLife, "init_curses", lambda self, *args: (None, 5, 5))
+        monkeypatch.setattr(GameOfLife, "draw_board", lambda *args: None)
+        monkeypatch.setattr(GameOfLife, "draw_cells", lambda *args: None)
+        monkeypatch.setattr(GameOfLife, "initialize_matrix", lambda self, *args: [row.copy() for row in blinker])
+        game_of_life = GameOfLife(engine=engine, generations=1000)
+        game_of_life.gameloop(None)
+        # One more generation is computed after the first drawing
+        assert game_of_life.matrix == [[0, 0, 0, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [0, 0, 0, 0, 0]]
+
+    def test_gameloop_delta(self, monkeypatch) -> None:
+        """
+        Test that verifies that with the incremental engine the first generation is drawn whole
+        and the next ones only by the cells that changed.
+        """
+        inputs = iter(["a", "\x1b"])
+        drawn = []
+        changes = []
+        monkeypatch.setattr(GameOfLife, "get_input_and_sleep", lambda self, *args: next(inputs))
+        monkeypatch.setattr(GameOfLife, "init_curses", lambda self, *args: (None, 3, 5))
+        monkeypatch.setattr(GameOfLife, "draw_cells", lambda self, stdscr, cells, color: drawn.append(sorted(cells)))
+        monkeypatch.setattr(GameOfLife, "draw_changes", lambda self, stdscr, cells, color: changes.append(sorted(cells)))
+        monkeypatch.setattr(GameOfLife, "initialize_matrix", lambda self, *args: [[0, 1, 0, 0, 1],
+                                                                                  [1, 1, 0, 1, 0],
+                                                                                  [1, 1, 1, 0, 0]])
+        game_of_life = GameOfLife(engine="incremental")
+        game_of_life.gameloop(None)
+        assert game_of_life.matrix == [[0, 1, 1, 0, 0],
+                                       [1, 0, 0, 1, 0],
+                                       [0, 0, 0, 0, 0]]
+        assert drawn == [[(0, 1), (0, 4), (1, 0), (1, 1), (1, 3), (2, 0), (2, 1), (2, 2)]]
+        assert changes == [[(0, 0, 1), (0, 2, 1), (0, 4, 0), (1, 0, 0), (1, 1, 0), (2, 1, 0)]]
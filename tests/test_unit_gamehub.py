@@ -66,6 +66,30 @@ class TestGameHub:
                              "--density", "40"])
         g = GameHub()
         assert g.args.game == "game_of_life" and g.args.speed == 100 and g.args.mode == "Automatic" and g.args.density == 40
+        assert g.args.engine == "python"
+
+    def test_parse_arguments_game_of_life_engine(self, monkeypatch) -> None:
+        """
+        Test the parsing of the engine of the Game of Life.
+        """
+        monkeypatch.setattr("sys.argv", ["gamehub", "game_of_life", "--engine", "numpy"])
+        g = GameHub()
+        assert g.args.engine == "numpy" and g.args.generations == 0
+        monkeypatch.setattr("sys.argv", ["gamehub", "game_of_life", "--engine", "hashlife", "--generations", "1000000"])
+        g = GameHub()
+        assert g.args.engine == "hashlife" and g.args.generations == 1000000 and g.args.max_nodes == 500000
+        monkeypatch.setattr("sys.argv", ["gamehub", "game_of_life", "--engine", "hashlife", "--max-nodes", "20000"])
+        g = GameHub()
+        assert g.args.engine == "hashlife" and g.args.max_nodes == 20000
+        monkeypatch.setattr("sys.argv", ["gamehub", "game_of_life", "--engine", "sparse-unbounded"])
+        g = GameHub()
+        assert g.args.engine == "sparse-unbounded"
+        monkeypatch.setattr("sys.argv", ["gamehub", "game_of_life", "--engine", "incremental"])
+        g = GameHub()
+        assert g.args.engine == "incremental"
+        monkeypatch.setattr("sys.argv", ["gamehub", "game_of_life", "--engine", "bitpacked"])
+        g = GameHub()
+        assert g.args.engine == "bitpacked"
 
     def test_parse_arguments_word_guesser(self, monkeypatch) -> None:
         """
@@ -82,3 +106,40 @@ class TestGameHub:
         monkeypatch.setattr("sys.argv", ["gamehub", "chess", "--mode", "Singleplayer"])
         g = GameHub()
         assert g.args.game == "chess" and g.args.mode == "Singleplayer"
+
+    def test_parse_arguments_chess_engine(self, monkeypatch) -> None:
+        """
+        Test the parsing of the engine used by Chess in Singleplayer mode.
+        """
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess", "--mode", "Singleplayer", "--engine", "Builtin"])
+        g = GameHub()
+        assert g.args.engine == "Builtin"
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess"])
+        assert GameHub().args.engine == "Stockfish" and GameHub().args.workers == 1 and GameHub().args.pool_size == 2
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess", "--mode", "Singleplayer", "--engine", "Builtin", "--workers", "4"])
+        assert GameHub().args.workers == 4
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess", "--mode", "Singleplayer", "--pool-size", "4"])
+        assert GameHub().args.pool_size == 4
+
+    def test_parse_arguments_chess_limits(self, monkeypatch) -> None:
+        """
+        Test the parsing of the search limits of the chess engine.
+        """
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess", "--mode", "Singleplayer", "--movetime", "500",
+                                         "--nodes", "20000", "--wtime", "60000", "--btime", "30000", "--winc", "1000"])
+        g = GameHub()
+        assert g.args.movetime == 500 and g.args.nodes == 20000 and g.args.depth is None
+        assert g.args.wtime == 60000 and g.args.btime == 30000 and g.args.winc == 1000 and g.args.binc == 0
+        limits = g.create_search_limits()
+        assert limits.to_go_command() == "go wtime 60000 btime 30000 winc 1000 binc 0 movetime 500 nodes 20000\n"
+
+    def test_parse_arguments_chess_analysis(self, monkeypatch) -> None:
+        """
+        Test the parsing of the command line arguments for the chess analysis.
+        """
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess_analysis", "positions.epd", "--workers", "4", "--engine", "Builtin", "--depth", "3"])
+        g = GameHub()
+        assert g.args.game == "chess_analysis" and g.args.input == "positions.epd" and g.args.output == "-"
+        assert g.args.workers == 4 and g.args.engine == "Builtin" and g.args.depth == 3 and g.args.chunk_size == 256
+        monkeypatch.setattr("sys.argv", ["gamehub", "chess_analysis", "-"])
+        assert GameHub().args.engine is None